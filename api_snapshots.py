@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+Versioned snapshots of the aspose.pydrawing API surface.
+
+A snapshot is the drift_check.py runtime snapshot, {module: {class:
+{member: kind}}}, plus the crash-denylisted members, saved as compact
+sorted JSON in a local store keyed by aspose-slides version:
+
+    ~/.cache/aspose-stubs/snapshots/aspose.pydrawing/24.6.0.json
+
+drift_check.py saves one for the installed version, as do
+stub_pipeline.py and generate_pydrawing_stubs.py with --snapshot, so
+reviewing an upgrade only needs the two stored snapshots, not two live
+environments.
+Modules and classes that could not be introspected are left out of a
+snapshot and listed under "failed", so a diff does not report them as
+removed.
+A snapshot also holds enough to regenerate detailed stubs without
+importing aspose or touching .NET.
+
+Usage:
+    python api_snapshots.py save
+    python api_snapshots.py list
+    python api_snapshots.py diff 24.5.0 24.6.0
+    python api_snapshots.py diff 24.5.0 path/to/other.json --json changes.json
+    python api_snapshots.py seed 24.6.0
+    python api_snapshots.py seed 24.6.0 --docs
+"""
+import argparse
+import json
+import re
+import sys
+from pathlib import Path
+from typing import Dict, Optional
+
+import enhance_stubs
+import rectangle_stubs
+from crash_quarantine import CrashDenylist
+from docs_xref import DocsXref, apply_docs_xref
+from drift_check import LISTING_KINDS, ROOT_MODULE, diff_snapshots, print_diff, runtime_snapshot, sorted_snapshot
+from introspect_cache import DEFAULT_CACHE_DIR, IntrospectionCache, aspose_slides_fingerprint
+from stub_fingerprint import stub_fingerprint
+from stub_io import write_if_changed, write_text_atomic
+from stub_manifest import write_manifest
+from stub_symbols import write_symbol_table
+from stub_model import StubModule, emit_module, namespace_stub_path
+
+DEFAULT_STORE_DIR = DEFAULT_CACHE_DIR / "snapshots"
+STUB_ROOT = Path(__file__).parent / "generated_stubs"
+
+SNAPSHOT_FORMAT = 1
+
+
+def _version_key(version: str) -> tuple:
+    """Sort key ordering 24.10.0 after 24.9.0."""
+    return tuple((0, int(part)) if part.isdigit() else (1, part) for part in re.split(r"[.+-]", version))
+
+
+class SnapshotStore:
+    """One JSON file per aspose-slides version, per root module."""
+
+    def __init__(self, directory: Path = DEFAULT_STORE_DIR, root: str = ROOT_MODULE):
+        self.directory = Path(directory) / root
+        self.root = root
+
+    def path(self, version: str) -> Path:
+        return self.directory / f"{version}.json"
+
+    def versions(self) -> list:
+        if not self.directory.exists():
+            return []
+        return sorted((path.stem for path in self.directory.glob("*.json")), key=_version_key)
+
+    def save(self, document: dict) -> bool:
+        """Store a snapshot document; returns False if the stored one was identical."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        return write_if_changed(self.path(document["version"]), dump_snapshot(document))
+
+    def load(self, version: str) -> dict:
+        """A stored snapshot by version, or any snapshot file by path."""
+        path = self.path(version)
+        if not path.exists() and version.endswith(".json"):
+            path = Path(version).expanduser()
+        if not path.exists():
+            raise FileNotFoundError(f"No snapshot of {self.root} for {version} in {self.directory}")
+        document = json.loads(path.read_text())
+        if document.get("format") != SNAPSHOT_FORMAT:
+            raise ValueError(f"{path} is not a format {SNAPSHOT_FORMAT} snapshot")
+        # Any file can be loaded, including hand-edited ones whose keys are out of order
+        document["modules"] = sorted_snapshot(document["modules"])
+        return document
+
+
+def dump_snapshot(document: dict) -> str:
+    """Compact JSON with every key sorted, so diff_snapshots() can merge in one pass."""
+    return json.dumps(document, sort_keys=True, separators=(",", ":")) + "\n"
+
+
+def snapshot_document(
+    modules: dict, version: str, root: str = ROOT_MODULE, denylist=None, failed: Optional[dict] = None
+) -> dict:
+    """
+    Wrap a runtime snapshot with its version, the denylisted members under
+    root and the modules and classes it leaves out because they failed.
+    """
+    denylisted = {}
+    if denylist is not None:
+        denylisted = {key: names for key, names in denylist.items() if key.startswith(f"{root}.")}
+    return {
+        "format": SNAPSHOT_FORMAT,
+        "version": version,
+        "root": root,
+        "denylist": denylisted,
+        "failed": failed or {},
+        "modules": modules,
+    }
+
+
+def record_snapshot(
+    root: str = ROOT_MODULE,
+    cache=None,
+    denylist=None,
+    modules: Optional[dict] = None,
+    store: Optional[SnapshotStore] = None,
+    version: Optional[str] = None,
+    jobs: int = 1,
+    failed: Optional[dict] = None
+) -> Optional[Path]:
+    """
+    Save the snapshot of the installed version, introspecting in jobs
+    workers unless modules is already a runtime snapshot (whose failed
+    modules and classes are then given too). Returns its path, or None if
+    the aspose-slides version is unknown or root cannot be imported.
+    """
+    version = version or aspose_slides_fingerprint()["version"]
+    if not version:
+        print("Snapshot: skipped, aspose-slides is not installed")
+        return None
+    if denylist is None:
+        denylist = CrashDenylist()
+    if modules is None:
+        try:
+            modules, failed = runtime_snapshot(root, cache, denylist, jobs)
+        except RuntimeError as e:
+            print(f"Snapshot: skipped, {e}")
+            return None
+    store = store or SnapshotStore(root=root)
+    changed = store.save(snapshot_document(modules, version, root, denylist, failed))
+    print(f"Snapshot: {store.path(version)} ({'saved' if changed else 'unchanged'})")
+    if failed:
+        print(f"Snapshot: {len(failed)} modules or classes could not be introspected and were left out")
+    return store.path(version)
+
+
+def member_listing(members: dict) -> dict:
+    """The list_members() shape of a snapshot class, as enhance_stubs expects it."""
+    listing = {key: [] for key in LISTING_KINDS}
+    keys = {kind: key for key, kind in LISTING_KINDS.items()}
+    for name, kind in members.items():
+        listing[keys[kind]].append(name)
+    return listing
+
+
+def seed_modules(document: dict) -> Dict[str, StubModule]:
+    """Detailed module models built from a snapshot alone."""
+    module_names = list(document["modules"])
+    modules = {}
+    for module_name, classes in document["modules"].items():
+        prefix = f"{module_name}."
+        submodules = [
+            name[len(prefix):] for name in module_names
+            if name.startswith(prefix) and "." not in name[len(prefix):]
+        ]
+        module = StubModule(module_name, submodules=submodules)
+        for class_name, members in classes.items():
+            module.add_class(enhance_stubs.detailed_class(class_name, member_listing(members)))
+        modules[module_name] = module
+    if "aspose.pydrawing" in modules:
+        rectangle_stubs.apply_rectangle_stubs(modules["aspose.pydrawing"])
+    return modules
+
+
+def write_seeded_stubs(document: dict, output_root: Path = STUB_ROOT, docs: DocsXref = None) -> list:
+    """
+    Write stubs regenerated from a snapshot under output_root, joining the
+    docs cross-reference docs if given; returns the written paths.
+    """
+    written = []
+    modules = seed_modules(document)
+    if docs is not None:
+        for module in modules.values():
+            apply_docs_xref(module, docs)
+    # Same inputs as a live run of that version, except the unknown wheel hash
+    fingerprint = stub_fingerprint(
+        document["denylist"], {"version": document["version"], "wheel_hash": None},
+        docs.digest if docs is not None else None
+    )
+    for module_name, module in modules.items():
+        path = namespace_stub_path(output_root, module_name)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        stub = emit_module(module, fingerprint)
+        if write_if_changed(path, stub):
+            written.append(path)
+            print(f"Written: {path.relative_to(output_root)} ({len(stub.splitlines())} lines)")
+        else:
+            print(f"Unchanged: {path.relative_to(output_root)}")
+    stub_dir = output_root / Path(*document["root"].split("."))
+    write_manifest(stub_dir)
+    write_symbol_table(stub_dir, document["root"])
+    return written
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Save, list, diff and regenerate from versioned API snapshots.")
+    parser.add_argument(
+        "--store",
+        default=str(DEFAULT_STORE_DIR),
+        help=f"Snapshot store directory (default: {DEFAULT_STORE_DIR})"
+    )
+    parser.add_argument(
+        "--module",
+        default=ROOT_MODULE,
+        help=f"Root module of the snapshots (default: {ROOT_MODULE})"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    save = commands.add_parser("save", help="Introspect the installed aspose-slides and store its snapshot")
+    save.add_argument(
+        "--version",
+        help="Store under this version (default: the installed aspose-slides version)"
+    )
+    save.add_argument(
+        "--cache-dir",
+        default=str(DEFAULT_CACHE_DIR),
+        help=f"Introspection cache directory (default: {DEFAULT_CACHE_DIR})"
+    )
+    save.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always introspect, ignoring and not updating the cache"
+    )
+
+    commands.add_parser("list", help="List stored versions")
+
+    diff = commands.add_parser("diff", help="Report API changes between two snapshots")
+    diff.add_argument("old", help="Version or snapshot .json path")
+    diff.add_argument("new", help="Version or snapshot .json path")
+    diff.add_argument(
+        "--json",
+        metavar="PATH",
+        help="Also write the changes as JSON"
+    )
+
+    seed = commands.add_parser("seed", help="Regenerate stubs from a snapshot without importing aspose")
+    seed.add_argument("version", help="Version or snapshot .json path")
+    seed.add_argument(
+        "--output-root",
+        default=str(STUB_ROOT),
+        help=f"Root directory for the generated stubs (default: {STUB_ROOT.name}/)"
+    )
+    seed.add_argument(
+        "--docs",
+        action="store_true",
+        help="Join links to the docs pages into the docstrings (needs python docs_refresh.py first)"
+    )
+    args = parser.parse_args()
+
+    store = SnapshotStore(Path(args.store).expanduser(), args.module)
+    try:
+        if args.command == "save":
+            cache = None if args.no_cache else IntrospectionCache(Path(args.cache_dir))
+            if record_snapshot(args.module, cache, store=store, version=args.version) is None:
+                sys.exit(1)
+        elif args.command == "list":
+            for version in store.versions():
+                document = store.load(version)
+                classes = sum(len(classes) for classes in document["modules"].values())
+                print(f"{version:<16} {len(document['modules'])} modules, {classes} classes")
+        elif args.command == "diff":
+            old = store.load(args.old)
+            new = store.load(args.new)
+            # Snapshots saved before "failed" was recorded have none
+            failed = {**old.get("failed", {}), **new.get("failed", {})}
+            changes = diff_snapshots(old["modules"], new["modules"], failed=failed)
+            print(f"API changes in {args.module} from {old['version']} to {new['version']}:")
+            print_diff(changes, old["version"], new["version"])
+            if args.json:
+                write_text_atomic(Path(args.json), json.dumps(changes, indent=2) + "\n")
+        elif args.command == "seed":
+            document = store.load(args.version)
+            docs = DocsXref() if args.docs else None
+            if docs is not None and not docs.exists():
+                raise FileNotFoundError(f"{docs.path} not found (run: python docs_refresh.py)")
+            write_seeded_stubs(document, Path(args.output_root), docs)
+            print(f"\nStubs regenerated from the {document['version']} snapshot")
+    except (FileNotFoundError, ValueError, RuntimeError) as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        sys.exit(2)
+
+
+if __name__ == "__main__":
+    main()
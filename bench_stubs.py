@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+Benchmark the stub generators against a synthetic stand-in module.
+
+Builds a plain-Python module shaped like the .NET-backed aspose packages
+(thousands of classes, wide enums, deep inheritance chains, members that
+raise on access) so generate_module_stub, generate_class_stub,
+generate_enum_stub and the stub model emitter can be timed offline, without
+aspose-slides installed.
+
+Each benchmark reports the best wall time over several repeats, throughput
+in classes per second and peak traced memory. Results can be saved as a
+baseline and later runs compared against it; a benchmark more than
+--tolerance slower than its baseline is flagged and the exit status is 1.
+Both numbers depend on the module's size, so a baseline is only compared
+with runs of the same --classes and --seed.
+
+Usage:
+    python bench_stubs.py
+    python bench_stubs.py --classes 5000 --repeat 5
+    python bench_stubs.py --classes 5000 --seed 7 --save-baseline
+    python bench_stubs.py --save-baseline
+    python bench_stubs.py --json bench.json
+"""
+import argparse
+import gc
+import json
+import random
+import sys
+import time
+import tracemalloc
+import types
+from pathlib import Path
+
+import generate_pydrawing_stubs as gen
+from enhance_stubs import detailed_class
+from stub_io import write_text_atomic
+from stub_model import StubModule, emit_module
+
+DEFAULT_BASELINE = Path(__file__).parent / "bench_baseline.json"
+
+
+class _Raising:
+    """Descriptor that fails on class-level access, like a broken .NET property."""
+
+    def __get__(self, obj, owner=None):
+        raise RuntimeError("marshaling failed")
+
+
+def _plain_class(name: str, rng: random.Random, members: int, module_name: str, bases=(object,)) -> type:
+    ns = {"__module__": module_name, "__doc__": f"Synthetic {name}"}
+    for i in range(members):
+        roll = rng.random()
+        member = f"member_{i}"
+        if roll < 0.45:
+            ns[member] = lambda self, a, b=1: None
+        elif roll < 0.6:
+            ns[member] = staticmethod(lambda a: None)
+        elif roll < 0.9:
+            ns[member] = property(lambda self: 0)
+        elif roll < 0.95:
+            ns[member] = i
+        else:
+            ns[member] = _Raising()
+    cls = type(name, bases, ns)
+    # A few named instances, like Color.red
+    if rng.random() < 0.1:
+        for i in range(5):
+            setattr(cls, f"named_{i}", cls.__new__(cls))
+    return cls
+
+
+def _enum_class(name: str, width: int, module_name: str) -> type:
+    ns = {"__module__": module_name}
+    for i in range(width):
+        ns[f"VALUE_{i}"] = i
+    return type(name, (object,), ns)
+
+
+def build_synthetic_module(classes: int = 2000, seed: int = 0) -> types.ModuleType:
+    """
+    A module with the given number of classes:
+    ~70% ordinary classes, ~20% enums (some wider than 50 values),
+    ~10% deep inheritance chains, plus a handful of functions and constants.
+    """
+    rng = random.Random(seed)
+    module_name = "bench.synthetic"
+    module = types.ModuleType(module_name)
+
+    chain_base = object
+    for i in range(classes):
+        roll = rng.random()
+        name = f"Class{i:05d}"
+        if roll < 0.2:
+            cls = _enum_class(name, rng.choice([8, 24, 40, 200]), module_name)
+        elif roll < 0.3:
+            # Deep inheritance: each chain class derives from the previous one
+            cls = _plain_class(name, rng, rng.randint(2, 10), module_name, bases=(chain_base,))
+            chain_base = cls
+        else:
+            cls = _plain_class(name, rng, rng.randint(5, 60), module_name)
+        setattr(module, name, cls)
+
+    for i in range(20):
+        setattr(module, f"function_{i}", lambda x, y=0: x)
+        setattr(module, f"CONSTANT_{i}", i)
+    return module
+
+
+def synthetic_listings(module: types.ModuleType) -> list:
+    """(class_name, members) pairs in the shape enhance_stubs receives from workers."""
+    listings = []
+    for name in sorted(vars(module)):
+        cls = getattr(module, name)
+        if not isinstance(cls, type):
+            continue
+        members = {"methods": [], "properties": [], "classvars": []}
+        for member in dir(cls):
+            if member.startswith("_"):
+                continue
+            value = cls.__dict__.get(member)
+            if isinstance(value, (staticmethod, types.FunctionType)):
+                members["methods"].append(member)
+            elif isinstance(value, cls):
+                members["classvars"].append(member)
+            else:
+                members["properties"].append(member)
+        listings.append((name, members))
+    return listings
+
+
+def _measure(func, repeat: int) -> dict:
+    """Best wall time over repeat runs, then peak traced memory of one more run."""
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"seconds": best, "peak_kib": peak / 1024}
+
+
+def run_benchmarks(classes: int, repeat: int, seed: int = 0) -> dict:
+    module = build_synthetic_module(classes, seed)
+    all_classes = [(name, obj) for name, obj in sorted(vars(module).items()) if isinstance(obj, type)]
+    enums = [cls for _, cls in all_classes if any(m.startswith("VALUE_") for m in vars(cls))]
+    plain = [cls for _, cls in all_classes if cls not in enums]
+    deep = [cls for cls in plain if len(cls.__mro__) > 10]
+    listings = synthetic_listings(module)
+
+    def emit_model():
+        stub_module = StubModule("bench.synthetic")
+        for name, members in listings:
+            stub_module.add_class(detailed_class(name, members))
+        emit_module(stub_module)
+
+    benchmarks = {
+        "generate_module_stub": (lambda: gen.generate_module_stub(module, "bench.synthetic"), len(all_classes)),
+        "generate_class_stub": (lambda: [gen.generate_class_stub(cls) for cls in plain], len(plain)),
+        "generate_class_stub_deep": (lambda: [gen.generate_class_stub(cls) for cls in deep], len(deep)),
+        "generate_enum_stub": (lambda: [gen.generate_enum_stub(cls) for cls in enums], len(enums)),
+        "emit_model": (emit_model, len(listings)),
+    }
+
+    results = {}
+    for name, (func, count) in benchmarks.items():
+        if not count:
+            continue
+        result = _measure(func, repeat)
+        result["classes"] = count
+        result["classes_per_second"] = count / result["seconds"] if result["seconds"] else float("inf")
+        results[name] = result
+    return results
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list:
+    """Names of benchmarks whose throughput dropped by more than tolerance."""
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        if result["classes_per_second"] < base["classes_per_second"] * (1 - tolerance):
+            regressions.append(name)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the stub generators on a synthetic module.")
+    parser.add_argument(
+        "--classes",
+        type=int,
+        default=2000,
+        help="Number of synthetic classes (default: 2000)"
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="Seed of the synthetic module (default: 0)"
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="Timed runs per benchmark; the best is reported (default: 3)"
+    )
+    parser.add_argument(
+        "--baseline",
+        default=str(DEFAULT_BASELINE),
+        help=f"Baseline file (default: {DEFAULT_BASELINE.name})"
+    )
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="Store these results as the new baseline"
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="Allowed throughput drop before flagging a regression (default: 0.25)"
+    )
+    parser.add_argument(
+        "--json",
+        metavar="PATH",
+        help="Also write the results as JSON"
+    )
+    args = parser.parse_args()
+
+    print(f"Building synthetic module with {args.classes} classes...")
+    results = run_benchmarks(args.classes, args.repeat, args.seed)
+
+    baseline_path = Path(args.baseline)
+    baseline = {}
+    if baseline_path.exists() and not args.save_baseline:
+        saved = json.loads(baseline_path.read_text())
+        # Baselines from before --seed existed were all built with seed 0
+        shape = (saved["classes"], saved.get("seed", 0))
+        if shape == (args.classes, args.seed):
+            baseline = saved["results"]
+        else:
+            print(
+                f"NOTE: not comparing with {baseline_path.name}, "
+                f"it was run with --classes {shape[0]} --seed {shape[1]}"
+            )
+    regressions = compare(results, baseline, args.tolerance)
+
+    print()
+    print(f"  {'benchmark':<26} {'seconds':>9} {'classes/s':>11} {'peak KiB':>10}  baseline")
+    for name, result in results.items():
+        base = baseline.get(name)
+        delta = ""
+        if base:
+            change = result["classes_per_second"] / base["classes_per_second"] - 1
+            delta = f"{change:+.0%}" + ("  REGRESSION" if name in regressions else "")
+        print(
+            f"  {name:<26} {result['seconds']:>9.4f} {result['classes_per_second']:>11.0f} "
+            f"{result['peak_kib']:>10.0f}  {delta}"
+        )
+
+    report = {"classes": args.classes, "seed": args.seed, "python": sys.version.split()[0], "results": results}
+    if args.json:
+        write_text_atomic(Path(args.json), json.dumps(report, indent=2) + "\n")
+    if args.save_baseline:
+        write_text_atomic(baseline_path, json.dumps(report, indent=2) + "\n")
+        print(f"\nBaseline saved: {baseline_path}")
+
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond {args.tolerance:.0%}: {', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Package the generated pydrawing stubs as a PEP 561 stub-only wheel.
+
+The wheel "aspose-pydrawing-stubs" installs the stubs as
+aspose-stubs/pydrawing, marked partial in aspose-stubs/py.typed so type
+checkers still use the runtime package for the rest of aspose. pip can then
+install, upgrade and uninstall the stubs like any other package, without
+touching the files aspose-slides ships.
+
+The build is deterministic: entries are sorted and carry fixed timestamps and
+permissions, so the same stubs and version always produce the same bytes.
+
+Usage:
+    # Version defaults to the installed aspose-slides version
+    python build_stub_wheel.py
+    python build_stub_wheel.py --version 24.6.0 --out-dir ~/wheelhouse
+
+    pip install --find-links dist aspose-pydrawing-stubs
+"""
+import argparse
+import base64
+import hashlib
+import io
+import re
+import sys
+import zipfile
+from pathlib import Path
+
+from introspect_cache import aspose_slides_fingerprint
+from stub_io import write_bytes_atomic
+
+DIST_NAME = "aspose-pydrawing-stubs"
+STUB_SOURCE = Path(__file__).parent / "generated_stubs" / "aspose" / "pydrawing"
+STUB_PACKAGE = "aspose-stubs"
+DEFAULT_OUT_DIR = Path(__file__).parent / "dist"
+
+# Earliest timestamp a zip entry can hold
+ZIP_EPOCH = (1980, 1, 1, 0, 0, 0)
+
+VERSION_RE = re.compile(r"^[0-9]+(\.[0-9]+)*([.-]?(a|b|rc|post|dev)[0-9]*)*(\+[a-z0-9.]+)?$", re.IGNORECASE)
+
+
+def wheel_stem(version: str) -> str:
+    """Name and version as they appear in wheel and .dist-info names."""
+    return f"{DIST_NAME.replace('-', '_')}-{version.replace('-', '_')}"
+
+
+def dist_info_dir(version: str) -> str:
+    return f"{wheel_stem(version)}.dist-info"
+
+
+def wheel_files(stub_dir: Path, version: str) -> dict:
+    """{archive path: bytes} for everything in the wheel except RECORD."""
+    files = {f"{STUB_PACKAGE}/py.typed": b"partial\n"}
+    for path in sorted(stub_dir.rglob("*.pyi")):
+        files[f"{STUB_PACKAGE}/pydrawing/{path.relative_to(stub_dir).as_posix()}"] = path.read_bytes()
+
+    dist_info = dist_info_dir(version)
+    files[f"{dist_info}/METADATA"] = (
+        "Metadata-Version: 2.1\n"
+        f"Name: {DIST_NAME}\n"
+        f"Version: {version}\n"
+        "Summary: Type stubs for aspose.pydrawing from aspose-slides, generated by runtime introspection\n"
+        "Classifier: Typing :: Stubs Only\n"
+    ).encode()
+    files[f"{dist_info}/WHEEL"] = (
+        "Wheel-Version: 1.0\n"
+        "Generator: build_stub_wheel\n"
+        "Root-Is-Purelib: true\n"
+        "Tag: py3-none-any\n"
+    ).encode()
+    return files
+
+
+def record_line(name: str, data: bytes) -> str:
+    digest = base64.urlsafe_b64encode(hashlib.sha256(data).digest()).rstrip(b"=").decode()
+    return f"{name},sha256={digest},{len(data)}"
+
+
+def build_wheel(version: str, out_dir: Path = DEFAULT_OUT_DIR, stub_dir: Path = STUB_SOURCE) -> Path:
+    """Build the wheel into out_dir and return its path."""
+    if not VERSION_RE.match(version):
+        raise ValueError(f"Not a valid version: {version}")
+
+    files = wheel_files(stub_dir, version)
+    dist_info = dist_info_dir(version)
+    record = "\n".join(record_line(name, data) for name, data in files.items())
+    files[f"{dist_info}/RECORD"] = f"{record}\n{dist_info}/RECORD,,\n".encode()
+
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as wheel:
+        for name, data in files.items():
+            info = zipfile.ZipInfo(name, date_time=ZIP_EPOCH)
+            info.external_attr = 0o644 << 16
+            info.compress_type = zipfile.ZIP_DEFLATED
+            wheel.writestr(info, data)
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    path = out_dir / f"{wheel_stem(version)}-py3-none-any.whl"
+    write_bytes_atomic(path, buffer.getvalue())
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build a PEP 561 stub-only wheel from generated_stubs.")
+    parser.add_argument(
+        "--version",
+        help="Wheel version (default: the installed aspose-slides version)"
+    )
+    parser.add_argument(
+        "--out-dir",
+        default=str(DEFAULT_OUT_DIR),
+        help=f"Directory to write the wheel to (default: {DEFAULT_OUT_DIR.name}/)"
+    )
+    args = parser.parse_args()
+
+    version = args.version or aspose_slides_fingerprint()["version"]
+    if not version:
+        print("ERROR: aspose-slides is not installed; pass --version", file=sys.stderr)
+        sys.exit(1)
+    if not STUB_SOURCE.exists():
+        print(f"ERROR: Generated stubs not found at {STUB_SOURCE}\nRun: python stub_pipeline.py", file=sys.stderr)
+        sys.exit(1)
+
+    try:
+        path = build_wheel(version, Path(args.out_dir).expanduser())
+    except ValueError as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        sys.exit(1)
+    print(f"Built: {path}")
+    print(f"Install with: pip install --find-links {path.parent} {DIST_NAME}=={version}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Find and remember class members that crash the .NET wrapper.
+
+Some members (e.g. Rectangle.inflate) take the whole interpreter down when
+accessed. When a class request kills its worker, the introspection pool
+bisects the class's members with one probe per step, each in a worker that
+is respawned if the probe crashes it. The culprits are recorded in
+crash_denylist.json; later runs pass them as "skip" with every request for
+that class, so a known-bad member never costs another crash.
+
+Usage:
+    # Probe every known pydrawing class and update the denylist
+    python crash_quarantine.py
+
+    # Probe specific classes
+    python crash_quarantine.py --module aspose.pydrawing Rectangle RectangleF
+
+    # Show the denylist
+    python crash_quarantine.py --list
+"""
+import argparse
+import json
+import threading
+from pathlib import Path
+
+from stub_io import write_text_atomic
+
+DEFAULT_DENYLIST_PATH = Path(__file__).parent / "crash_denylist.json"
+
+
+class CrashDenylist:
+    """Persisted {"module.Class": [member, ...]} map of members known to crash."""
+
+    def __init__(self, path: Path = DEFAULT_DENYLIST_PATH):
+        self.path = Path(path)
+        self._entries = {}
+        self._lock = threading.Lock()
+        self._changed = False
+        if self.path.exists():
+            self._entries = {key: set(names) for key, names in json.loads(self.path.read_text()).items()}
+
+    def members(self, module_name: str, class_name: str) -> list:
+        """Denylisted members of a class, sorted."""
+        with self._lock:
+            return sorted(self._entries.get(f"{module_name}.{class_name}", ()))
+
+    def add(self, module_name: str, class_name: str, names: list):
+        with self._lock:
+            entry = self._entries.setdefault(f"{module_name}.{class_name}", set())
+            if not entry.issuperset(names):
+                entry.update(names)
+                self._changed = True
+
+    def items(self) -> list:
+        with self._lock:
+            return [(key, sorted(names)) for key, names in sorted(self._entries.items())]
+
+    def save(self):
+        """Write the denylist if anything was added since it was loaded."""
+        if not self._changed:
+            return
+        data = dict(self.items())
+        write_text_atomic(self.path, json.dumps(data, indent=2, sort_keys=True) + "\n")
+        self._changed = False
+
+
+def find_crashing_members(probe, names: list) -> list:
+    """
+    Bisect names, whose access together has just crashed, down to the members at fault.
+
+    probe(subset) returns True if accessing every member of subset survived.
+    The whole set is not probed again: bisection starts at its two halves,
+    so a single bad member among n costs about log2(n) probes. Returns []
+    if no member crashes on its own.
+    """
+    if len(names) < 2:
+        # Nothing to bisect; only a probe can tell the member from the class
+        return [] if not names or probe(names) else list(names)
+    return _bisect(probe, names)
+
+
+def _bisect(probe, names: list) -> list:
+    """The crashing members of names, which are known to crash together."""
+    if len(names) == 1:
+        return list(names)
+    middle = len(names) // 2
+    bad = []
+    for half in (names[:middle], names[middle:]):
+        if not probe(half):
+            bad.extend(_bisect(probe, half))
+    return bad
+
+
+def main():
+    from generate_pydrawing_stubs_v2 import PYDRAWING_CLASSES, SUBMODULE_CLASSES
+    from introspect_pool import IntrospectionPool
+
+    parser = argparse.ArgumentParser(description="Probe classes for members that crash the .NET wrapper.")
+    parser.add_argument(
+        "classes",
+        nargs="*",
+        help="Classes to probe (default: every known pydrawing class)"
+    )
+    parser.add_argument(
+        "--module",
+        default="aspose.pydrawing",
+        help="Module the given classes live in (default: aspose.pydrawing)"
+    )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=1,
+        help="Number of probing worker processes (default: 1)"
+    )
+    parser.add_argument(
+        "--list",
+        action="store_true",
+        help="Print the denylist and exit"
+    )
+    args = parser.parse_args()
+
+    denylist = CrashDenylist()
+    if args.list:
+        for key, names in denylist.items():
+            print(f"{key}: {', '.join(names)}")
+        return
+
+    if args.classes:
+        targets = [(args.module, name) for name in args.classes]
+    else:
+        targets = [("aspose.pydrawing", name) for name in PYDRAWING_CLASSES]
+        for sub_name, class_names in SUBMODULE_CLASSES.items():
+            targets.extend((f"aspose.pydrawing.{sub_name}", name) for name in class_names)
+
+    before = dict(denylist.items())
+    with IntrospectionPool(workers=args.jobs, denylist=denylist) as pool:
+        pool.map([{"op": "probe_class", "module": module, "class": name} for module, name in targets])
+
+    for key, names in denylist.items():
+        new = sorted(set(names) - set(before.get(key, [])))
+        if new:
+            print(f"  QUARANTINED: {key}: {', '.join(new)}")
+    print(f"Denylist: {denylist.path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Streaming extraction of the kept slice of the Aspose.Slides docs archive.
+
+The documentation zip holds every language and framework, but only
+en/<framework> for the kept frameworks, en/_index.md and LICENSE are used.
+Unzipping the whole archive and copying the slice costs time and disk in
+proportion to the archive. This reads the central directory, selects the
+wanted members, and decompresses only those straight into the output
+directory, skipping pruned subtrees such as api-reference.
+
+Members are split into batches of similar size that are extracted
+concurrently, each batch through its own handle on the archive; zlib
+releases the GIL while inflating, so threads overlap well. Several
+frameworks are therefore extracted at the same time.
+
+Usage:
+    python docs_extract.py Aspose.Slides-Documentation.zip docs --framework python-net
+    python docs_extract.py archive.zip docs --framework python-net --framework net --jobs 8
+"""
+import argparse
+import os
+import shutil
+import sys
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path, PurePosixPath
+from typing import Dict, List, Optional
+
+DEFAULT_FRAMEWORKS = ["python-net"]
+# Subtrees of each framework that are not worth keeping
+DEFAULT_PRUNE = ["api-reference"]  # just links to external docs
+ROOT_FILES = ["en/_index.md", "LICENSE"]
+
+
+def archive_root(names: List[str]) -> str:
+    """The top-level folder the docs live in (e.g. "Aspose.Slides-Documentation-master/"), or ""."""
+    for name in names:
+        top = name.split("/", 1)[0]
+        if top.startswith("Aspose") and "/" in name:
+            return f"{top}/"
+    return ""
+
+
+def select_members(
+    archive: zipfile.ZipFile,
+    frameworks: List[str],
+    prune: List[str] = DEFAULT_PRUNE
+) -> Dict[str, List[zipfile.ZipInfo]]:
+    """
+    {group: [member]} of the members to extract, where group is a framework
+    or "root" for the root files. Member names are left as in the archive.
+    """
+    infos = archive.infolist()
+    root = archive_root([info.filename for info in infos])
+    pruned = tuple(f"{root}en/{framework}/{sub}/" for framework in frameworks for sub in prune)
+
+    groups = {framework: [] for framework in frameworks}
+    groups["root"] = []
+    for info in infos:
+        name = info.filename
+        if info.is_dir() or not name.startswith(root) or name.startswith(pruned):
+            continue
+        relative = name[len(root):]
+        if relative in ROOT_FILES:
+            groups["root"].append(info)
+        elif relative.startswith("en/"):
+            framework = relative[3:].split("/", 1)[0]
+            if framework in groups and framework != "root":
+                groups[framework].append(info)
+    return groups
+
+
+def output_path(output_dir: Path, root: str, name: str) -> Optional[Path]:
+    """Where a member goes under output_dir, or None if its name escapes it."""
+    relative = PurePosixPath(name[len(root):])
+    if relative.is_absolute() or ".." in relative.parts:
+        return None
+    return output_dir.joinpath(*relative.parts)
+
+
+def balanced_batches(members: List[zipfile.ZipInfo], count: int) -> List[List[zipfile.ZipInfo]]:
+    """Split members into at most count batches of similar uncompressed size, largest first."""
+    batches = [[] for _ in range(max(1, count))]
+    sizes = [0] * len(batches)
+    for info in sorted(members, key=lambda info: -info.file_size):
+        smallest = sizes.index(min(sizes))
+        batches[smallest].append(info)
+        sizes[smallest] += info.file_size
+    return [batch for batch in batches if batch]
+
+
+def extract_batch(zip_path: Path, root: str, members: List[zipfile.ZipInfo], output_dir: Path) -> int:
+    """Extract members through a private handle on the archive; returns the bytes written."""
+    written = 0
+    with zipfile.ZipFile(zip_path) as archive:
+        for info in members:
+            target = output_path(output_dir, root, info.filename)
+            if target is None:
+                print(f"  Warning: Skipping unsafe path: {info.filename}", file=sys.stderr)
+                continue
+            target.parent.mkdir(parents=True, exist_ok=True)
+            with archive.open(info) as source, open(target, "wb") as destination:
+                shutil.copyfileobj(source, destination, 1024 * 1024)
+            written += info.file_size
+    return written
+
+
+def extract_docs(
+    zip_path: Path,
+    output_dir: Path,
+    frameworks: List[str] = DEFAULT_FRAMEWORKS,
+    prune: List[str] = DEFAULT_PRUNE,
+    jobs: int = None
+) -> Dict[str, int]:
+    """Extract the kept members of zip_path into output_dir; returns {group: files extracted}."""
+    with zipfile.ZipFile(zip_path) as archive:
+        root = archive_root(archive.namelist())
+        groups = select_members(archive, frameworks, prune)
+        total = len(archive.infolist())
+
+    members = [info for group in groups.values() for info in group]
+    jobs = jobs or min(8, os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as executor:
+        written = sum(executor.map(
+            lambda batch: extract_batch(zip_path, root, batch, output_dir),
+            balanced_batches(members, jobs),
+        ))
+    print(f"Extracted {len(members)} of {total} archive entries ({written / 1024 / 1024:.1f} MB)")
+    return {group: len(infos) for group, infos in groups.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Extract only the kept frameworks from the Aspose docs archive.")
+    parser.add_argument("zip_file", help="Aspose.Slides documentation archive")
+    parser.add_argument("output_dir", help="Directory to extract into (e.g. docs)")
+    parser.add_argument(
+        "--framework",
+        action="append",
+        dest="frameworks",
+        help=f"Framework under en/ to keep (repeatable, default: {' '.join(DEFAULT_FRAMEWORKS)})"
+    )
+    parser.add_argument(
+        "--prune",
+        action="append",
+        help=f"Subdirectory of each framework to skip (repeatable, default: {' '.join(DEFAULT_PRUNE)})"
+    )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=None,
+        help="Concurrent extraction threads (default: CPU count, at most 8)"
+    )
+    args = parser.parse_args()
+
+    zip_path = Path(args.zip_file)
+    try:
+        counts = extract_docs(
+            zip_path, Path(args.output_dir),
+            args.frameworks or DEFAULT_FRAMEWORKS, args.prune or DEFAULT_PRUNE, args.jobs,
+        )
+    except (OSError, zipfile.BadZipFile) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    for group, count in counts.items():
+        if group != "root":
+            print(f"  {'Extracted' if count else 'Warning: Framework not found'}: {group} ({count} files)")
+    if not any(count for group, count in counts.items() if group != "root"):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
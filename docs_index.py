@@ -0,0 +1,461 @@
+#!/usr/bin/env python3
+"""
+BM25 full-text search over the extracted Aspose.Slides docs.
+
+docs_refresh.py tokenizes every _index.md under docs/en and writes a
+single index file, docs_artifacts/docs_index.bin. Each page is split into
+sections at its headings. Search returns ranked pages, each with the
+anchors of its best matching sections, so a hit can link straight to
+https://docs.aspose.com/slides<url>#<anchor>.
+
+BM25 weights are computed at build time twice: once with pages as the
+documents, to rank pages, and once with sections, to pick the anchors of a
+page. The index is opened lazily on the first search and read through
+mmap. Like stub_symbols.bin it is a header followed by fixed-size records
+and a string blob:
+
+    pages             path, title and url of each page
+    sections          page, anchor and heading of each section
+    terms             sorted by UTF-8 bytes: term, page postings, first page posting
+    page postings     (page, weight, slice of section postings), grouped by term
+    section postings  (section, weight), grouped by term and page
+    strings           UTF-8
+
+A query binary-searches each of its terms and sums the weights of their
+page postings, at most one per page. Only the pages returned have their
+section postings read.
+
+Usage:
+    python docs_refresh.py
+    python docs_index.py search "set slide background color"
+    python docs_index.py search --json --limit 3 "export to pdf"
+"""
+import argparse
+import bisect
+import heapq
+import json
+import math
+import mmap
+import re
+import struct
+import sys
+from pathlib import Path
+from typing import Iterator, List, NamedTuple
+
+SCRIPT_DIR = Path(__file__).parent
+DOCS_DIR = SCRIPT_DIR / "docs" / "en"
+ARTIFACT_DIR = SCRIPT_DIR / "docs_artifacts"
+INDEX_NAME = "docs_index.bin"
+INDEX_PATH = ARTIFACT_DIR / INDEX_NAME
+DOCS_SITE = "https://docs.aspose.com/slides"
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+
+# Title and heading words count this many times in their section
+TITLE_WEIGHT = 3
+HEADING_WEIGHT = 2
+
+MAGIC = b"ASPDOC01"
+# magic, pages, sections, terms, then offsets of sections, terms, page postings, section postings, strings
+HEADER = struct.Struct("<8sIIIIIIII")
+PAGE = struct.Struct("<IIIIII")  # path, title, url as (offset, length)
+SECTION = struct.Struct("<IIIII")  # page, anchor (offset, length), heading (offset, length)
+TERM = struct.Struct("<IIII")  # term (offset, length), page postings, first page posting
+PAGE_POSTING = struct.Struct("<IfII")  # page, BM25 weight, first section posting, section postings
+SECTION_POSTING = struct.Struct("<If")  # section, BM25 weight
+
+STOPWORDS = frozenset(
+    "a an and are as at be but by can do does for from has have how if in into is it its of on or so "
+    "such that the their then there these this to was were will with you your".split()
+)
+
+TOKEN_RE = re.compile(r"[a-z0-9]+(?:_[a-z0-9]+)*")
+HEADING_RE = re.compile(r"^(#{1,6})\s+(.*?)\s*#*\s*$")
+FENCE_RE = re.compile(r"^\s*(```|~~~)")
+SHORTCODE_RE = re.compile(r"\{\{[<%].*?[%>]\}\}")
+IMAGE_RE = re.compile(r"!\[[^\]]*\]\([^)]*\)")
+LINK_RE = re.compile(r"\[([^\]]*)\]\([^)]*\)")
+CUSTOM_ID_RE = re.compile(r"\s*\{#([^}]+)\}\s*$")
+
+
+class SectionHit(NamedTuple):
+    anchor: str
+    heading: str
+    score: float
+
+
+class PageHit(NamedTuple):
+    path: str
+    title: str
+    url: str
+    score: float
+    sections: List[SectionHit]
+
+
+def _normalize(token: str) -> str:
+    """Fold simple plurals so "slides" finds "slide"."""
+    if len(token) > 4 and token.endswith("ies"):
+        return token[:-3] + "y"
+    if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+        return token[:-1]
+    return token
+
+
+def tokenize(text: str) -> Iterator[str]:
+    """Lowercase word tokens without stopwords; snake_case names also yield their parts."""
+    for token in TOKEN_RE.findall(text.lower()):
+        if token in STOPWORDS:
+            continue
+        yield _normalize(token)
+        if "_" in token:
+            for part in token.split("_"):
+                if len(part) > 1 and part not in STOPWORDS:
+                    yield _normalize(part)
+
+
+def anchor_for(heading: str) -> str:
+    """The anchor Hugo generates for a heading, or its explicit {#id}."""
+    custom = CUSTOM_ID_RE.search(heading)
+    if custom:
+        return custom.group(1)
+    text = re.sub(r"[*_`]", "", heading).lower()
+    text = re.sub(r"[^\w\s-]", "", text)
+    return re.sub(r"\s", "-", text.strip())
+
+
+def heading_text(heading: str) -> str:
+    """A markdown heading without emphasis markers or an explicit {#id}."""
+    return re.sub(r"[*_`]", "", CUSTOM_ID_RE.sub("", heading)).strip()
+
+
+def split_front_matter(text: str):
+    """({key: value or [values]}, body) of a page with optional YAML front matter."""
+    if not text.startswith("---"):
+        return {}, text
+    end = text.find("\n---", 3)
+    if end == -1:
+        return {}, text
+    meta = {}
+    key = None
+    for line in text[3:end].splitlines():
+        if line.startswith("- ") and key:
+            if not isinstance(meta.get(key), list):
+                meta[key] = []
+            meta[key].append(line[2:].strip().strip("\"'"))
+        elif ":" in line and not line.startswith(" "):
+            key, _, value = line.partition(":")
+            key = key.strip()
+            meta[key] = value.strip().strip("\"'")
+    return meta, text[end + 4:]
+
+
+def _plain(line: str) -> str:
+    line = SHORTCODE_RE.sub(" ", line)
+    line = IMAGE_RE.sub(" ", line)
+    return LINK_RE.sub(r"\1", line)
+
+
+def parse_page(text: str) -> dict:
+    """
+    {"title", "url", "sections": [(anchor, heading, text)]} of a markdown page.
+
+    The first section holds what precedes the first heading, together with
+    the title, keywords and description from the front matter.
+    """
+    meta, body = split_front_matter(text)
+    title = meta.get("title") or ""
+    keywords = meta.get("keywords") or []
+    if isinstance(keywords, str):
+        keywords = [keywords]
+    intro = [meta.get("description") or "", " ".join(keywords)]
+
+    sections = [["", title, intro]]
+    in_code = False
+    for line in body.splitlines():
+        if FENCE_RE.match(line):
+            in_code = not in_code
+            continue
+        heading = None if in_code else HEADING_RE.match(line)
+        if heading:
+            sections.append([anchor_for(heading.group(2)), heading_text(heading.group(2)), []])
+        else:
+            sections[-1][2].append(line if in_code else _plain(line))
+    return {
+        "title": title,
+        "url": meta.get("url") or "",
+        "sections": [(anchor, heading, "\n".join(lines)) for anchor, heading, lines in sections],
+    }
+
+
+def index_page(text: str) -> dict:
+    """
+    The per-page part of the index: {"title", "url", "sections": [[anchor,
+    heading, {term: frequency}]]}, with title and heading words weighted up.
+    """
+    page = parse_page(text)
+    sections = []
+    for index, (anchor, heading, body) in enumerate(page["sections"]):
+        counts = {}
+        weighted = [(body, 1), (heading, HEADING_WEIGHT)]
+        if index == 0:
+            weighted.append((page["title"], TITLE_WEIGHT))
+        for chunk, weight in weighted:
+            for token in tokenize(chunk):
+                counts[token] = counts.get(token, 0) + weight
+        sections.append([anchor, heading, counts])
+    return {"title": page["title"], "url": page["url"], "sections": sections}
+
+
+def bm25_weights(counts: List[dict]) -> List[dict]:
+    """{term: BM25 weight} of each document given its {term: frequency}."""
+    lengths = [sum(terms.values()) for terms in counts]
+    avgdl = sum(lengths) / len(lengths) if lengths else 0.0
+    df = {}
+    for terms in counts:
+        for term in terms:
+            df[term] = df.get(term, 0) + 1
+    idf = {term: math.log(1 + (len(counts) - n + 0.5) / (n + 0.5)) for term, n in df.items()}
+    weights = []
+    for terms, length in zip(counts, lengths):
+        norm = K1 * (1 - B + B * length / avgdl)
+        weights.append({term: idf[term] * tf * (K1 + 1) / (tf + norm) for term, tf in terms.items()})
+    return weights
+
+
+def encode_index(pages: List[dict]) -> bytes:
+    """
+    Serialize the BM25 index of pages, which are index_page() results with
+    a "path" added. Only this step looks at the whole corpus.
+    """
+    blob = bytearray()
+    offsets = {}
+
+    def intern(text: str):
+        data = text.encode()
+        if data not in offsets:
+            offsets[data] = len(blob)
+            blob.extend(data)
+        return offsets[data], len(data)
+
+    page_records = bytearray()
+    section_records = bytearray()
+    section_counts = []
+    page_counts = []
+    for page_id, page in enumerate(pages):
+        page_records += PAGE.pack(*intern(page["path"]), *intern(page["title"]), *intern(page["url"]))
+        totals = {}
+        for anchor, heading, counts in page["sections"]:
+            section_records += SECTION.pack(page_id, *intern(anchor), *intern(heading))
+            section_counts.append(counts)
+            for term, count in counts.items():
+                totals[term] = totals.get(term, 0) + count
+        page_counts.append(totals)
+
+    # {term: [[page, weight, [(section, weight), ...]], ...]}, pages and sections in id order
+    postings = {}
+    page_postings_by_term = []
+    for page_id, weights in enumerate(bm25_weights(page_counts)):
+        by_term = {}
+        for term, weight in weights.items():
+            by_term[term] = [page_id, weight, []]
+            postings.setdefault(term, []).append(by_term[term])
+        page_postings_by_term.append(by_term)
+    section_page = [page_id for page_id, page in enumerate(pages) for _ in page["sections"]]
+    for section, weights in enumerate(bm25_weights(section_counts)):
+        by_term = page_postings_by_term[section_page[section]]
+        for term, weight in weights.items():
+            by_term[term][2].append((section, weight))
+
+    term_records = bytearray()
+    page_postings = bytearray()
+    section_postings = bytearray()
+    first_page = first_section = 0
+    for term in sorted(postings, key=str.encode):
+        entries = postings[term]
+        term_records += TERM.pack(*intern(term), len(entries), first_page)
+        for page_id, weight, sections in entries:
+            page_postings += PAGE_POSTING.pack(page_id, weight, first_section, len(sections))
+            for entry in sections:
+                section_postings += SECTION_POSTING.pack(*entry)
+            first_section += len(sections)
+        first_page += len(entries)
+
+    sections_offset = HEADER.size + len(page_records)
+    terms_offset = sections_offset + len(section_records)
+    page_postings_offset = terms_offset + len(term_records)
+    section_postings_offset = page_postings_offset + len(page_postings)
+    strings_offset = section_postings_offset + len(section_postings)
+    header = HEADER.pack(
+        MAGIC, len(pages), len(section_counts), len(postings),
+        sections_offset, terms_offset, page_postings_offset, section_postings_offset, strings_offset,
+    )
+    return b"".join((
+        header, page_records, section_records, term_records, page_postings, section_postings, blob
+    ))
+
+
+class DocsIndex:
+    """A docs index file, opened on the first search and read through mmap."""
+
+    def __init__(self, path: Path = INDEX_PATH):
+        self.path = Path(path)
+        self._map = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+    def _open(self):
+        with open(self.path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, self._pages, self._sections, self._terms, self._sections_offset, self._terms_offset,
+         self._page_postings_offset, self._section_postings_offset, self._strings_offset) = HEADER.unpack_from(self._map)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"{self.path} is not a docs index")
+
+    def _text(self, offset: int, length: int) -> str:
+        start = self._strings_offset + offset
+        return self._map[start:start + length].decode()
+
+    def _term(self, index: int) -> bytes:
+        offset, length, _, _ = TERM.unpack_from(self._map, self._terms_offset + index * TERM.size)
+        start = self._strings_offset + offset
+        return self._map[start:start + length]
+
+    def _page_postings(self, term: str) -> list:
+        """[(page, weight, first section posting, section postings), ...] of a term."""
+        key = term.encode()
+        lo, hi = 0, self._terms
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._term(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo == self._terms or self._term(lo) != key:
+            return []
+        _, _, count, first = TERM.unpack_from(self._map, self._terms_offset + lo * TERM.size)
+        start = self._page_postings_offset + first * PAGE_POSTING.size
+        return list(PAGE_POSTING.iter_unpack(self._map[start:start + count * PAGE_POSTING.size]))
+
+    def _section_hits(self, slices: list, limit: int) -> List[SectionHit]:
+        """The best sections of a page from each query term's (first, count) slice of section postings."""
+        scores = {}
+        for first, count in slices:
+            start = self._section_postings_offset + first * SECTION_POSTING.size
+            for section, weight in SECTION_POSTING.iter_unpack(self._map[start:start + count * SECTION_POSTING.size]):
+                scores[section] = scores.get(section, 0.0) + weight
+        hits = []
+        for section, score in sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:limit]:
+            _, anchor_off, anchor_len, heading_off, heading_len = SECTION.unpack_from(
+                self._map, self._sections_offset + section * SECTION.size
+            )
+            hits.append(SectionHit(self._text(anchor_off, anchor_len), self._text(heading_off, heading_len), score))
+        return hits
+
+    def search(self, query: str, limit: int = 10, sections: int = 3) -> List[PageHit]:
+        """
+        Pages ranked by BM25, each with up to sections of its best matching
+        sections, also ranked by BM25.
+        """
+        if self._map is None:
+            self._open()
+        scores = [0.0] * self._pages
+        postings = [self._page_postings(term) for term in set(tokenize(query))]
+        for term_postings in postings:
+            for page, weight, _, _ in term_postings:
+                scores[page] += weight
+
+        ranked = heapq.nsmallest(limit, (
+            (-score, page) for page, score in enumerate(scores) if score
+        ))
+        hits = []
+        for score, page in ranked:
+            score = -score
+            # Page postings are sorted by page, so each term's posting for this page is a bisection away
+            slices = []
+            for term_postings in postings:
+                index = bisect.bisect_left(term_postings, (page,))
+                if index < len(term_postings) and term_postings[index][0] == page:
+                    slices.append(term_postings[index][2:])
+            path_off, path_len, title_off, title_len, url_off, url_len = PAGE.unpack_from(
+                self._map, HEADER.size + page * PAGE.size
+            )
+            hits.append(PageHit(
+                self._text(path_off, path_len), self._text(title_off, title_len), self._text(url_off, url_len),
+                score, self._section_hits(slices, sections),
+            ))
+        return hits
+
+
+def page_link(hit: PageHit, section: SectionHit = None) -> str:
+    """Docs site URL of a hit, pointing at section if given."""
+    anchor = f"#{section.anchor}" if section and section.anchor else ""
+    return f"{DOCS_SITE}{hit.url}{anchor}" if hit.url else f"{hit.path}{anchor}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Query the BM25 index of the Aspose.Slides docs.")
+    parser.add_argument(
+        "--index",
+        default=str(INDEX_PATH),
+        help=f"Index file (default: {INDEX_PATH.relative_to(SCRIPT_DIR)})"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    search = commands.add_parser("search", help="Rank pages and sections for a query")
+    search.add_argument("query", nargs="+", help="Search words")
+    search.add_argument(
+        "--limit",
+        type=int,
+        default=10,
+        help="Number of pages to return (default: 10)"
+    )
+    search.add_argument(
+        "--sections",
+        type=int,
+        default=3,
+        help="Best sections to list per page (default: 3)"
+    )
+    search.add_argument(
+        "--json",
+        action="store_true",
+        help="Print the hits as JSON"
+    )
+    args = parser.parse_args()
+
+    try:
+        with DocsIndex(Path(args.index)) as index:
+            hits = index.search(" ".join(args.query), args.limit, args.sections)
+    except (OSError, ValueError) as e:
+        print(f"ERROR: {e}\nRun: python docs_refresh.py", file=sys.stderr)
+        sys.exit(2)
+
+    if args.json:
+        print(json.dumps([
+            {**hit._asdict(), "link": page_link(hit), "sections": [
+                {**section._asdict(), "link": page_link(hit, section)} for section in hit.sections
+            ]} for hit in hits
+        ], indent=2))
+        return
+    for hit in hits:
+        print(f"{hit.score:6.2f}  {hit.title}  ({hit.path})")
+        for section in hit.sections:
+            print(f"        {section.score:6.2f}  {section.heading}  {page_link(hit, section)}")
+    if not hits:
+        print("No matches", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
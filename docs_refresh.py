@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Incremental rebuild of everything derived from the extracted docs.
+
+extract-aspose-docs.sh replaces docs/ wholesale, but a new docs release
+usually changes only a few pages. Each artifact is split into a per-page
+step and a merge step. docs_artifacts/pages.json keeps every page's
+content hash together with its per-page results, so a refresh only
+re-parses pages that were added or changed, drops removed ones, and
+re-runs the cheap merges:
+
+    docs_index.bin        BM25 search index (docs_index.py)
+    front_matter.json     {page: front matter} of every page
+    snippet_catalog.json  Python snippets by the API they use (docs_snippets.py)
+    docs_xref.json        API symbol -> pages and sections mentioning it (docs_xref.py)
+
+An artifact whose source files changed since the store was written is
+recomputed for every page. Merged artifacts are written atomically and
+only when their bytes changed; the store is written last, so an
+interrupted refresh is redone by the next one.
+
+Usage:
+    python docs_refresh.py
+    python docs_refresh.py --full
+"""
+import argparse
+import hashlib
+import json
+import sys
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+import docs_index
+import docs_snippets
+import docs_xref
+from docs_index import ARTIFACT_DIR, DOCS_DIR, SCRIPT_DIR
+from stub_io import content_hash, write_bytes_atomic, write_text_atomic
+
+STORE_NAME = "pages.json"
+STORE_FORMAT = 1
+
+
+class Artifact(NamedTuple):
+    name: str
+    filename: str
+    # Files whose change invalidates every page's result
+    sources: List[str]
+    # Page text -> JSON-serializable per-page result
+    process: Callable[[str], object]
+    # {page path: result}, sorted by path -> file content
+    merge: Callable[[Dict[str, object]], bytes]
+    # Called with the previous artifact file before its first page is processed
+    prepare: Optional[Callable[[Path], None]] = None
+
+
+def merge_index(results: dict) -> bytes:
+    return docs_index.encode_index([{**page, "path": path} for path, page in results.items()])
+
+
+def merge_json(results: dict) -> bytes:
+    return (json.dumps(results, indent=1, sort_keys=True, ensure_ascii=False) + "\n").encode()
+
+
+def front_matter(text: str) -> dict:
+    return docs_index.split_front_matter(text)[0]
+
+
+def load_snippet_cache(path: Path):
+    """Seed snippet parse results from the catalog next to an artifact."""
+    docs_snippets.load_parse_cache(path.with_name(docs_snippets.CATALOG_NAME))
+
+
+ARTIFACTS = [
+    Artifact("index", docs_index.INDEX_NAME, ["docs_index.py"], docs_index.index_page, merge_index),
+    Artifact("front_matter", "front_matter.json", ["docs_index.py"], front_matter, merge_json),
+    Artifact(
+        "snippets", docs_snippets.CATALOG_NAME, ["docs_index.py", "docs_snippets.py"],
+        docs_snippets.page_snippets, docs_snippets.merge_catalog, load_snippet_cache,
+    ),
+    Artifact(
+        "xref", docs_xref.XREF_NAME, ["docs_index.py", "docs_snippets.py", "docs_xref.py"],
+        docs_xref.page_mentions, docs_xref.merge_xref, load_snippet_cache,
+    ),
+]
+
+
+def source_version(sources: List[str]) -> str:
+    """Short hash of an artifact's source files."""
+    digest = hashlib.sha256()
+    for name in sources:
+        digest.update((SCRIPT_DIR / name).read_bytes())
+    return digest.hexdigest()[:12]
+
+
+def load_store(path: Path) -> dict:
+    """The per-page store, or an empty one if it is missing or from another format."""
+    try:
+        store = json.loads(path.read_text())
+    except (OSError, ValueError):
+        store = None
+    if not isinstance(store, dict) or store.get("format") != STORE_FORMAT:
+        store = {"format": STORE_FORMAT, "versions": {}, "pages": {}}
+    return store
+
+
+def refresh(
+    docs_dir: Path = DOCS_DIR,
+    artifact_dir: Path = ARTIFACT_DIR,
+    artifacts: List[Artifact] = ARTIFACTS,
+    full: bool = False
+) -> dict:
+    """
+    Bring the artifacts under artifact_dir up to date with docs_dir.
+
+    Returns {"added", "changed", "removed": [page path], "unchanged": count,
+    "written": [artifact filename]}.
+    """
+    store_path = artifact_dir / STORE_NAME
+    store = load_store(store_path)
+    old_pages = {} if full else store["pages"]
+    versions = {artifact.name: source_version(artifact.sources) for artifact in artifacts}
+    stale = {name for name, version in versions.items() if store["versions"].get(name) != version}
+
+    summary = {"added": [], "changed": [], "removed": [], "unchanged": 0, "written": []}
+    prepared = set()
+    pages = {}
+    for path in sorted(docs_dir.rglob("_index.md")):
+        key = path.relative_to(docs_dir.parent).as_posix()
+        data = path.read_bytes()
+        digest = content_hash(data)
+        entry = old_pages.get(key)
+        if entry is None:
+            summary["added"].append(key)
+            entry = {}
+        elif entry["hash"] != digest:
+            summary["changed"].append(key)
+            entry = {}
+        else:
+            summary["unchanged"] += 1
+            entry = dict(entry)
+        missing = [artifact for artifact in artifacts if artifact.name in stale or artifact.name not in entry]
+        if missing:
+            text = data.decode("utf-8", errors="replace")
+            for artifact in missing:
+                if artifact.prepare and artifact.name not in stale | prepared:
+                    artifact.prepare(artifact_dir / artifact.filename)
+                    prepared.add(artifact.name)
+                entry[artifact.name] = artifact.process(text)
+        entry["hash"] = digest
+        pages[key] = entry
+    summary["removed"] = sorted(set(old_pages) - set(pages))
+
+    artifact_dir.mkdir(parents=True, exist_ok=True)
+    dirty = summary["added"] or summary["changed"] or summary["removed"] or stale
+    for artifact in artifacts:
+        path = artifact_dir / artifact.filename
+        if not dirty and path.exists():
+            continue
+        content = artifact.merge({key: entry[artifact.name] for key, entry in pages.items()})
+        try:
+            if path.read_bytes() == content:
+                continue
+        except FileNotFoundError:
+            pass
+        write_bytes_atomic(path, content)
+        summary["written"].append(artifact.filename)
+
+    if dirty or not store_path.exists():
+        store = {"format": STORE_FORMAT, "versions": versions, "pages": pages}
+        write_text_atomic(store_path, json.dumps(store, sort_keys=True, separators=(",", ":")) + "\n")
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Incrementally rebuild the artifacts derived from the docs.")
+    parser.add_argument(
+        "--docs-dir",
+        default=str(DOCS_DIR),
+        help=f"Docs root (default: {DOCS_DIR.relative_to(SCRIPT_DIR)})"
+    )
+    parser.add_argument(
+        "--artifact-dir",
+        default=str(ARTIFACT_DIR),
+        help=f"Output directory (default: {ARTIFACT_DIR.relative_to(SCRIPT_DIR)})"
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Reprocess every page, ignoring the per-page store"
+    )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="List the added, changed and removed pages"
+    )
+    args = parser.parse_args()
+
+    docs_dir = Path(args.docs_dir)
+    if not docs_dir.exists():
+        print(f"ERROR: Docs not found at {docs_dir}\nRun: ./extract-aspose-docs.sh", file=sys.stderr)
+        sys.exit(1)
+    artifact_dir = Path(args.artifact_dir)
+    summary = refresh(docs_dir, artifact_dir, full=args.full)
+
+    print(
+        f"Docs: {len(summary['added'])} added, {len(summary['changed'])} changed, "
+        f"{len(summary['removed'])} removed, {summary['unchanged']} unchanged"
+    )
+    if args.verbose:
+        for kind in ("added", "changed", "removed"):
+            for page in summary[kind]:
+                print(f"  {kind}: {page}")
+    for artifact in ARTIFACTS:
+        state = "Written" if artifact.filename in summary["written"] else "Unchanged"
+        print(f"{state}: {artifact_dir / artifact.filename}")
+
+
+if __name__ == "__main__":
+    main()
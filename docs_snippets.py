@@ -0,0 +1,446 @@
+#!/usr/bin/env python3
+"""
+Catalog of the Python code snippets in the docs, indexed by the API they use.
+
+Every ```py / ```python block is parsed with ast and reduced to the
+attribute and call chains it uses. Chains rooted at an import are resolved
+through its alias, so with `import aspose.pydrawing as draw`,
+`draw.Color.from_argb(...)` is recorded as the call
+aspose.pydrawing.Color.from_argb. Chains rooted at a local variable keep
+only their attributes: `pres.slides.add_clone(slide)` becomes
+slides.add_clone. Snippets that leave out their imports are read with the
+aliases the docs use throughout (slides, draw, charts). An alias stops
+applying once the snippet rebinds its name: after
+`slides = presentation.slides`, `slides.add_empty_slide(...)` is the local
+chain add_empty_slide, not aspose.slides.add_empty_slide.
+
+docs_refresh.py writes the catalog to docs_artifacts/snippet_catalog.json:
+
+    snippets     {hash: {"code", "chains": [[chain, "call" | "attribute"]], "error"}}
+    occurrences  {hash: [[page, anchor, heading, line]]}
+    symbols      {chain: [hash]}
+    names        {last chain component: [chain]}
+    pages        {page: [title, url]}
+
+Looking up a symbol matches chains equal to it or ending in "." + it, so
+add_clone, Color.from_argb and aspose.pydrawing.Color.from_argb all work
+without scanning the snippets. Parse results are keyed by snippet hash:
+identical snippets are parsed once, and a refresh reuses the results of the
+previous catalog for snippets it already holds.
+
+Usage:
+    python docs_snippets.py lookup add_clone
+    python docs_snippets.py lookup pydrawing.Color.from_argb --code --limit 2
+    python docs_snippets.py symbols --prefix aspose.pydrawing
+"""
+import argparse
+import ast
+import json
+import re
+import sys
+import textwrap
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional
+
+from docs_index import (
+    ARTIFACT_DIR, DOCS_SITE, FENCE_RE, HEADING_RE, anchor_for, heading_text, split_front_matter
+)
+from stub_io import content_hash
+
+CATALOG_NAME = "snippet_catalog.json"
+CATALOG_PATH = ARTIFACT_DIR / CATALOG_NAME
+CATALOG_FORMAT = 1
+
+PYTHON_FENCE_RE = re.compile(r"^(\s*)(```|~~~)\s*(py|python|python3)\s*$", re.IGNORECASE)
+
+# Aliases the docs use when a snippet relies on imports from an earlier one
+DEFAULT_ALIASES = {
+    "slides": "aspose.slides",
+    "draw": "aspose.pydrawing",
+    "charts": "aspose.slides.charts",
+}
+
+# {snippet hash: (chains, error)} parsed in this process or read from the previous catalog
+_parsed: Dict[str, tuple] = {}
+
+
+class Example(NamedTuple):
+    symbol: str
+    kind: str
+    page: str
+    title: str
+    url: str
+    anchor: str
+    heading: str
+    line: int
+    code: str
+
+
+class _ChainVisitor(ast.NodeVisitor):
+    """
+    Collects the maximal attribute chains of a module, resolving import aliases.
+
+    Statements are visited in execution order, and an alias is dropped once
+    the snippet binds its name to something else (slides = pres.slides),
+    so later chains off that name are read as chains off a local. Names
+    bound inside a function, lambda or comprehension only shadow the alias
+    there.
+    """
+
+    def __init__(self, aliases: dict):
+        self.aliases = dict(aliases)
+        self.chains = {}
+
+    def _record(self, node, kind: str):
+        parts = []
+        while isinstance(node, ast.Attribute):
+            parts.append(node.attr)
+            node = node.value
+        parts.reverse()
+        if isinstance(node, ast.Name) and node.id in self.aliases:
+            parts.insert(0, self.aliases[node.id])
+        elif not isinstance(node, ast.Name):
+            # Chains hanging off a subscript or call: record the root's own chains too
+            self.visit(node)
+        if parts:
+            chain = ".".join(parts)
+            if self.chains.get(chain) != "call":
+                self.chains[chain] = kind
+
+    def _unbind(self, name: str):
+        self.aliases.pop(name, None)
+
+    def _visit_all(self, *nodes):
+        for node in nodes:
+            if isinstance(node, list):
+                self._visit_all(*node)
+            elif node is not None:
+                self.visit(node)
+
+    def _scoped(self, visit, *args):
+        """Call visit(*args) with a private copy of the aliases, as in a nested scope."""
+        saved = self.aliases
+        self.aliases = dict(saved)
+        try:
+            visit(*args)
+        finally:
+            self.aliases = saved
+
+    def visit_Call(self, node):
+        self._record(node.func, "call")
+        for child in (*node.args, *node.keywords):
+            self.visit(child)
+
+    def visit_Attribute(self, node):
+        self._record(node, "attribute")
+
+    def visit_Name(self, node):
+        if not isinstance(node.ctx, ast.Load):
+            self._unbind(node.id)
+        elif node.id in self.aliases and "." in self.aliases[node.id]:
+            self._record(node, "attribute")
+
+    # The value is evaluated before the targets are bound
+
+    def visit_Assign(self, node):
+        self._visit_all(node.value, node.targets)
+
+    def visit_AnnAssign(self, node):
+        self._visit_all(node.annotation, node.value, node.target)
+
+    def visit_AugAssign(self, node):
+        self._visit_all(node.value, node.target)
+
+    def visit_NamedExpr(self, node):
+        self._visit_all(node.value, node.target)
+
+    def visit_For(self, node):
+        self._visit_all(node.iter, node.target, node.body, node.orelse)
+
+    visit_AsyncFor = visit_For
+
+    def visit_withitem(self, node):
+        self._visit_all(node.context_expr, node.optional_vars)
+
+    def visit_ExceptHandler(self, node):
+        self._visit_all(node.type)
+        if node.name:
+            self._unbind(node.name)
+        self._visit_all(node.body)
+
+    def _visit_comprehension(self, generators: list, *elements):
+        for generator in generators:
+            self._visit_all(generator.iter, generator.target, generator.ifs)
+        self._visit_all(*elements)
+
+    def visit_ListComp(self, node):
+        self._scoped(self._visit_comprehension, node.generators, node.elt)
+
+    visit_SetComp = visit_GeneratorExp = visit_ListComp
+
+    def visit_DictComp(self, node):
+        self._scoped(self._visit_comprehension, node.generators, node.key, node.value)
+
+    def _visit_function(self, args: ast.arguments, body):
+        """Defaults are evaluated before the parameters shadow any alias in the body."""
+        self._visit_all(args.defaults, args.kw_defaults)
+        for arg in (*args.posonlyargs, *args.args, args.vararg, *args.kwonlyargs, args.kwarg):
+            if arg is not None:
+                self._unbind(arg.arg)
+        self._visit_all(body)
+
+    def visit_FunctionDef(self, node):
+        self._visit_all(node.decorator_list)
+        self._scoped(self._visit_function, node.args, node.body)
+        self._unbind(node.name)
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+
+    def visit_Lambda(self, node):
+        self._scoped(self._visit_function, node.args, node.body)
+
+    def visit_ClassDef(self, node):
+        self._visit_all(node.decorator_list, node.bases, node.keywords)
+        self._scoped(self._visit_all, node.body)
+        self._unbind(node.name)
+
+
+def import_aliases(tree: ast.AST) -> dict:
+    """{local name: qualified name} bound by the imports of a module."""
+    aliases = {}
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                if alias.asname:
+                    aliases[alias.asname] = alias.name
+                else:
+                    top = alias.name.split(".", 1)[0]
+                    aliases[top] = top
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            for alias in node.names:
+                if alias.name != "*":
+                    aliases[alias.asname or alias.name] = f"{node.module}.{alias.name}"
+    return aliases
+
+
+def snippet_chains(code: str) -> tuple:
+    """([[chain, kind], ...] sorted by chain, error message or None) of a snippet."""
+    try:
+        tree = ast.parse(code)
+    except TabError:
+        tree = None
+    except SyntaxError as e:
+        return [], f"line {e.lineno}: {e.msg}"
+    if tree is None:
+        # Some snippets mix tabs and spaces; read tabs as 4 spaces like the rendered docs
+        try:
+            tree = ast.parse(code.expandtabs(4))
+        except SyntaxError as e:
+            return [], f"line {e.lineno}: {e.msg}"
+    aliases = {**DEFAULT_ALIASES, **import_aliases(tree)}
+    visitor = _ChainVisitor(aliases)
+    for node in tree.body:
+        if not isinstance(node, (ast.Import, ast.ImportFrom)):
+            visitor.visit(node)
+    return sorted([chain, kind] for chain, kind in visitor.chains.items()), None
+
+
+def parse_snippet(code: str) -> dict:
+    """{"hash", "chains", "error"} of a snippet, parsing it only if its hash is new."""
+    digest = content_hash(code.encode())[:16]
+    if digest not in _parsed:
+        _parsed[digest] = snippet_chains(code)
+    chains, error = _parsed[digest]
+    return {"hash": digest, "chains": chains, "error": error}
+
+
+def page_snippets(text: str) -> dict:
+    """
+    The per-page part of the catalog: {"title", "url", "snippets": [{"hash",
+    "code", "chains", "error", "anchor", "heading", "line"}]}.
+    """
+    meta, body = split_front_matter(text)
+    line_offset = text[:len(text) - len(body)].count("\n")
+    anchor, heading = "", meta.get("title") or ""
+    snippets = []
+    block = None  # lines of the open python block
+    other = False  # inside a block of another language
+    for number, line in enumerate(body.splitlines(), start=line_offset + 1):
+        if block is not None:
+            if FENCE_RE.match(line):
+                code = textwrap.dedent("\n".join(block)).strip("\n") + "\n"
+                snippets.append({
+                    **parse_snippet(code), "code": code,
+                    "anchor": anchor, "heading": heading, "line": start,
+                })
+                block = None
+            else:
+                block.append(line)
+        elif other:
+            other = not FENCE_RE.match(line)
+        elif PYTHON_FENCE_RE.match(line):
+            block, start = [], number + 1
+        elif FENCE_RE.match(line):
+            # Skip other blocks so that "# comments" in them are not taken for headings
+            other = True
+        else:
+            match = HEADING_RE.match(line)
+            if match:
+                anchor, heading = anchor_for(match.group(2)), heading_text(match.group(2))
+    return {"title": meta.get("title") or "", "url": meta.get("url") or "", "snippets": snippets}
+
+
+def load_parse_cache(path: Path = CATALOG_PATH):
+    """Seed the per-hash parse results from a previously written catalog."""
+    try:
+        catalog = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return
+    if catalog.get("format") != CATALOG_FORMAT:
+        return
+    for digest, snippet in catalog["snippets"].items():
+        _parsed.setdefault(digest, (snippet["chains"], snippet.get("error")))
+
+
+def merge_catalog(results: dict) -> bytes:
+    """The catalog file of {page path: page_snippets() result}, sorted by path."""
+    snippets = {}
+    occurrences = {}
+    symbols = {}
+    pages = {}
+    for path, page in results.items():
+        pages[path] = [page["title"], page["url"]]
+        for snippet in page["snippets"]:
+            digest = snippet["hash"]
+            snippets[digest] = {"code": snippet["code"], "chains": snippet["chains"], "error": snippet["error"]}
+            occurrences.setdefault(digest, []).append(
+                [path, snippet["anchor"], snippet["heading"], snippet["line"]]
+            )
+            for chain, _ in snippet["chains"]:
+                hashes = symbols.setdefault(chain, [])
+                if digest not in hashes:
+                    hashes.append(digest)
+    names = {}
+    for chain in sorted(symbols):
+        names.setdefault(chain.rsplit(".", 1)[-1], []).append(chain)
+    catalog = {
+        "format": CATALOG_FORMAT,
+        "snippets": snippets,
+        "occurrences": occurrences,
+        "symbols": symbols,
+        "names": names,
+        "pages": pages,
+    }
+    return (json.dumps(catalog, sort_keys=True, separators=(",", ":"), ensure_ascii=False) + "\n").encode()
+
+
+class SnippetCatalog:
+    """A snippet catalog file, loaded on first use."""
+
+    def __init__(self, path: Path = CATALOG_PATH):
+        self.path = Path(path)
+        self._catalog = None
+
+    @property
+    def catalog(self) -> dict:
+        if self._catalog is None:
+            catalog = json.loads(self.path.read_text())
+            if catalog.get("format") != CATALOG_FORMAT:
+                raise ValueError(f"{self.path} is not a format {CATALOG_FORMAT} snippet catalog")
+            self._catalog = catalog
+        return self._catalog
+
+    def matching_symbols(self, symbol: str) -> List[str]:
+        """Recorded chains equal to symbol or ending in "." + symbol."""
+        catalog = self.catalog
+        suffix = f".{symbol}"
+        candidates = catalog["names"].get(symbol.rsplit(".", 1)[-1], [])
+        return [chain for chain in candidates if chain == symbol or chain.endswith(suffix)]
+
+    def symbols(self, prefix: str = "") -> List[str]:
+        return sorted(chain for chain in self.catalog["symbols"] if chain.startswith(prefix))
+
+    def examples(self, symbol: str, limit: Optional[int] = None) -> List[Example]:
+        """One Example per occurrence of a snippet using symbol, in page order."""
+        catalog = self.catalog
+        found = []
+        for chain in self.matching_symbols(symbol):
+            for digest in catalog["symbols"][chain]:
+                snippet = catalog["snippets"][digest]
+                kind = dict(map(tuple, snippet["chains"]))[chain]
+                for page, anchor, heading, line in catalog["occurrences"][digest]:
+                    title, url = catalog["pages"][page]
+                    found.append(Example(chain, kind, page, title, url, anchor, heading, line, snippet["code"]))
+        found.sort(key=lambda example: (example.page, example.line, example.symbol))
+        return found[:limit] if limit else found
+
+
+def example_link(example: Example) -> str:
+    anchor = f"#{example.anchor}" if example.anchor else ""
+    return f"{DOCS_SITE}{example.url}{anchor}" if example.url else f"{example.page}:{example.line}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Find documentation code examples by the API they use.")
+    parser.add_argument(
+        "--catalog",
+        default=str(CATALOG_PATH),
+        help=f"Catalog file (default: {CATALOG_PATH.relative_to(CATALOG_PATH.parents[1])})"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    lookup = commands.add_parser("lookup", help="Show the snippets using a symbol")
+    lookup.add_argument("symbol", help="Symbol such as add_clone or pydrawing.Color.from_argb")
+    lookup.add_argument(
+        "--limit",
+        type=int,
+        default=None,
+        help="At most this many examples"
+    )
+    lookup.add_argument(
+        "--code",
+        action="store_true",
+        help="Print the code of each example"
+    )
+    lookup.add_argument(
+        "--json",
+        action="store_true",
+        help="Print JSON objects, one per line"
+    )
+
+    symbols = commands.add_parser("symbols", help="List the recorded chains")
+    symbols.add_argument(
+        "--prefix",
+        default="",
+        help="Only chains starting with this"
+    )
+    args = parser.parse_args()
+
+    catalog = SnippetCatalog(Path(args.catalog))
+    try:
+        catalog.catalog
+    except (OSError, ValueError) as e:
+        print(f"ERROR: {e}\nRun: python docs_refresh.py", file=sys.stderr)
+        sys.exit(2)
+
+    if args.command == "symbols":
+        for chain in catalog.symbols(args.prefix):
+            print(f"{chain}  ({len(catalog.catalog['symbols'][chain])} snippets)")
+        return
+
+    examples = catalog.examples(args.symbol, args.limit)
+    for example in examples:
+        if args.json:
+            print(json.dumps({**example._asdict(), "link": example_link(example)}))
+            continue
+        print(f"{example.symbol} [{example.kind}]  {example.heading}  {example_link(example)}")
+        print(f"    {example.page}:{example.line}")
+        if args.code:
+            print(textwrap.indent(example.code, "    | ", lambda line: True))
+    if not examples:
+        print(f"{args.symbol}: no examples", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+Cross-reference of API symbols to the docs pages and sections mentioning them.
+
+docs_refresh.py builds docs_artifacts/docs_xref.json in one pass over the
+pages, recording for each section:
+
+    reference  links to https://reference.aspose.com/slides/python-net/...
+    mention    aspose.* names in prose, and draw.X / slides.X in code spans
+    example    calls and attributes used by its Python snippets (docs_snippets.py)
+
+Symbols are keyed by their lowercased qualified name, since reference URLs
+are lowercase (aspose.slides/presentation/get_images is
+aspose.slides.Presentation.get_images).
+
+With --docs, stub_pipeline.py and api_snapshots.py seed join the index
+into the generated stubs: apply_docs_xref() appends the best pages for a
+class, including those about its members, to the class docstring, and
+those for a member to the member docstring. Each lookup is a dict access
+or a bisection over the sorted keys; the corpus is never rescanned.
+
+Usage:
+    python docs_xref.py aspose.pydrawing.Color
+    python docs_xref.py --members aspose.slides.Presentation --limit 5
+"""
+import argparse
+import bisect
+import json
+import re
+import sys
+from pathlib import Path
+from typing import List, NamedTuple, Optional
+
+import docs_snippets
+from docs_index import (
+    ARTIFACT_DIR, DOCS_SITE, FENCE_RE, HEADING_RE, anchor_for, heading_text, split_front_matter
+)
+from stub_io import content_hash
+from stub_model import StubModule
+
+XREF_NAME = "docs_xref.json"
+XREF_PATH = ARTIFACT_DIR / XREF_NAME
+XREF_FORMAT = 1
+
+# Pages listed in a generated docstring
+DOC_LINKS = 3
+
+KINDS = ("reference", "mention", "example")
+
+REFERENCE_RE = re.compile(r"https://reference\.aspose\.com/slides/python-net/([^)\s\"'#?]+)")
+LINK_TARGET_RE = re.compile(r"\]\([^)]*\)")
+CODE_SPAN_RE = re.compile(r"`([^`]+)`")
+QUALIFIED_RE = re.compile(r"\baspose(?:\.[A-Za-z_]\w*)+")
+ALIASED_RE = re.compile(r"\b([a-z]+)((?:\.[A-Za-z_]\w*)+)")
+ALIASES = {**docs_snippets.DEFAULT_ALIASES, "pydrawing": "aspose.pydrawing"}
+
+
+class DocRef(NamedTuple):
+    symbol: str
+    kind: str
+    page: str
+    title: str
+    url: str
+    anchor: str
+    heading: str
+
+    @property
+    def link(self) -> str:
+        anchor = f"#{self.anchor}" if self.anchor else ""
+        return f"{DOCS_SITE}{self.url}{anchor}" if self.url else self.page
+
+
+def reference_symbol(path: str) -> Optional[str]:
+    """Key of a reference URL path such as aspose.slides/presentation/get_images/."""
+    parts = [part for part in path.split("/") if part]
+    if not parts or not parts[0].startswith("aspose"):
+        return None
+    return ".".join(parts).lower()
+
+
+def prose_symbols(line: str) -> set:
+    """Keys of the aspose.* names in a prose line and the aliased names in its code spans."""
+    line = LINK_TARGET_RE.sub("]", line)
+    found = {match.group(0).lower() for match in QUALIFIED_RE.finditer(line)}
+    for span in CODE_SPAN_RE.findall(line):
+        for match in ALIASED_RE.finditer(span):
+            if match.group(1) in ALIASES:
+                found.add(f"{ALIASES[match.group(1)]}{match.group(2)}".lower())
+    return found
+
+
+def page_mentions(text: str) -> dict:
+    """
+    The per-page part of the index: {"title", "url", "mentions": [[key,
+    anchor, heading, kind]]}, one entry per symbol, section and kind.
+    """
+    meta, body = split_front_matter(text)
+    anchor, heading = "", meta.get("title") or ""
+    mentions = set()
+    in_code = False
+    for line in body.splitlines():
+        if FENCE_RE.match(line):
+            in_code = not in_code
+            continue
+        if in_code:
+            continue
+        match = HEADING_RE.match(line)
+        if match:
+            anchor, heading = anchor_for(match.group(2)), heading_text(match.group(2))
+        for path in REFERENCE_RE.findall(line):
+            key = reference_symbol(path)
+            if key:
+                mentions.add((key, anchor, heading, "reference"))
+        for key in prose_symbols(line):
+            mentions.add((key, anchor, heading, "mention"))
+
+    # Snippet parse results are shared with the snippet catalog
+    for snippet in docs_snippets.page_snippets(text)["snippets"]:
+        for chain, _ in snippet["chains"]:
+            if chain.startswith("aspose."):
+                mentions.add((chain.lower(), snippet["anchor"], snippet["heading"], "example"))
+    return {
+        "title": meta.get("title") or "",
+        "url": meta.get("url") or "",
+        "mentions": sorted(list(mention) for mention in mentions),
+    }
+
+
+def merge_xref(results: dict) -> bytes:
+    """The index file of {page path: page_mentions() result}, sorted by path."""
+    symbols = {}
+    pages = {}
+    for path, page in results.items():
+        pages[path] = [page["title"], page["url"]]
+        for key, anchor, heading, kind in page["mentions"]:
+            symbols.setdefault(key, []).append([path, anchor, heading, kind])
+    index = {"format": XREF_FORMAT, "pages": pages, "symbols": symbols}
+    return (json.dumps(index, sort_keys=True, separators=(",", ":"), ensure_ascii=False) + "\n").encode()
+
+
+class DocsXref:
+    """A cross-reference index file, loaded on first use."""
+
+    def __init__(self, path: Path = XREF_PATH):
+        self.path = Path(path)
+        self._index = None
+        self._keys = None
+        self._digest = None
+
+    def exists(self) -> bool:
+        return self.path.exists()
+
+    def _load(self):
+        data = self.path.read_bytes()
+        index = json.loads(data)
+        if index.get("format") != XREF_FORMAT:
+            raise ValueError(f"{self.path} is not a format {XREF_FORMAT} docs cross-reference")
+        self._index = index
+        self._keys = sorted(index["symbols"])
+        self._digest = content_hash(data)[:12]
+
+    @property
+    def index(self) -> dict:
+        if self._index is None:
+            self._load()
+        return self._index
+
+    @property
+    def digest(self) -> str:
+        """Short hash of the index file, for the stub fingerprint."""
+        if self._index is None:
+            self._load()
+        return self._digest
+
+    def _refs(self, key: str) -> List[DocRef]:
+        index = self.index
+        refs = []
+        for page, anchor, heading, kind in index["symbols"].get(key, []):
+            title, url = index["pages"][page]
+            refs.append(DocRef(key, kind, page, title, url, anchor, heading))
+        return refs
+
+    def refs(self, symbol: str, members: bool = False, limit: Optional[int] = None) -> List[DocRef]:
+        """
+        Sections mentioning symbol, one per section: reference links first,
+        then prose mentions, then examples. With members, sections that only
+        mention its members follow, those mentioning the most members first.
+        """
+        key = symbol.lower()
+        ranked = sorted(self._refs(key), key=lambda ref: KINDS.index(ref.kind))
+        if members:
+            prefix = f"{key}."
+            index = bisect.bisect_left(self._keys, prefix)
+            related = []
+            while index < len(self._keys) and self._keys[index].startswith(prefix):
+                related.extend(self._refs(self._keys[index]))
+                index += 1
+            # Sections using more of the members first
+            counts = {}
+            for ref in related:
+                counts[ref.page, ref.anchor] = counts.get((ref.page, ref.anchor), 0) + 1
+            ranked += sorted(related, key=lambda ref: (
+                KINDS.index(ref.kind), -counts[ref.page, ref.anchor], ref.page, ref.anchor
+            ))
+        seen = set()
+        unique = []
+        for ref in ranked:
+            if (ref.page, ref.anchor) not in seen:
+                seen.add((ref.page, ref.anchor))
+                unique.append(ref)
+        return unique[:limit] if limit else unique
+
+
+def docs_section(refs: List[DocRef]) -> str:
+    """Docstring lines listing refs."""
+    lines = ["Docs:"]
+    for ref in refs:
+        label = ref.title if ref.heading in ("", ref.title) else f"{ref.title}: {ref.heading}"
+        lines.append(f"    {label}")
+        lines.append(f"    {ref.link}")
+    return "\n".join(lines)
+
+
+def _with_docs(doc: str, refs: List[DocRef]) -> str:
+    if not refs:
+        return doc
+    return f"{doc}\n\n{docs_section(refs)}" if doc else docs_section(refs)
+
+
+def apply_docs_xref(module: StubModule, xref: DocsXref, limit: int = DOC_LINKS):
+    """Append the docs pages about each class and documented member to their docstrings."""
+    for cls in module.classes.values():
+        qualified = f"{module.name}.{cls.name}"
+        cls.doc = _with_docs(cls.doc, xref.refs(qualified, members=True, limit=limit))
+        for section in cls.sections:
+            for member in section.members:
+                # Class variables and attributes are emitted without docstrings
+                if member.kind in ("classvar", "attribute"):
+                    continue
+                member.doc = _with_docs(member.doc, xref.refs(f"{qualified}.{member.name}", limit=limit))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Show the docs sections that mention an API symbol.")
+    parser.add_argument("symbol", help="Qualified name such as aspose.pydrawing.Color.from_argb")
+    parser.add_argument(
+        "--xref",
+        default=str(XREF_PATH),
+        help=f"Index file (default: {XREF_PATH.relative_to(XREF_PATH.parents[1])})"
+    )
+    parser.add_argument(
+        "--members",
+        action="store_true",
+        help="Also list sections that mention members of the symbol"
+    )
+    parser.add_argument(
+        "--limit",
+        type=int,
+        default=None,
+        help="At most this many sections"
+    )
+    args = parser.parse_args()
+
+    xref = DocsXref(Path(args.xref))
+    try:
+        refs = xref.refs(args.symbol, args.members, args.limit)
+    except (OSError, ValueError) as e:
+        print(f"ERROR: {e}\nRun: python docs_refresh.py", file=sys.stderr)
+        sys.exit(2)
+    for ref in refs:
+        print(f"{ref.kind:<9}  {ref.symbol}  {ref.heading}  {ref.link}")
+    if not refs:
+        print(f"{args.symbol}: not mentioned in the docs", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+Check whether generated_stubs still matches the installed aspose.pydrawing.
+
+Instead of regenerating and diffing stubs, this compares two compact
+snapshots of the API surface, {module: {class: {member: kind}}}:
+
+    runtime  names and kinds only, collected by a single introspection
+             worker (cached per aspose-slides version, see introspect_cache.py)
+    stubs    parsed from the committed .pyi files with ast, nothing imported
+
+Kinds are "method", "property", "classvar", or "skipped" for members on the
+crash denylist, which are known to exist but never accessed or emitted, so
+they never count as drift.
+
+Stub classes without any members (placeholders from the name-only
+generator) are reported separately instead of listing every runtime member
+as added. The hand-written Rectangle and RectangleF (rectangle_stubs.py)
+list a curated subset of members with hand-picked decorators, so only
+their presence is checked, not their members. Classes and modules whose
+listing failed in the worker are reported as not introspected rather than
+as removed, and are left out of the runtime snapshot.
+
+The runtime snapshot is also saved to the versioned store (see
+api_snapshots.py).
+
+Exit status is 1 if anything drifted, so CI can gate on it.
+
+Usage:
+    python drift_check.py
+    python drift_check.py --json drift.json
+"""
+import argparse
+import ast
+import json
+import sys
+from pathlib import Path
+
+from crash_quarantine import CrashDenylist
+from introspect_cache import DEFAULT_CACHE_DIR, IntrospectionCache
+from rectangle_stubs import HAND_WRITTEN_CLASSES
+from stub_io import write_text_atomic
+
+STUB_ROOT = Path(__file__).parent / "generated_stubs"
+ROOT_MODULE = "aspose.pydrawing"
+
+# list_members() keys and the kinds they stand for
+LISTING_KINDS = {"methods": "method", "properties": "property", "classvars": "classvar", "skipped": "skipped"}
+
+
+def runtime_snapshot(root: str = ROOT_MODULE, cache=None, denylist=None, jobs: int = 1) -> tuple:
+    """
+    Names and kinds of every class member under root, from jobs workers,
+    and the modules and classes that could not be listed, which the
+    snapshot leaves out, as {qualified name: "module" or "class"}.
+    """
+    from introspect_pool import IntrospectionPool
+
+    snapshot = {}
+    failed = {}
+    with IntrospectionPool(workers=jobs, cache=cache, denylist=denylist, preload=root) as pool:
+        module_names, _ = pool.discover(root)
+        if not module_names:
+            raise RuntimeError(f"Could not import {root}")
+
+        class_lists = pool.map([{"op": "classes", "module": name} for name in module_names])
+        targets = [
+            (module_name, class_name)
+            for module_name, listing in zip(module_names, class_lists) if listing
+            for class_name in listing["classes"]
+        ]
+        for module_name, listing in zip(module_names, class_lists):
+            if listing:
+                snapshot[module_name] = {}
+            else:
+                failed[module_name] = "module"
+
+        payloads = ({"op": "members", "module": module, "class": name} for module, name in targets)
+        for (module_name, class_name), response in zip(targets, pool.imap(payloads)):
+            if not response:
+                failed[f"{module_name}.{class_name}"] = "class"
+                continue
+            members = {}
+            for key, kind in LISTING_KINDS.items():
+                for member in response["members"].get(key, []):
+                    members[member] = kind
+            snapshot[module_name][class_name] = dict(sorted(members.items()))
+
+    return snapshot, dict(sorted(failed.items()))
+
+
+def _member_kind(node) -> str:
+    """Kind of a class-body statement in a .pyi file, or None if it declares no public member."""
+    if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+        for decorator in node.decorator_list:
+            if isinstance(decorator, ast.Name) and decorator.id == "property":
+                return "property"
+            if isinstance(decorator, ast.Attribute) and decorator.attr in ("setter", "deleter"):
+                return "property"
+        return "method"
+    if isinstance(node, ast.AnnAssign) and isinstance(node.target, ast.Name):
+        annotation = node.annotation
+        if isinstance(annotation, ast.Subscript):
+            annotation = annotation.value
+        if isinstance(annotation, ast.Name) and annotation.id == "ClassVar":
+            return "classvar"
+        return "property"
+    if isinstance(node, ast.Assign):
+        return "classvar"
+    if isinstance(node, ast.ClassDef):
+        return "method"  # nested classes are callables at runtime
+    return None
+
+
+def _member_names(node) -> list:
+    if isinstance(node, ast.Assign):
+        return [target.id for target in node.targets if isinstance(target, ast.Name)]
+    if isinstance(node, ast.AnnAssign):
+        return [node.target.id]
+    return [node.name]
+
+
+def stub_snapshot(stub_root: Path = STUB_ROOT, root: str = ROOT_MODULE) -> dict:
+    """The same shape as runtime_snapshot(), parsed from the .pyi files under stub_root."""
+    package_dir = stub_root / Path(*root.split("."))
+    snapshot = {}
+    for path in sorted(package_dir.rglob("__init__.pyi")):
+        module_name = ".".join(path.parent.relative_to(stub_root).parts)
+        classes = {}
+        for node in ast.parse(path.read_text(), filename=str(path)).body:
+            if not isinstance(node, ast.ClassDef):
+                continue
+            members = {}
+            for statement in node.body:
+                kind = _member_kind(statement)
+                if kind is None:
+                    continue
+                for name in _member_names(statement):
+                    if not name.startswith("_"):
+                        members.setdefault(name, kind)
+            classes[node.name] = dict(sorted(members.items()))
+        snapshot[module_name] = dict(sorted(classes.items()))
+    return dict(sorted(snapshot.items()))
+
+
+def sorted_snapshot(snapshot: dict) -> dict:
+    """A snapshot with the keys of every level in sorted order, as diff_snapshots() needs."""
+    return {
+        module_name: {class_name: dict(sorted(members.items())) for class_name, members in sorted(classes.items())}
+        for module_name, classes in sorted(snapshot.items())
+    }
+
+
+def _merge(old: dict, new: dict):
+    """(key, old value, new value) over the union of two dicts whose keys are in sorted order, in one pass."""
+    old_items = iter(old.items())
+    new_items = iter(new.items())
+    a = next(old_items, None)
+    b = next(new_items, None)
+    while a is not None or b is not None:
+        if b is None or (a is not None and a[0] < b[0]):
+            yield a[0], a[1], None
+            a = next(old_items, None)
+        elif a is None or b[0] < a[0]:
+            yield b[0], None, b[1]
+            b = next(new_items, None)
+        else:
+            yield a[0], a[1], b[1]
+            a = next(old_items, None)
+            b = next(new_items, None)
+
+
+def diff_snapshots(old: dict, new: dict, exempt=(), failed=None) -> dict:
+    """
+    Changes from old to new, each list sorted by qualified name.
+
+    Both snapshots must list their keys in sorted order, as every snapshot
+    built here does, so the diff is a single merge pass; sorted_snapshot()
+    puts any other in order.
+    Classes that are empty in old but have members in new are listed under
+    "placeholders", and the qualified class names in exempt under "exempt";
+    the members of neither are compared. The modules and classes that could
+    not be introspected, failed as runtime_snapshot() returns it, are
+    listed under "failed" and never as added or removed.
+    """
+    failed = failed or {}
+    result = {
+        "added": [], "removed": [], "changed": [], "placeholders": [], "exempt": [],
+        "failed": [{"name": name, "kind": kind} for name, kind in sorted(failed.items())],
+    }
+    for module_name, old_classes, new_classes in _merge(old, new):
+        if module_name in failed:
+            continue
+        if old_classes is None or new_classes is None:
+            key = "added" if old_classes is None else "removed"
+            result[key].append({"name": module_name, "kind": "module"})
+            continue
+        for class_name, old_members, new_members in _merge(old_classes, new_classes):
+            qualified = f"{module_name}.{class_name}"
+            if qualified in failed:
+                continue
+            if old_members is None or new_members is None:
+                key = "added" if old_members is None else "removed"
+                result[key].append({"name": qualified, "kind": "class"})
+                continue
+            if not old_members and new_members:
+                result["placeholders"].append({"name": qualified, "members": len(new_members)})
+                continue
+            if qualified in exempt:
+                result["exempt"].append({"name": qualified})
+                continue
+            for member, old_kind, new_kind in _merge(old_members, new_members):
+                # Denylisted members are never accessed or emitted, so nothing is known to compare
+                if old_kind == new_kind or "skipped" in (old_kind, new_kind):
+                    continue
+                if old_kind is None:
+                    result["added"].append({"name": f"{qualified}.{member}", "kind": new_kind})
+                elif new_kind is None:
+                    result["removed"].append({"name": f"{qualified}.{member}", "kind": old_kind})
+                else:
+                    result["changed"].append({"name": f"{qualified}.{member}", "old": old_kind, "new": new_kind})
+    return result
+
+
+def has_drift(diff: dict) -> bool:
+    return bool(diff["added"] or diff["removed"] or diff["changed"])
+
+
+def print_diff(diff: dict, old_label: str = "stubs", new_label: str = "runtime"):
+    for entry in diff["added"]:
+        print(f"  + {entry['name']} ({entry['kind']}) only in {new_label}")
+    for entry in diff["removed"]:
+        print(f"  - {entry['name']} ({entry['kind']}) only in {old_label}")
+    for entry in diff["changed"]:
+        print(f"  ~ {entry['name']}: {entry['old']} in {old_label}, {entry['new']} in {new_label}")
+    for entry in diff["failed"]:
+        print(f"  ? {entry['name']} ({entry['kind']}) could not be introspected")
+    print()
+    exempt = f", {len(diff['exempt'])} hand-written" if diff["exempt"] else ""
+    failed = f", {len(diff['failed'])} not introspected" if diff["failed"] else ""
+    print(
+        f"{len(diff['added'])} added, {len(diff['removed'])} removed, {len(diff['changed'])} changed; "
+        f"{len(diff['placeholders'])} placeholder{exempt}{failed} classes not compared"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare generated_stubs with the installed aspose.pydrawing.")
+    parser.add_argument(
+        "--module",
+        default=ROOT_MODULE,
+        help=f"Root module to check (default: {ROOT_MODULE})"
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=str(DEFAULT_CACHE_DIR),
+        help=f"Introspection cache directory (default: {DEFAULT_CACHE_DIR})"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always introspect, ignoring and not updating the cache"
+    )
+    parser.add_argument(
+        "--json",
+        metavar="PATH",
+        help="Also write the drift report as JSON"
+    )
+    args = parser.parse_args()
+
+    cache = None if args.no_cache else IntrospectionCache(Path(args.cache_dir))
+    stubs = stub_snapshot(STUB_ROOT, args.module)
+    if not stubs:
+        print(f"ERROR: No stubs for {args.module} under {STUB_ROOT}", file=sys.stderr)
+        sys.exit(2)
+    try:
+        denylist = CrashDenylist()
+        runtime, failed = runtime_snapshot(args.module, cache, denylist)
+    except RuntimeError as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        sys.exit(2)
+
+    from api_snapshots import record_snapshot
+
+    record_snapshot(args.module, denylist=denylist, modules=runtime, failed=failed)
+    diff = diff_snapshots(stubs, runtime, HAND_WRITTEN_CLASSES, failed)
+    print(f"Drift between {STUB_ROOT.name} and the installed {args.module}:")
+    print_diff(diff)
+    if args.json:
+        write_text_atomic(Path(args.json), json.dumps(diff, indent=2) + "\n")
+
+    sys.exit(1 if has_drift(diff) else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,141 +1,115 @@
 #!/usr/bin/env python3
 """
 Enhance pydrawing stubs with detailed member info for key classes.
-Introspects one class at a time to handle crashes gracefully.
+Builds on the name-only models from generate_pydrawing_stubs_v2, replacing
+introspected classes in memory; running this script runs stub_pipeline.py
+up to this stage.
+Introspects classes in long-lived worker processes (see introspect_pool.py)
+so the .NET runtime is imported once per worker rather than once per class,
+and a crash only costs a worker respawn.
 """
-import subprocess
-import sys
-from pathlib import Path
-
-INTROSPECT_SCRIPT = '''
-import sys
-try:
-    import aspose.pydrawing as pd
-    cls = getattr(pd, "{class_name}")
-
-    members = []
-    for name in dir(cls):
-        if name.startswith('_'):
-            continue
-        try:
-            obj = getattr(cls, name)
-            obj_type = type(obj).__name__
-            is_callable = callable(obj)
-            is_class_attr = obj_type == "{class_name}"
-            members.append((name, "method" if is_callable else ("classvar" if is_class_attr else "property")))
-        except:
-            members.append((name, "property"))
-
-    for name, kind in sorted(members):
-        print(f"{{kind}}:{{name}}")
-except Exception as e:
-    print(f"ERROR:{{e}}", file=sys.stderr)
-    sys.exit(1)
-'''
-
-def introspect_class(class_name: str) -> dict:
-    """Introspect a single class in a subprocess."""
-    script = INTROSPECT_SCRIPT.format(class_name=class_name)
-
-    result = subprocess.run(
-        [sys.executable, "-c", script],
-        capture_output=True,
-        text=True,
-        timeout=10,
-        env={"DYLD_FALLBACK_LIBRARY_PATH": "/opt/homebrew/lib"}
-    )
-
-    if result.returncode != 0:
-        return None
-
-    members = {"methods": [], "properties": [], "classvars": []}
-    for line in result.stdout.strip().split('\n'):
-        if ':' in line:
-            kind, name = line.split(':', 1)
-            if kind == "method":
-                members["methods"].append(name)
-            elif kind == "classvar":
-                members["classvars"].append(name)
-            else:
-                members["properties"].append(name)
 
-    return members
+from crash_quarantine import CrashDenylist
+from generate_pydrawing_stubs_v2 import PYDRAWING_CLASSES, SUBMODULE_CLASSES
+from introspect_pool import IntrospectionPool
+from stub_model import StubClass, StubMember, StubModule, StubSection, emit_class
 
+KEY_CLASSES = [
+    'Color', 'Point', 'PointF', 'Size', 'SizeF',
+    'Rectangle', 'RectangleF', 'Font', 'Image', 'Bitmap',
+    'Pen', 'Brush', 'SolidBrush', 'Graphics'
+]
 
-def generate_detailed_stub(class_name: str, members: dict) -> str:
-    """Generate detailed stub for a class."""
-    lines = [
-        f"class {class_name}:",
-        f"    '''System.Drawing.{class_name} wrapper.'''",
-    ]
+
+def introspect_class(class_name: str, pool: IntrospectionPool = None, module_name: str = "aspose.pydrawing") -> dict:
+    """Introspect a single class in a worker process."""
+    if pool is None:
+        with IntrospectionPool() as pool:
+            return introspect_class(class_name, pool, module_name)
+    return pool.members(module_name, [class_name])[0]
+
+
+def detailed_class(class_name: str, members: dict) -> StubClass:
+    """Build the detailed model of a class from its member listing."""
+    cls = StubClass(name=class_name, doc=f"System.Drawing.{class_name} wrapper.")
 
     # Class variables (like Color.red, Color.blue)
     if members["classvars"]:
-        lines.append("    ")
-        lines.append("    # Named values")
-        for name in sorted(members["classvars"]):
-            lines.append(f"    {name}: ClassVar[{class_name}]")
+        cls.sections.append(StubSection("# Named values", [
+            StubMember(name, "classvar", type_hint=class_name) for name in sorted(members["classvars"])
+        ]))
 
     # Properties
     if members["properties"]:
-        lines.append("    ")
-        lines.append("    # Properties")
-        for name in sorted(members["properties"]):
-            lines.append(f"    @property")
-            lines.append(f"    def {name}(self) -> Any: ...")
+        cls.sections.append(StubSection("# Properties", [
+            StubMember(name, "property") for name in sorted(members["properties"])
+        ]))
 
     # Methods
     if members["methods"]:
-        lines.append("    ")
-        lines.append("    # Methods")
+        section = StubSection("# Methods")
         for name in sorted(members["methods"]):
             if name in ('from_argb', 'from_known_color', 'from_name'):
-                lines.append(f"    @staticmethod")
-                lines.append(f"    def {name}(*args) -> {class_name}: ...")
+                section.members.append(StubMember(name, "staticmethod", signature=f"(*args) -> {class_name}"))
             else:
-                lines.append(f"    def {name}(self, *args) -> Any: ...")
+                section.members.append(StubMember(name, "method"))
+        cls.sections.append(section)
 
-    if not any(members.values()):
-        lines.append("    ...")
+    if members.get("skipped"):
+        cls.notes.append(f"# NOTE: not introspected, crash the .NET wrapper: {', '.join(members['skipped'])}")
 
-    return '\n'.join(lines)
+    return cls
 
 
-def main():
-    key_classes = [
-        'Color', 'Point', 'PointF', 'Size', 'SizeF',
-        'Rectangle', 'RectangleF', 'Font', 'Image', 'Bitmap',
-        'Pen', 'Brush', 'SolidBrush', 'Graphics'
+def generate_detailed_stub(class_name: str, members: dict) -> str:
+    """Generate detailed stub for a class."""
+    return '\n'.join(emit_class(detailed_class(class_name, members)))
+
+
+def enhancement_targets(all_classes: bool = False) -> list:
+    """(module_name, class_names) pairs to introspect."""
+    targets = [("aspose.pydrawing", PYDRAWING_CLASSES if all_classes else KEY_CLASSES)]
+    if all_classes:
+        for sub_name, class_names in SUBMODULE_CLASSES.items():
+            targets.append((f"aspose.pydrawing.{sub_name}", class_names))
+    return targets
+
+
+def introspect_targets(targets: list, jobs: int = 1, cache=None) -> list:
+    """Member listings for every target class, one list per target."""
+    # One dispatch for every class of every module keeps all workers busy
+    payloads = [
+        {"op": "members", "module": module_name, "class": class_name}
+        for module_name, class_names in targets
+        for class_name in class_names
     ]
+    with IntrospectionPool(workers=jobs, cache=cache, denylist=CrashDenylist()) as pool:
+        responses = pool.map(payloads)
 
-    output_dir = Path(__file__).parent / "generated_stubs" / "aspose" / "pydrawing"
+    listings = []
+    offset = 0
+    for _, class_names in targets:
+        listings.append([r["members"] if r else None for r in responses[offset:offset + len(class_names)]])
+        offset += len(class_names)
+    return listings
 
-    detailed_stubs = {}
 
-    for class_name in key_classes:
-        print(f"Introspecting {class_name}...", end=" ", flush=True)
-        try:
-            members = introspect_class(class_name)
-            if members:
-                detailed_stubs[class_name] = generate_detailed_stub(class_name, members)
-                total = len(members["methods"]) + len(members["properties"]) + len(members["classvars"])
-                print(f"OK ({total} members)")
-            else:
-                print("FAILED")
-        except Exception as e:
-            print(f"ERROR: {e}")
+def enhance_module(module: StubModule, class_names: list, member_listings: list):
+    """Replace classes of a module model with their detailed versions."""
+    print(f"Introspected {len(class_names)} classes from {module.name}:")
+    for class_name, members in zip(class_names, member_listings):
+        if members:
+            module.replace_class(detailed_class(class_name, members))
+            total = len(members["methods"]) + len(members["properties"]) + len(members["classvars"])
+            print(f"  {class_name}: OK ({total} members)")
+        else:
+            print(f"  {class_name}: FAILED")
 
-    # Update main stub file with detailed versions
-    main_stub_path = output_dir / "__init__.pyi"
-    current_stub = main_stub_path.read_text()
 
-    for class_name, detailed in detailed_stubs.items():
-        # Replace the simple stub with the detailed one
-        simple_pattern = f"class {class_name}:\n    '''Wrapper for System.Drawing.{class_name}'''\n    def __init__(self, *args, **kwargs) -> None: ..."
-        current_stub = current_stub.replace(simple_pattern, detailed)
+def main():
+    import stub_pipeline
 
-    main_stub_path.write_text(current_stub)
-    print(f"\nUpdated: {main_stub_path}")
+    stub_pipeline.main(until="enhance")
 
 
 if __name__ == "__main__":
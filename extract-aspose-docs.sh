@@ -2,6 +2,10 @@
 # extract-aspose-docs.sh
 # Extracts Aspose.Slides documentation and keeps only Python via .NET docs
 # Usage: ./extract-aspose-docs.sh [zip_file]
+#
+# By default only the kept members are streamed out of the archive by
+# docs_extract.py; EXTRACT_MODE=unzip unzips everything to a temp directory
+# and copies the kept frameworks instead.
 
 set -e
 
@@ -11,6 +15,7 @@ EXTRACT_DIR="$SCRIPT_DIR/docs"
 
 # Frameworks to keep (only python-net for Aspose Slides Python via .NET)
 KEEP_FRAMEWORKS=("python-net")
+EXTRACT_MODE="${EXTRACT_MODE:-stream}"
 
 echo "=== Aspose Docs Extractor ==="
 echo "Zip file: $ZIP_FILE"
@@ -32,62 +37,77 @@ fi
 # Create fresh extraction directory
 mkdir -p "$EXTRACT_DIR"
 
-# Unzip to temp directory first
-TEMP_DIR=$(mktemp -d)
-echo "Extracting zip to temp directory..."
-unzip -q "$ZIP_FILE" -d "$TEMP_DIR"
-
-# Find the extracted folder (usually Aspose.Slides-Documentation-master)
-EXTRACTED_ROOT=$(find "$TEMP_DIR" -maxdepth 1 -type d -name "Aspose*" | head -1)
-
-if [ -z "$EXTRACTED_ROOT" ]; then
-    echo "Error: Could not find extracted Aspose folder"
-    rm -rf "$TEMP_DIR"
-    exit 1
-fi
+if [ "$EXTRACT_MODE" = "stream" ]; then
+    # Decompress only the kept frameworks, root _index.md and LICENSE, skipping api-reference
+    echo "Streaming selected frameworks from zip..."
+    FRAMEWORK_ARGS=()
+    for framework in "${KEEP_FRAMEWORKS[@]}"; do
+        FRAMEWORK_ARGS+=(--framework "$framework")
+    done
+    python3 "$SCRIPT_DIR/docs_extract.py" "$ZIP_FILE" "$EXTRACT_DIR" "${FRAMEWORK_ARGS[@]}" --prune api-reference
+else
+    # Unzip to temp directory first
+    TEMP_DIR=$(mktemp -d)
+    echo "Extracting zip to temp directory..."
+    unzip -q "$ZIP_FILE" -d "$TEMP_DIR"
+
+    # Find the extracted folder (usually Aspose.Slides-Documentation-master)
+    EXTRACTED_ROOT=$(find "$TEMP_DIR" -maxdepth 1 -type d -name "Aspose*" | head -1)
+
+    if [ -z "$EXTRACTED_ROOT" ]; then
+        echo "Error: Could not find extracted Aspose folder"
+        rm -rf "$TEMP_DIR"
+        exit 1
+    fi
 
-echo "Found extracted root: $EXTRACTED_ROOT"
+    echo "Found extracted root: $EXTRACTED_ROOT"
 
-# Check for English docs
-EN_DIR="$EXTRACTED_ROOT/en"
-if [ ! -d "$EN_DIR" ]; then
-    echo "Error: English docs directory not found"
-    rm -rf "$TEMP_DIR"
-    exit 1
-fi
+    # Check for English docs
+    EN_DIR="$EXTRACTED_ROOT/en"
+    if [ ! -d "$EN_DIR" ]; then
+        echo "Error: English docs directory not found"
+        rm -rf "$TEMP_DIR"
+        exit 1
+    fi
 
-# Create docs/en structure
-mkdir -p "$EXTRACT_DIR/en"
+    # Create docs/en structure
+    mkdir -p "$EXTRACT_DIR/en"
+
+    # Copy only the frameworks we want to keep
+    echo ""
+    echo "Copying selected frameworks..."
+    for framework in "${KEEP_FRAMEWORKS[@]}"; do
+        FRAMEWORK_DIR="$EN_DIR/$framework"
+        if [ -d "$FRAMEWORK_DIR" ]; then
+            echo "  Copying: $framework"
+            cp -r "$FRAMEWORK_DIR" "$EXTRACT_DIR/en/"
+        else
+            echo "  Warning: Framework not found: $framework"
+        fi
+    done
+
+    # Copy the root _index.md if it exists (but we'll create our own)
+    if [ -f "$EN_DIR/_index.md" ]; then
+        cp "$EN_DIR/_index.md" "$EXTRACT_DIR/en/"
+    fi
 
-# Copy only the frameworks we want to keep
-echo ""
-echo "Copying selected frameworks..."
-for framework in "${KEEP_FRAMEWORKS[@]}"; do
-    FRAMEWORK_DIR="$EN_DIR/$framework"
-    if [ -d "$FRAMEWORK_DIR" ]; then
-        echo "  Copying: $framework"
-        cp -r "$FRAMEWORK_DIR" "$EXTRACT_DIR/en/"
-    else
-        echo "  Warning: Framework not found: $framework"
+    # Copy LICENSE and README from root
+    if [ -f "$EXTRACTED_ROOT/LICENSE" ]; then
+        cp "$EXTRACTED_ROOT/LICENSE" "$EXTRACT_DIR/"
     fi
-done
 
-# Copy the root _index.md if it exists (but we'll create our own)
-if [ -f "$EN_DIR/_index.md" ]; then
-    cp "$EN_DIR/_index.md" "$EXTRACT_DIR/en/"
-fi
+    # Clean up temp directory
+    rm -rf "$TEMP_DIR"
 
-# Copy LICENSE and README from root
-if [ -f "$EXTRACTED_ROOT/LICENSE" ]; then
-    cp "$EXTRACTED_ROOT/LICENSE" "$EXTRACT_DIR/"
+    # Remove empty/useless directories
+    echo "Removing empty directories..."
+    rm -rf "$EXTRACT_DIR/en/python-net/api-reference"  # Just links to external docs
 fi
 
-# Clean up temp directory
-rm -rf "$TEMP_DIR"
-
-# Remove empty/useless directories
-echo "Removing empty directories..."
-rm -rf "$EXTRACT_DIR/en/python-net/api-reference"  # Just links to external docs
+# Refresh the search index and other derived artifacts; only pages whose
+# content changed since the last extraction are reprocessed
+echo "Refreshing docs artifacts..."
+python3 "$SCRIPT_DIR/docs_refresh.py" --docs-dir "$EXTRACT_DIR/en"
 
 # Count what we have
 MD_COUNT=$(find "$EXTRACT_DIR" -name "*.md" | wc -l | tr -d ' ')
@@ -1,12 +1,42 @@
 #!/usr/bin/env python3
 """
 Dynamically generate .pyi stubs for aspose.pydrawing by introspecting at runtime.
+
+With --namespace, every module reachable from another root (e.g. the whole
+aspose.slides namespace) is discovered and generated in worker processes.
+Each module is streamed to disk class by class, so memory stays bounded by
+the largest class rather than the namespace.
+
+Progress is journaled as classes finish; if a run is killed, the next run
+resumes where it stopped (see stub_journal.py), retrying a class that took
+the run down in a worker. Use --fresh to start over.
+
+Introspecting many classes grows a worker's memory as .NET proxies
+accumulate. --recycle-after and --max-worker-rss restart workers past a
+request count or resident size, and --track-memory reports the classes
+whose introspection grew their worker most.
 """
+import argparse
 import inspect
+import itertools
+import signal
 import sys
-from typing import Any, List, Set
+import types
+from typing import Any, Iterator, List, Optional, Tuple
 from pathlib import Path
 
+from crash_quarantine import CrashDenylist
+from instrumentation import PROFILER
+from introspect_cache import DEFAULT_CACHE_DIR, IntrospectionCache, aspose_slides_fingerprint
+from stub_fingerprint import canonical_lines, canonical_text, restamp, stub_fingerprint
+from stub_io import StreamingWriter, write_if_changed
+from stub_journal import JOURNAL_NAME, GenerationJournal
+from stub_manifest import write_manifest
+from stub_symbols import write_symbol_table
+from stub_model import namespace_stub_path, stub_path
+
+SUBMODULES = ['drawing2d', 'imaging', 'printing', 'text', 'design']
+
 
 def get_type_hint(obj: Any, name: str = "") -> str:
     """Try to infer a type hint for an object."""
@@ -49,7 +79,7 @@ def get_signature_str(func: Any, class_name: str = "") -> str:
             if pname == 'self':
                 params.append('self')
             elif param.annotation != inspect.Parameter.empty:
-                params.append(f"{pname}: {param.annotation}")
+                params.append(f"{pname}: {inspect.formatannotation(param.annotation)}")
             elif param.default != inspect.Parameter.empty:
                 default_type = get_type_hint(param.default)
                 params.append(f"{pname}: {default_type} = ...")
@@ -58,7 +88,7 @@ def get_signature_str(func: Any, class_name: str = "") -> str:
 
         return_hint = "Any"
         if sig.return_annotation != inspect.Signature.empty:
-            return_hint = str(sig.return_annotation)
+            return_hint = inspect.formatannotation(sig.return_annotation)
 
         return f"({', '.join(params)}) -> {return_hint}"
     except (ValueError, TypeError):
@@ -95,8 +125,123 @@ def safe_dir(obj) -> List[str]:
         return []
 
 
-def generate_class_stub(cls: type, indent: str = "") -> List[str]:
-    """Generate stub for a class."""
+# Read straight from the type slots so a metaclass __getattribute__ is never involved
+_type_mro = type.__dict__['__mro__'].__get__
+_type_dict = type.__dict__['__dict__'].__get__
+
+# Class __dict__ entries that are methods when looked up on the class
+_METHOD_TYPES = (
+    types.FunctionType,
+    types.BuiltinFunctionType,
+    types.MethodDescriptorType,
+    types.WrapperDescriptorType,
+)
+
+# Class __dict__ entries that are instance attributes when looked up on the class
+_PROPERTY_TYPES = (
+    property,
+    types.GetSetDescriptorType,
+    types.MemberDescriptorType,
+)
+
+
+def _lookup_static(cls: type, name: str) -> Any:
+    """
+    Find name in the __dict__ of cls or its bases without invoking descriptors.
+
+    Like inspect.getattr_static, but ignores the metaclass: an attribute that
+    only the metaclass provides has to go through getattr to get its value.
+    Raises AttributeError if no class in the MRO defines name.
+    """
+    for klass in _type_mro(cls):
+        namespace = _type_dict(klass)
+        if name in namespace:
+            return namespace[name]
+    raise AttributeError(name)
+
+
+def classify_member(cls: type, name: str) -> Tuple[str, Any]:
+    """
+    Classify a class member as "method", "property", "classvar" or "module".
+
+    Returns (kind, obj), where obj is what getattr(cls, name) would return,
+    or the descriptor itself for properties. Functions, method descriptors,
+    static/class methods, properties and plain values are classified from
+    the class __dict__ without touching the .NET wrapper. Only members
+    provided by the metaclass or by an unknown descriptor type are fetched
+    with getattr, which may raise.
+    """
+    try:
+        raw = _lookup_static(cls, name)
+    except AttributeError:
+        raw = None
+        ambiguous = True
+    else:
+        ambiguous = False
+        if isinstance(raw, staticmethod):
+            return "method", raw.__func__
+        if isinstance(raw, classmethod):
+            return "method", raw.__get__(None, cls)
+        if isinstance(raw, _METHOD_TYPES):
+            return "method", raw
+        if isinstance(raw, _PROPERTY_TYPES):
+            return "property", raw
+        # Any other descriptor may compute its value; only getattr can tell
+        ambiguous = hasattr(type(raw), '__get__')
+
+    if ambiguous:
+        with PROFILER.span(f"getattr:{name}"):
+            raw = getattr(cls, name)
+
+    if inspect.ismodule(raw):
+        return "module", raw
+    if type(raw).__name__ == cls.__name__:
+        return "classvar", raw
+    if callable(raw):
+        return "method", raw
+    return "property", raw
+
+
+def stub_member(cls: type, name: str, indent: str = "") -> Optional[Tuple[str, List[str]]]:
+    """
+    Stub lines for one class member as (kind, lines), or None if it is left out.
+
+    kind is "classvar", "property" or "method". This is all the per-member
+    work of generate_class_stub, so a crash probe of a single member
+    (introspect_worker.op_probe) touches the wrapper exactly as a stub does.
+    """
+    try:
+        kind, obj = classify_member(cls, name)
+    except:
+        return None
+    if obj is None or kind == "module":
+        return None
+
+    if kind == "classvar":
+        # Class attributes (like named colors)
+        return kind, [f"{indent}    {name}: ClassVar[{cls.__name__}]"]
+    if kind == "property":
+        type_hint = get_type_hint(obj, name)
+        return kind, [f"{indent}    @property", f"{indent}    def {name}(self) -> {type_hint}: ..."]
+
+    lines = []
+    sig = get_signature_str(obj, cls.__name__)
+    # Check if it looks like a static/class method
+    try:
+        if isinstance(inspect.getattr_static(cls, name), staticmethod):
+            lines.append(f"{indent}    @staticmethod")
+            sig = sig.replace("(self, ", "(").replace("(self)", "()")
+        elif isinstance(inspect.getattr_static(cls, name), classmethod):
+            lines.append(f"{indent}    @classmethod")
+            sig = sig.replace("(self", "(cls")
+    except:
+        pass
+    lines.append(f"{indent}    def {name}{sig}: ...")
+    return "method", lines
+
+
+def generate_class_stub(cls: type, indent: str = "", skip=()) -> List[str]:
+    """Generate stub for a class. Members in skip are known to crash and are never accessed."""
     lines = []
     class_name = cls.__name__
 
@@ -127,80 +272,42 @@ def generate_class_stub(cls: type, indent: str = "") -> List[str]:
     lines.append(f"{indent}    '''{doc}'''")
 
     # Get all member names first (safer than getting values)
-    member_names = safe_dir(cls)
+    with PROFILER.span("dir"):
+        member_names = safe_dir(cls)
+
+    skipped = [name for name in member_names if name in skip]
+    if skipped:
+        member_names = [name for name in member_names if name not in skip]
+        lines.append(f"{indent}    # NOTE: not introspected, crash the .NET wrapper: {', '.join(skipped)}")
 
     if not member_names:
         lines.append(f"{indent}    ...")
         return lines
 
-    # Separate properties and methods by checking names only first
-    properties = []
-    methods = []
-    class_attrs = []  # For static/class attributes like Color.red
-
+    # Separate properties and methods, from the class __dict__ where possible
+    stubs = {"classvar": [], "property": [], "method": []}
     for name in member_names:
-        try:
-            obj = safe_getattr(cls, name)
-            if obj is None:
-                continue
+        stub = stub_member(cls, name, indent)
+        if stub is not None:
+            stubs[stub[0]].append((name, stub[1]))
 
-            # Skip submodules
-            if inspect.ismodule(obj):
-                continue
-
-            # Check if it's a class-level attribute (like Color.red)
-            # Be careful with isinstance checks as they can crash
-            obj_type = type(obj).__name__
-            if obj_type == class_name:
-                class_attrs.append((name, class_name))
-            elif callable(obj):
-                methods.append((name, obj))
-            else:
-                properties.append((name, obj))
-        except Exception as e:
-            # If we can't inspect it, assume it's a property
-            properties.append((name, None))
-
-    # Generate class attributes (like named colors)
-    if class_attrs:
-        lines.append(f"{indent}    # Class attributes")
-        for name, type_name in sorted(class_attrs, key=lambda x: x[0]):
-            lines.append(f"{indent}    {name}: ClassVar[{type_name}]")
-        lines.append("")
-
-    # Generate properties
-    if properties:
-        lines.append(f"{indent}    # Properties")
-        for name, obj in sorted(properties, key=lambda x: x[0]):
-            type_hint = get_type_hint(obj, name)
-            lines.append(f"{indent}    @property")
-            lines.append(f"{indent}    def {name}(self) -> {type_hint}: ...")
-        lines.append("")
-
-    # Generate methods
-    if methods:
-        lines.append(f"{indent}    # Methods")
-        for name, obj in sorted(methods, key=lambda x: x[0]):
-            sig = get_signature_str(obj, class_name)
-            # Check if it looks like a static/class method
-            try:
-                if isinstance(inspect.getattr_static(cls, name), staticmethod):
-                    lines.append(f"{indent}    @staticmethod")
-                    sig = sig.replace("(self, ", "(").replace("(self)", "()")
-                elif isinstance(inspect.getattr_static(cls, name), classmethod):
-                    lines.append(f"{indent}    @classmethod")
-                    sig = sig.replace("(self", "(cls")
-            except:
-                pass
-            lines.append(f"{indent}    def {name}{sig}: ...")
-
-    if not (properties or methods or class_attrs):
+    for kind, comment in (("classvar", "# Class attributes"), ("property", "# Properties"), ("method", "# Methods")):
+        if not stubs[kind]:
+            continue
+        lines.append(f"{indent}    {comment}")
+        for _, member_lines in sorted(stubs[kind], key=lambda x: x[0]):
+            lines.extend(member_lines)
+        # The last section needs no separating blank line
+        if kind != "method":
+            lines.append("")
+
+    if not any(stubs.values()):
         lines.append(f"{indent}    ...")
 
     return lines
 
 
-def generate_enum_stub(cls: type, indent: str = "") -> List[str]:
+def generate_enum_stub(cls: type, indent: str = "", skip=()) -> List[str]:
     """Generate stub for an enum-like class."""
     lines = []
     class_name = cls.__name__
@@ -208,14 +315,15 @@ def generate_enum_stub(cls: type, indent: str = "") -> List[str]:
     lines.append(f"{indent}class {class_name}:")
     lines.append(f"{indent}    '''Enumeration of {class_name} values.'''")
 
+    # Names are enough; enum values are never materialized
     members = []
     try:
-        members = [(name, getattr(cls, name)) for name in dir(cls)
-                   if not name.startswith('_') and name.isupper()]
+        members = [name for name in dir(cls)
+                   if not name.startswith('_') and name.isupper() and name not in skip]
     except:
         pass
 
-    for name, obj in sorted(members, key=lambda x: x[0]):
+    for name in sorted(members):
         lines.append(f"{indent}    {name}: ClassVar[{class_name}]")
 
     if not members:
@@ -224,22 +332,8 @@ def generate_enum_stub(cls: type, indent: str = "") -> List[str]:
     return lines
 
 
-def generate_module_stub(module: Any, module_name: str) -> str:
-    """Generate complete stub for a module."""
-    lines = [
-        '"""',
-        f'Type stubs for {module_name}',
-        'Auto-generated by introspection.',
-        '"""',
-        'from typing import Any, List, Dict, Optional, ClassVar, overload, Tuple, Union',
-        'import io',
-        '',
-    ]
-
-    # Collect imports needed
-    imports: Set[str] = set()
-
-    # Get all module members
+def collect_module_members(module: Any) -> Tuple[list, list, list, list]:
+    """Split a module's public members into submodules, constants, functions and classes."""
     classes = []
     functions = []
     constants = []
@@ -265,6 +359,21 @@ def generate_module_stub(module: Any, module_name: str) -> str:
         except:
             pass
 
+    return submodules, constants, functions, classes
+
+
+def generate_module_header(module_name: str, submodules: list, constants: list, functions: list) -> List[str]:
+    """Generate everything in a module stub that precedes the classes."""
+    lines = [
+        '"""',
+        f'Type stubs for {module_name}',
+        'Auto-generated by introspection.',
+        '"""',
+        'from typing import Any, List, Dict, Optional, ClassVar, overload, Tuple, Union',
+        'import io',
+        '',
+    ]
+
     # Add submodule imports
     if submodules:
         for sub in sorted(submodules):
@@ -291,55 +400,473 @@ def generate_module_stub(module: Any, module_name: str) -> str:
             lines.append("    ...")
         lines.append("")
 
-    # Generate classes
-    if classes:
-        lines.append("# Classes")
-        for name, cls in sorted(classes, key=lambda x: x[0]):
-            try:
-                # Check if it's enum-like
-                members = safe_dir(cls)
-                upper_members = [m for m in members if m.isupper() or m.replace('_', '').isupper()]
+    return lines
 
-                if len(upper_members) > len(members) * 0.5 and len(members) < 50:
-                    lines.extend(generate_enum_stub(cls))
-                else:
-                    lines.extend(generate_class_stub(cls))
-                lines.append("")
-            except Exception as e:
-                lines.append(f"# class {name}: Error generating stub: {e}")
-                lines.append(f"class {name}: ...")
-                lines.append("")
 
-    return '\n'.join(lines)
+def generate_class_block(name: str, cls: type, skip=()) -> List[str]:
+    """Generate the stub for one module-level class, followed by a blank line."""
+    lines = []
+    try:
+        # Check if it's enum-like
+        members = safe_dir(cls)
+        upper_members = [m for m in members if m.isupper() or m.replace('_', '').isupper()]
+
+        if len(upper_members) > len(members) * 0.5 and len(members) < 50:
+            lines.extend(generate_enum_stub(cls, skip=skip))
+        else:
+            lines.extend(generate_class_stub(cls, skip=skip))
+        lines.append("")
+    except Exception as e:
+        lines = [
+            f"# class {name}: Error generating stub: {e}",
+            f"class {name}: ...",
+            "",
+        ]
+    return lines
+
+
+def crashed_block(name: str) -> List[str]:
+    """Placeholder for a class whose introspection kept crashing its worker."""
+    return [f"# class {name}: Worker crashed generating stub", f"class {name}: ...", ""]
+
 
+def isolated_class_block(module_name: str, name: str, denylist=None) -> List[str]:
+    """
+    Stub lines for a class generated in a worker process, so a crash costs
+    the worker rather than this process. A class that keeps crashing is
+    bisected to the members at fault, which are denylisted and skipped.
+    """
+    from introspect_pool import IntrospectionPool
 
-def generate_pydrawing_stubs(output_dir: Path):
-    """Generate all pydrawing stubs."""
-    import aspose.pydrawing as pydrawing
+    with IntrospectionPool(denylist=denylist, preload=module_name) as pool:
+        block = pool.map([{"op": "class_block", "module": module_name, "class": name}])[0]
+    return block["lines"] if block else crashed_block(name)
 
+
+def iter_module_stub(module: Any, module_name: str, journal=None, denylist=None) -> Iterator[str]:
+    """
+    Generate the lines of a module stub, one class at a time.
+
+    With a journal, finished classes are reused and each class is
+    checkpointed before and after it is introspected (see stub_journal.py);
+    one that took a previous run down is retried in a worker instead.
+    Members on the crash denylist are skipped, as in the worker processes.
+    """
+    submodules, constants, functions, classes = collect_module_members(module)
+    yield from generate_module_header(module_name, submodules, constants, functions)
+
+    # Generate classes
+    if classes:
+        yield "# Classes"
+        for name, cls in sorted(classes, key=lambda x: x[0]):
+            block = journal.class_block(module_name, name) if journal else None
+            if block is None and journal and journal.crashed(module_name, name):
+                print(f"  Retrying {module_name}.{name} in a worker: it crashed the previous run")
+                with PROFILER.span(f"class:{module_name}.{name}"):
+                    block = isolated_class_block(module_name, name, denylist)
+                journal.record_class(module_name, name, block)
+            elif block is None:
+                if journal:
+                    journal.record_start(module_name, name)
+                try:
+                    with PROFILER.span(f"class:{module_name}.{name}"):
+                        skip = denylist.members(module_name, name) if denylist is not None else ()
+                        block = generate_class_block(name, cls, skip)
+                except BaseException:
+                    # Interrupted, not crashed: the next run introspects the class again
+                    if journal:
+                        journal.record_abort(module_name, name)
+                    raise
+                if journal:
+                    journal.record_class(module_name, name, block)
+            yield from block
+
+
+def generate_module_stub(module: Any, module_name: str) -> str:
+    """Generate complete stub for a module."""
+    return '\n'.join(iter_module_stub(module, module_name))
+
+
+def _class_blocks(pool, module_name: str, class_names: List[str], journal=None) -> Iterator[List[str]]:
+    """
+    Stub lines for each class in order: from the journal where a previous
+    run finished it, otherwise from the pool, checkpointing as they arrive.
+    """
+    todo = [name for name in class_names if journal is None or not journal.has_class(module_name, name)]
+    fetched = pool.imap({"op": "class_block", "module": module_name, "class": name} for name in todo)
+    for name in class_names:
+        lines = journal.class_block(module_name, name) if journal else None
+        if lines is None:
+            block = next(fetched)
+            lines = block["lines"] if block else crashed_block(name)
+            if journal:
+                journal.record_class(module_name, name, lines)
+        yield lines
+    fetched.close()
+
+
+def generate_module_stubs_parallel(
+    module_names: List[str],
+    jobs: int,
+    cache=None,
+    denylist=None,
+    journal=None,
+    recycle_after: int = None,
+    max_rss: int = None,
+    track_memory: bool = False
+) -> dict:
+    """
+    Generate stubs for several modules with classes spread over worker processes.
+
+    Headers and class blocks are produced by the same functions as the serial
+    path and reassembled in sorted order, so the output is byte-identical.
+    Returns {module_name: stub_text} for every module that could be imported.
+    Results found in the cache are reused without starting a worker, and
+    members on the crash denylist are skipped (see crash_quarantine.py).
+    With a journal, classes finished by an interrupted run are reused.
+    recycle_after, max_rss and track_memory are passed to the pool.
+    """
+    from introspect_pool import IntrospectionPool
+
+    stubs = {}
+    with IntrospectionPool(
+        workers=jobs, cache=cache, denylist=denylist,
+        recycle_after=recycle_after, max_rss=max_rss, track_memory=track_memory
+    ) as pool:
+        headers = pool.map([{"op": "module_header", "module": name} for name in module_names])
+
+        for module_name, header in zip(module_names, headers):
+            if header is None:
+                continue
+            lines = list(header["header"])
+            if header["classes"]:
+                lines.append("# Classes")
+                for block in _class_blocks(pool, module_name, sorted(header["classes"]), journal):
+                    lines.extend(block)
+            stubs[module_name] = '\n'.join(lines)
+
+    if track_memory:
+        print_memory_report(pool.memory_report())
+    return stubs
+
+
+def print_memory_report(report: dict):
+    """Print worker memory use and the classes that grew their worker most."""
+    print(f"Worker memory: peak RSS {report['peak_rss'] / 2**20:.1f} MiB, "
+          f"recycled {report['recycles']['rss']}x for memory and {report['recycles']['requests']}x for requests")
+    if report["top_leakers"]:
+        print("Classes that grew their worker most (RSS / traced Python):")
+        for entry in report["top_leakers"]:
+            print(f"  {entry['class']}: {entry['rss_delta'] / 2**10:+.0f} KiB / {entry['traced_delta'] / 2**10:+.0f} KiB")
+
+
+def write_stub_lines(path: Path, lines: Iterator[str], output_dir: Path, fingerprint: str = ""):
+    """
+    Stream lines to path in canonical form, headed by fingerprint, leaving
+    it untouched if unchanged.
+    """
+    count = 0
+    with StreamingWriter(path) as out:
+        for line in canonical_lines(itertools.chain([fingerprint], lines)):
+            out.write(f"\n{line}" if count else line)
+            count += 1
+    # Not counting the final "" that ends the file with a newline
+    count = max(count - 1, 0)
+    if out.changed:
+        print(f"  Written: {path.relative_to(output_dir)} ({count} lines)")
+    else:
+        print(f"  Unchanged: {path.relative_to(output_dir)}")
+
+
+def generate_namespace_stubs(
+    root: str,
+    output_root: Path,
+    jobs: int = 1,
+    cache=None,
+    denylist=None,
+    recycle_after: int = 500,
+    journal=None,
+    max_rss: int = None,
+    track_memory: bool = False
+) -> List[str]:
+    """
+    Generate stubs for root and every module below it, in worker processes.
+
+    Modules are discovered breadth first, one request per module, so a
+    module whose import crashes a worker is skipped. Each module's class
+    blocks are requested in order, at most a bounded window ahead, and
+    written as they arrive, so neither this process nor the output grows
+    with the size of the namespace. Workers are recycled after
+    recycle_after requests, or once their RSS reaches max_rss bytes, to cap
+    their memory; track_memory adds traced Python allocations to the
+    per-class memory report. With a journal, modules and
+    classes finished by an interrupted run are not generated again.
+    Every stub is headed by the fingerprint of the denylist finally applied,
+    and the manifest and symbol table of the root stub directory are
+    written last. Returns the module names.
+    """
+    from introspect_pool import IntrospectionPool
+
+    denylist = denylist or CrashDenylist()
+    aspose = aspose_slides_fingerprint()
+    applied = dict(denylist.items())
+    fingerprint = stub_fingerprint(applied, aspose)
+    with IntrospectionPool(
+        workers=jobs, cache=cache, denylist=denylist, preload=root,
+        recycle_after=recycle_after, max_rss=max_rss, track_memory=track_memory
+    ) as pool:
+        module_names, failed = pool.discover(root)
+        if not module_names:
+            raise RuntimeError(f"Could not import {root}")
+        print(f"Discovered {len(module_names)} modules under {root}")
+        for module_name in failed:
+            print(f"  SKIPPED: {module_name} (import failed or crashed the worker)")
+
+        for module_name in module_names:
+            path = namespace_stub_path(output_root, module_name)
+            if journal and journal.module_done(module_name) and path.exists():
+                continue
+            with PROFILER.span(f"module:{module_name}"):
+                header = pool.map([{"op": "module_header", "module": module_name}])[0]
+                if header is None:
+                    print(f"  FAILED: {module_name}")
+                    continue
+                path.parent.mkdir(parents=True, exist_ok=True)
+                write_stub_lines(path, _stream_module(pool, module_name, header, journal), output_root, fingerprint)
+            if journal:
+                journal.record_module(module_name)
+
+    # Quarantine may have grown the denylist while modules were streamed out
+    if dict(denylist.items()) != applied:
+        fingerprint = stub_fingerprint(dict(denylist.items()), aspose)
+    restamp_stubs([namespace_stub_path(output_root, name) for name in module_names], fingerprint, output_root)
+    stub_dir = output_root / Path(*root.split("."))
+    write_manifest(stub_dir)
+    write_symbol_table(stub_dir, root)
+    if track_memory:
+        print_memory_report(pool.memory_report())
+    return module_names
+
+
+def _stream_module(pool, module_name: str, header: dict, journal=None) -> Iterator[str]:
+    """Lines of a module stub from its header and class blocks fetched through pool."""
+    yield from header["header"]
+    if not header["classes"]:
+        return
+    yield "# Classes"
+    for block in _class_blocks(pool, module_name, sorted(header["classes"]), journal):
+        yield from block
+
+
+def restamp_stubs(paths: List[Path], fingerprint: str, output_dir: Path):
+    """
+    Head the stubs at paths with fingerprint where they were written under
+    another one, earlier in the run or by an interrupted run.
+    """
+    for path in paths:
+        if restamp(path, fingerprint):
+            print(f"  Restamped: {path.relative_to(output_dir)}")
+
+
+def write_stub(path: Path, stub: str, output_dir: Path, fingerprint: str = ""):
+    """
+    Write a stub atomically in canonical form, headed by fingerprint, leaving
+    it untouched if its content is unchanged.
+    """
+    stub = canonical_text([fingerprint, *stub.split("\n")])
+    if write_if_changed(path, stub):
+        print(f"  Written: {path.relative_to(output_dir)} ({len(stub.splitlines())} lines)")
+    else:
+        print(f"  Unchanged: {path.relative_to(output_dir)}")
+
+
+def generate_pydrawing_stubs(
+    output_dir: Path,
+    jobs: int = 1,
+    cache=None,
+    denylist=None,
+    journal=None,
+    recycle_after: int = None,
+    max_rss: int = None,
+    track_memory: bool = False
+):
+    """
+    Generate all pydrawing stubs.
+
+    With jobs > 1, a cache or any memory option, introspection runs in
+    worker processes, which also quarantine crashing members into the
+    denylist and are recycled after recycle_after requests or max_rss
+    bytes of RSS; otherwise everything happens in this process, skipping
+    denylisted members all the same. With a journal, modules and classes
+    finished by an interrupted run are reused (see stub_journal.py).
+    Every file starts with the fingerprint of its inputs, including the
+    denylist as it stands once the run is over.
+    """
     output_dir.mkdir(parents=True, exist_ok=True)
+    all_modules = ["aspose.pydrawing"] + [f"aspose.pydrawing.{sub}" for sub in SUBMODULES]
+    denylist = denylist or CrashDenylist()
+    aspose = aspose_slides_fingerprint()
+
+    def done(module_name):
+        return journal is not None and journal.module_done(module_name) and stub_path(output_dir, module_name).exists()
+
+    def finish(fingerprint):
+        # Modules reused from an interrupted run may carry an older denylist
+        restamp_stubs([stub_path(output_dir, name) for name in all_modules], fingerprint, output_dir)
+        write_manifest(output_dir)
+        write_symbol_table(output_dir)
+
+    if jobs > 1 or cache is not None or recycle_after or max_rss or track_memory:
+        module_names = [name for name in all_modules if not done(name)]
+        print(f"Generating stubs for {len(module_names)} modules with {jobs} jobs...")
+        stubs = generate_module_stubs_parallel(
+            module_names, jobs, cache, denylist, journal, recycle_after, max_rss, track_memory
+        )
+        fingerprint = stub_fingerprint(dict(denylist.items()), aspose)
+        for module_name, stub in stubs.items():
+            path = stub_path(output_dir, module_name)
+            path.parent.mkdir(exist_ok=True)
+            write_stub(path, stub, output_dir, fingerprint)
+            if journal:
+                journal.record_module(module_name)
+        finish(fingerprint)
+        if cache is not None:
+            print(f"Cache: {cache.hits} hits, {cache.misses} misses")
+        return
+
+    with PROFILER.span("import aspose.pydrawing"):
+        import aspose.pydrawing as pydrawing
+    applied = dict(denylist.items())
+    fingerprint = stub_fingerprint(applied, aspose)
 
     # Main module
-    print("Generating aspose.pydrawing stubs...")
-    main_stub = generate_module_stub(pydrawing, "aspose.pydrawing")
-    (output_dir / "__init__.pyi").write_text(main_stub)
-    print(f"  Written: __init__.pyi ({len(main_stub.splitlines())} lines)")
+    if not done("aspose.pydrawing"):
+        print("Generating aspose.pydrawing stubs...")
+        with PROFILER.span("module:aspose.pydrawing"):
+            main_stub = '\n'.join(iter_module_stub(pydrawing, "aspose.pydrawing", journal, denylist))
+        write_stub(output_dir / "__init__.pyi", main_stub, output_dir, fingerprint)
+        if journal:
+            journal.record_module("aspose.pydrawing")
 
     # Submodules
-    submodules = ['drawing2d', 'imaging', 'printing', 'text', 'design']
-    for sub_name in submodules:
-        if hasattr(pydrawing, sub_name):
+    for sub_name in SUBMODULES:
+        if hasattr(pydrawing, sub_name) and not done(f"aspose.pydrawing.{sub_name}"):
             sub_module = getattr(pydrawing, sub_name)
             sub_dir = output_dir / sub_name
             sub_dir.mkdir(exist_ok=True)
 
             print(f"Generating aspose.pydrawing.{sub_name} stubs...")
-            sub_stub = generate_module_stub(sub_module, f"aspose.pydrawing.{sub_name}")
-            (sub_dir / "__init__.pyi").write_text(sub_stub)
-            print(f"  Written: {sub_name}/__init__.pyi ({len(sub_stub.splitlines())} lines)")
+            with PROFILER.span(f"module:aspose.pydrawing.{sub_name}"):
+                sub_stub = '\n'.join(iter_module_stub(sub_module, f"aspose.pydrawing.{sub_name}", journal, denylist))
+            write_stub(sub_dir / "__init__.pyi", sub_stub, output_dir, fingerprint)
+            if journal:
+                journal.record_module(f"aspose.pydrawing.{sub_name}")
+
+    # A class retried in a worker may have grown the denylist
+    if dict(denylist.items()) != applied:
+        fingerprint = stub_fingerprint(dict(denylist.items()), aspose)
+    finish(fingerprint)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate aspose.pydrawing stubs by runtime introspection.")
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=1,
+        help="Number of worker processes for per-class introspection (default: 1)"
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=str(DEFAULT_CACHE_DIR),
+        help=f"Introspection cache directory (default: {DEFAULT_CACHE_DIR})"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always introspect; with --jobs 1 this runs everything in-process"
+    )
+    parser.add_argument(
+        "--namespace",
+        metavar="MODULE",
+        help="Generate every module under MODULE (e.g. aspose.slides) into generated_stubs/"
+    )
+    parser.add_argument(
+        "--recycle-after",
+        type=int,
+        help="Restart a worker after this many requests, 0 for never (default: 500 with --namespace, never otherwise)"
+    )
+    parser.add_argument(
+        "--max-worker-rss",
+        type=int,
+        metavar="MIB",
+        help="Restart a worker once its resident memory reaches this many MiB"
+    )
+    parser.add_argument(
+        "--track-memory",
+        action="store_true",
+        help="Trace Python allocations in workers and report the classes that leak most"
+    )
+    parser.add_argument(
+        "--fresh",
+        action="store_true",
+        help="Start over instead of resuming an interrupted run from its journal"
+    )
+    parser.add_argument(
+        "--snapshot",
+        action="store_true",
+        help="Also save the API snapshot of the installed aspose-slides, introspecting it again (see api_snapshots.py)"
+    )
+    parser.add_argument(
+        "--profile",
+        metavar="REPORT_JSON",
+        help="Write a JSON timing report (and a .collapsed flamegraph file next to it)"
+    )
+    args = parser.parse_args()
+
+    if args.profile:
+        PROFILER.enable()
+    # Unwind on SIGTERM like on Ctrl-C, so the class in flight is journaled as aborted, not crashed
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(128 + signum))
+
+    cache = None if args.no_cache else IntrospectionCache(Path(args.cache_dir))
+    max_rss = args.max_worker_rss * 2**20 if args.max_worker_rss else None
+    if args.namespace:
+        output_dir = Path(__file__).parent / "generated_stubs"
+        journal = GenerationJournal(output_dir / JOURNAL_NAME, f"namespace:{args.namespace}", fresh=args.fresh)
+    else:
+        output_dir = Path(__file__).parent / "generated_stubs" / "aspose" / "pydrawing"
+        journal = GenerationJournal(output_dir / JOURNAL_NAME, "aspose.pydrawing", fresh=args.fresh)
+    if journal.resumed:
+        print(f"Resuming interrupted run: {journal.summary()}")
+
+    if args.namespace:
+        # 0 is a valid choice (never recycle), not a request for the default
+        recycle_after = 500 if args.recycle_after is None else args.recycle_after
+        with PROFILER.span("generate_namespace_stubs"):
+            generate_namespace_stubs(
+                args.namespace, output_dir, jobs=args.jobs, cache=cache,
+                denylist=CrashDenylist(), recycle_after=recycle_after, journal=journal,
+                max_rss=max_rss, track_memory=args.track_memory
+            )
+        if cache is not None:
+            print(f"Cache: {cache.hits} hits, {cache.misses} misses")
+    else:
+        with PROFILER.span("generate_pydrawing_stubs"):
+            generate_pydrawing_stubs(
+                output_dir, jobs=args.jobs, cache=cache, journal=journal,
+                recycle_after=args.recycle_after, max_rss=max_rss, track_memory=args.track_memory
+            )
+    journal.complete()
+    if args.snapshot:
+        from api_snapshots import record_snapshot  # not needed by introspection workers
+
+        record_snapshot(args.namespace or "aspose.pydrawing", cache=cache, jobs=args.jobs)
+    print(f"\nStubs written to: {output_dir}")
+
+    if args.profile:
+        PROFILER.write_report(Path(args.profile))
 
 
 if __name__ == "__main__":
-    output_dir = Path(__file__).parent / "generated_stubs" / "aspose" / "pydrawing"
-    generate_pydrawing_stubs(output_dir)
-    print(f"\nStubs written to: {output_dir}")
+    main()
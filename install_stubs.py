@@ -6,6 +6,14 @@ This script copies the generated .pyi stubs to complete the empty stubs
 that ship with aspose-slides, making full type information available
 to IDEs and coding agents.
 
+A receipt of installed file hashes is kept in the target aspose/pydrawing,
+so a reinstall only copies files whose content changed (see stub_manifest.py).
+Files are placed with a copy-on-write reflink where the filesystem allows and
+copied otherwise; --link hardlink shares them with generated_stubs outright.
+Several environments are installed concurrently.
+For environments managed by pip, the stub-only wheel from build_stub_wheel.py
+is an alternative that leaves the aspose-slides files untouched.
+
 Usage:
     # Install to current environment
     python install_stubs.py
@@ -13,16 +21,36 @@ Usage:
     # Install to specific venv
     python install_stubs.py /path/to/venv
 
+    # Install to many venvs concurrently (globs are expanded)
+    python install_stubs.py ~/venvs/* ".tox/*" --jobs 16
+
+    # Share storage with generated_stubs via hardlinks (in-place edits
+    # to either side then show up in both)
+    python install_stubs.py --link hardlink
+
+    # Always copy
+    python install_stubs.py --link copy
+
     # Install to specific site-packages
     python install_stubs.py --site-packages /path/to/site-packages
 
     # Dry run (show what would be copied)
     python install_stubs.py --dry-run
+
+    # Write a timing report
+    python install_stubs.py --profile install-profile.json
 """
 import argparse
+import glob
 import shutil
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import List
+
+from instrumentation import PROFILER
+from stub_io import LINK_MODES, content_hash, link_or_copy
+from stub_manifest import classify, load_manifest, load_receipt, receipt_entry, write_receipt
 
 
 def find_site_packages(venv_path: Path = None) -> Path:
@@ -63,10 +91,8 @@ def get_stub_source() -> Path:
     if not stub_dir.exists():
         raise FileNotFoundError(
             f"Generated stubs not found at {stub_dir}\n"
-            "Run the stub generators first:\n"
-            "  python generate_pydrawing_stubs_v2.py\n"
-            "  python enhance_stubs.py\n"
-            "  python rectangle_stubs.py"
+            "Run the stub pipeline first:\n"
+            "  python stub_pipeline.py"
         )
     return stub_dir
 
@@ -80,73 +106,190 @@ def backup_existing(target_path: Path) -> Path:
     return None
 
 
+def empty_results() -> dict:
+    return {
+        "installed": [],
+        "up_to_date": [],
+        "skipped": [],
+        "backed_up": [],
+        "errors": []
+    }
+
+
 def install_stubs(
     site_packages: Path,
     dry_run: bool = False,
-    force: bool = False
+    force: bool = False,
+    link: str = "auto",
+    manifest: dict = None,
+    log=print
 ) -> dict:
     """
     Install generated stubs to the target site-packages.
 
+    Files are classified from the stub manifest and the install receipt
+    (see stub_manifest.py); only missing, changed and accepted foreign
+    files are copied. manifest may be passed in to share one load between
+    environments; log receives every output line.
+
     Returns a dict with installation results.
     """
-    results = {
-        "installed": [],
-        "skipped": [],
-        "backed_up": [],
-        "errors": []
-    }
+    results = empty_results()
 
     stub_source = get_stub_source()
     target_base = find_aspose_pydrawing(site_packages)
 
-    # Collect all .pyi files to install
-    stub_files = list(stub_source.rglob("*.pyi"))
+    with PROFILER.span("manifest"):
+        if manifest is None:
+            manifest = load_manifest(stub_source)
+        receipt = load_receipt(target_base)
+
+    log(f"Source: {stub_source}")
+    log(f"Target: {target_base}")
+    log(f"Files to install: {len(manifest)}")
+    log()
+
+    new_receipt = {}
+    for rel_path, wanted in manifest.items():
+        with PROFILER.span(f"file:{rel_path}"):
+            entry = install_file(
+                stub_source / rel_path, target_base / rel_path, rel_path,
+                wanted, receipt.get(rel_path), results, dry_run, force, link, log
+            )
+        if entry:
+            new_receipt[rel_path] = entry
+
+    if not dry_run and new_receipt != receipt:
+        write_receipt(target_base, new_receipt)
 
-    print(f"Source: {stub_source}")
-    print(f"Target: {target_base}")
-    print(f"Files to install: {len(stub_files)}")
-    print()
+    return results
 
-    for stub_file in stub_files:
-        # Calculate relative path and target
-        rel_path = stub_file.relative_to(stub_source)
-        target_file = target_base / rel_path
-
-        # Check if target exists and compare
-        if target_file.exists():
-            source_lines = len(stub_file.read_text().splitlines())
-            target_lines = len(target_file.read_text().splitlines())
-
-            if target_lines >= source_lines and not force:
-                print(f"  SKIP: {rel_path} (existing has {target_lines} lines, ours has {source_lines})")
-                results["skipped"].append(str(rel_path))
-                continue
-
-            # Backup existing
-            if not dry_run:
-                backup = backup_existing(target_file)
-                if backup:
-                    results["backed_up"].append(str(backup))
-
-        # Ensure target directory exists
-        if not dry_run:
-            target_file.parent.mkdir(parents=True, exist_ok=True)
-
-        # Copy the stub
-        action = "WOULD INSTALL" if dry_run else "INSTALL"
-        source_lines = len(stub_file.read_text().splitlines())
-        print(f"  {action}: {rel_path} ({source_lines} lines)")
-
-        if not dry_run:
-            try:
-                shutil.copy2(stub_file, target_file)
-                results["installed"].append(str(rel_path))
-            except Exception as e:
-                print(f"    ERROR: {e}")
-                results["errors"].append({"file": str(rel_path), "error": str(e)})
 
-    return results
+def install_file(
+    stub_file: Path,
+    target_file: Path,
+    rel_path: str,
+    wanted: dict,
+    installed: dict,
+    results: dict,
+    dry_run: bool,
+    force: bool,
+    link: str = "auto",
+    log=print
+) -> dict:
+    """
+    Install one stub file, recording the outcome in results.
+
+    wanted is the file's manifest entry and installed its receipt entry.
+    Returns the receipt entry to keep for the file, or None.
+    """
+    with PROFILER.span("compare"):
+        state = classify(target_file, wanted, installed)
+
+    if state == "up to date":
+        log(f"  UP TO DATE: {rel_path}")
+        results["up_to_date"].append(rel_path)
+        return installed
+
+    if state == "foreign":
+        # Someone else's file: read it once to decide
+        with PROFILER.span("compare"):
+            data = target_file.read_bytes()
+        if content_hash(data) == wanted["sha256"]:
+            log(f"  UP TO DATE: {rel_path} (adopted)")
+            results["up_to_date"].append(rel_path)
+            return receipt_entry(target_file, wanted["sha256"])
+
+        target_lines = len(data.splitlines())
+        if target_lines >= wanted["lines"] and not force:
+            log(f"  SKIP: {rel_path} (existing has {target_lines} lines, ours has {wanted['lines']})")
+            results["skipped"].append(rel_path)
+            return None
+
+    if state != "missing" and not dry_run:
+        # Backup existing
+        with PROFILER.span("backup"):
+            backup = backup_existing(target_file)
+        if backup:
+            results["backed_up"].append(str(backup))
+
+    # Ensure target directory exists
+    if not dry_run:
+        target_file.parent.mkdir(parents=True, exist_ok=True)
+
+    # Link or copy the stub
+    if dry_run:
+        log(f"  WOULD INSTALL: {rel_path} ({wanted['lines']} lines, {state})")
+        return installed
+    try:
+        with PROFILER.span("copy"):
+            method = link_or_copy(stub_file, target_file, link)
+        log(f"  INSTALL: {rel_path} ({wanted['lines']} lines, {state}, {method})")
+        results["installed"].append(rel_path)
+        return receipt_entry(target_file, wanted["sha256"])
+    except Exception as e:
+        log(f"  INSTALL: {rel_path} ({wanted['lines']} lines, {state})")
+        log(f"    ERROR: {e}")
+        results["errors"].append({"file": rel_path, "error": str(e)})
+        return None
+
+
+def expand_venv_paths(patterns: List[str]) -> List[Path]:
+    """Venv paths with glob patterns expanded, deduplicated, in command-line order."""
+    paths = []
+    for pattern in patterns:
+        pattern = str(Path(pattern).expanduser())
+        matches = sorted(glob.glob(pattern)) if any(c in pattern for c in "*?[") else [pattern]
+        for match in matches:
+            if Path(match) not in paths:
+                paths.append(Path(match))
+    return paths
+
+
+def install_many(
+    venv_paths: List[Path],
+    site_packages_dirs: List[Path] = (),
+    jobs: int = 8,
+    dry_run: bool = False,
+    force: bool = False,
+    link: str = "auto"
+) -> dict:
+    """
+    Install into several environments concurrently.
+
+    The manifest is loaded once and shared. Each environment's output is
+    buffered and printed as one block, in the order given. Returns
+    {environment: results}; an environment whose site-packages or
+    aspose.pydrawing cannot be found gets a single error.
+    """
+    manifest = load_manifest(get_stub_source())
+    targets = [(path, False) for path in venv_paths] + [(path, True) for path in site_packages_dirs]
+
+    def install_one(target):
+        path, is_site_packages = target
+        lines = []
+        results = empty_results()
+
+        def log(line: str = ""):
+            lines.append(line)
+
+        with PROFILER.span(f"env:{path}"):
+            try:
+                site_packages = path if is_site_packages else find_site_packages(path)
+                results = install_stubs(site_packages, dry_run, force, link, manifest, log)
+            except FileNotFoundError as e:
+                lines.append(f"ERROR: {e}")
+                results["errors"].append({"file": None, "error": str(e)})
+        return lines, results
+
+    all_results = {}
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as executor:
+        for (path, _), (lines, results) in zip(targets, executor.map(install_one, targets)):
+            print(f"[{path}]")
+            for line in lines:
+                print(f"  {line}" if line else "")
+            all_results[path] = results
+    return all_results
 
 
 def main():
@@ -155,12 +298,26 @@ def main():
     )
     parser.add_argument(
         "venv_path",
-        nargs="?",
-        help="Path to virtual environment (default: current environment)"
+        nargs="*",
+        help="Paths or glob patterns of virtual environments (default: current environment)"
     )
     parser.add_argument(
         "--site-packages",
-        help="Direct path to site-packages directory"
+        action="append",
+        default=[],
+        help="Direct path to a site-packages directory (repeatable)"
+    )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=8,
+        help="Environments to install into concurrently (default: 8)"
+    )
+    parser.add_argument(
+        "--link",
+        choices=LINK_MODES,
+        default="auto",
+        help="How to place files: reflink with copy fallback (auto), hardlink with copy fallback, or always copy (default: auto)"
     )
     parser.add_argument(
         "--dry-run",
@@ -172,47 +329,85 @@ def main():
         action="store_true",
         help="Overwrite even if existing stubs are larger"
     )
+    parser.add_argument(
+        "--profile",
+        metavar="REPORT_JSON",
+        help="Write a JSON timing report (and a .collapsed flamegraph file next to it)"
+    )
 
     args = parser.parse_args()
 
+    if args.profile:
+        PROFILER.enable()
+
     print("=" * 60)
     print("Aspose.pydrawing Stub Installer")
     print("=" * 60)
     print()
 
     try:
-        # Determine site-packages location
-        if args.site_packages:
-            site_packages = Path(args.site_packages)
-        elif args.venv_path:
-            site_packages = find_site_packages(Path(args.venv_path))
+        venv_paths = expand_venv_paths(args.venv_path)
+        if args.venv_path and not venv_paths:
+            raise FileNotFoundError(f"No environments match: {' '.join(args.venv_path)}")
+        site_packages_dirs = [Path(p) for p in args.site_packages]
+        failed = 0
+
+        if len(venv_paths) + len(site_packages_dirs) > 1:
+            with PROFILER.span("install_many"):
+                all_results = install_many(
+                    venv_paths, site_packages_dirs,
+                    jobs=args.jobs,
+                    dry_run=args.dry_run,
+                    force=args.force,
+                    link=args.link
+                )
+            results = empty_results()
+            for env_results in all_results.values():
+                for key, values in env_results.items():
+                    results[key].extend(values)
+            failed = sum(1 for env_results in all_results.values() if env_results["errors"])
         else:
-            site_packages = find_site_packages()
-
-        print(f"Site-packages: {site_packages}")
-        print()
+            # Determine site-packages location
+            with PROFILER.span("find_site_packages"):
+                if site_packages_dirs:
+                    site_packages = site_packages_dirs[0]
+                elif venv_paths:
+                    site_packages = find_site_packages(venv_paths[0])
+                else:
+                    site_packages = find_site_packages()
+
+            print(f"Site-packages: {site_packages}")
+            print()
 
-        # Install stubs
-        results = install_stubs(
-            site_packages,
-            dry_run=args.dry_run,
-            force=args.force
-        )
+            # Install stubs
+            with PROFILER.span("install_stubs"):
+                results = install_stubs(
+                    site_packages,
+                    dry_run=args.dry_run,
+                    force=args.force,
+                    link=args.link
+                )
 
         # Summary
         print()
         print("=" * 60)
         print("Summary")
         print("=" * 60)
-        print(f"  Installed: {len(results['installed'])}")
-        print(f"  Skipped:   {len(results['skipped'])}")
-        print(f"  Backed up: {len(results['backed_up'])}")
-        print(f"  Errors:    {len(results['errors'])}")
+        print(f"  Installed:  {len(results['installed'])}")
+        print(f"  Up to date: {len(results['up_to_date'])}")
+        print(f"  Skipped:    {len(results['skipped'])}")
+        print(f"  Backed up:  {len(results['backed_up'])}")
+        print(f"  Errors:     {len(results['errors'])}")
+        if failed:
+            print(f"  Environments with errors: {failed}")
 
         if args.dry_run:
             print()
             print("(Dry run - no changes made)")
 
+        if args.profile:
+            PROFILER.write_report(Path(args.profile))
+
         if results["errors"]:
             sys.exit(1)
 
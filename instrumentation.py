@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Lightweight timing instrumentation for stub generation and installation.
+
+Code marks hot paths with PROFILER.span(name). Spans nest per thread and are
+aggregated by their stack of names, so memory stays bounded no matter how
+many classes or members are timed. Introspection workers profile themselves
+and ship their spans back with each response; the pool grafts them under
+the caller's stack (see introspect_pool.py).
+
+Frame name conventions used in the report:
+    class:<module>.<Class>   one class request
+    getattr:<member>         one member access
+    worker.startup           spawning a worker and importing aspose.pydrawing
+
+The profiler is disabled by default, so a span costs one attribute check.
+write_report() produces a JSON report and a collapsed-stack file
+("frame;frame;frame <microseconds>" per line) that flamegraph.pl,
+speedscope and inferno can read.
+"""
+import json
+import threading
+import time
+from pathlib import Path
+
+from stub_io import write_text_atomic
+
+
+class _Span:
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name: str):
+        self.profiler = profiler
+        self.name = name
+        self.start = None
+
+    def __enter__(self):
+        if self.profiler.enabled:
+            self.profiler._stack().append(self.name)
+            self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        if self.start is not None:
+            stack = self.profiler._stack()
+            self.profiler.record(stack, time.perf_counter() - self.start)
+            stack.pop()
+
+
+class Profiler:
+    """Aggregates span timings by stack and collects notable events."""
+
+    def __init__(self):
+        self.enabled = False
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._totals = {}
+        self._events = []
+        self._sections = {}
+        self._started = time.perf_counter()
+
+    def enable(self):
+        self.enabled = True
+        self._started = time.perf_counter()
+
+    def _stack(self) -> list:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def current_stack(self) -> list:
+        """The calling thread's open spans, outermost first."""
+        return list(self._stack())
+
+    def span(self, name: str) -> _Span:
+        return _Span(self, name)
+
+    def record(self, stack: list, seconds: float, calls: int = 1):
+        """Add externally measured time for a stack of frame names."""
+        if not self.enabled:
+            return
+        key = tuple(stack)
+        with self._lock:
+            entry = self._totals.setdefault(key, [0, 0.0])
+            entry[0] += calls
+            entry[1] += seconds
+
+    def event(self, kind: str, **details):
+        """Record a notable event such as a timeout, crash or cache hit."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._events.append({"kind": kind, **details})
+
+    def section(self, name: str, data: dict):
+        """Attach a summary computed elsewhere (e.g. worker memory) to the report."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._sections[name] = data
+
+    def export(self) -> list:
+        """Aggregated stacks as [[frame, ...], calls, seconds] for transport."""
+        with self._lock:
+            return [[list(stack), calls, seconds] for stack, (calls, seconds) in self._totals.items()]
+
+    def merge(self, base: list, exported: list):
+        """Graft stacks exported by another profiler under base."""
+        for stack, calls, seconds in exported:
+            self.record(base + stack, seconds, calls)
+
+    def reset(self):
+        with self._lock:
+            self._totals = {}
+            self._events = []
+            self._sections = {}
+
+    def report(self) -> dict:
+        """Machine-readable summary of everything recorded."""
+        with self._lock:
+            totals = dict(self._totals)
+            events = list(self._events)
+            sections = dict(self._sections)
+
+        stacks = sorted(
+            ({"stack": ";".join(stack), "calls": calls, "seconds": seconds}
+             for stack, (calls, seconds) in totals.items()),
+            key=lambda entry: -entry["seconds"]
+        )
+
+        classes = {}
+        members = {}
+        startup = {"count": 0, "seconds": 0.0}
+        for stack, (calls, seconds) in totals.items():
+            leaf = stack[-1]
+            if leaf.startswith("class:"):
+                entry = classes.setdefault(leaf[len("class:"):], {"calls": 0, "seconds": 0.0})
+                entry["calls"] += calls
+                entry["seconds"] += seconds
+            elif leaf.startswith("getattr:"):
+                owner = next((f[len("class:"):] for f in reversed(stack) if f.startswith("class:")), "?")
+                key = f"{owner}.{leaf[len('getattr:'):]}"
+                entry = members.setdefault(key, {"calls": 0, "seconds": 0.0})
+                entry["calls"] += calls
+                entry["seconds"] += seconds
+            elif leaf == "worker.startup":
+                startup["count"] += calls
+                startup["seconds"] += seconds
+
+        counts = {}
+        for event in events:
+            counts[event["kind"]] = counts.get(event["kind"], 0) + 1
+
+        return {
+            "wall_seconds": time.perf_counter() - self._started,
+            "subprocess_startup": startup,
+            "event_counts": counts,
+            "classes": sorted(
+                ({"class": name, **entry} for name, entry in classes.items()),
+                key=lambda entry: -entry["seconds"]
+            ),
+            "slowest_members": sorted(
+                ({"member": name, **entry} for name, entry in members.items()),
+                key=lambda entry: -entry["seconds"]
+            )[:100],
+            **sections,
+            "stacks": stacks,
+            "events": events,
+        }
+
+    def collapsed(self) -> str:
+        """Self time per stack in collapsed-stack format, in microseconds."""
+        with self._lock:
+            totals = {stack: seconds for stack, (_, seconds) in self._totals.items()}
+
+        self_time = dict(totals)
+        for stack, seconds in totals.items():
+            parent = stack[:-1]
+            if parent in self_time:
+                self_time[parent] -= seconds
+
+        lines = []
+        for stack in sorted(self_time):
+            micros = int(round(max(self_time[stack], 0.0) * 1e6))
+            if micros:
+                lines.append(f"{';'.join(stack)} {micros}")
+        return "\n".join(lines) + "\n"
+
+    def write_report(self, path: Path):
+        """Write the JSON report to path and collapsed stacks next to it (.collapsed)."""
+        path = Path(path)
+        write_text_atomic(path, json.dumps(self.report(), indent=2) + "\n")
+        write_text_atomic(path.with_suffix(".collapsed"), self.collapsed())
+        print(f"Profile written to: {path} (+ {path.with_suffix('.collapsed').name})")
+
+
+PROFILER = Profiler()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+On-disk cache of introspection results.
+
+Entries are content-addressed: the key hashes the request together with the
+installed aspose-slides version, the hash of its wheel RECORD, the Python
+interpreter version and the generator sources. Any of those changing simply
+misses the cache. Computing the key never imports the .NET runtime, so a
+fully warm regeneration does not start a single introspection worker.
+
+The cache is size-bounded; least recently used entries are evicted first.
+"""
+import hashlib
+import json
+import os
+import platform
+import sys
+from pathlib import Path
+
+from stub_io import write_text_atomic
+
+DEFAULT_CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "aspose-stubs"
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# Changing any of these changes what a request returns
+GENERATOR_FILES = ["introspect_worker.py", "generate_pydrawing_stubs.py"]
+
+
+def aspose_slides_fingerprint() -> dict:
+    """Version and wheel hash of the installed aspose-slides, read from its metadata only."""
+    from importlib import metadata
+
+    try:
+        dist = metadata.distribution("aspose-slides")
+    except metadata.PackageNotFoundError:
+        return {"version": None, "wheel_hash": None}
+    record = dist.read_text("RECORD") or ""
+    return {
+        "version": dist.version,
+        "wheel_hash": hashlib.sha256(record.encode()).hexdigest(),
+    }
+
+
+def runtime_key() -> str:
+    """Hash of everything besides the request itself that determines a result."""
+    script_dir = Path(__file__).parent
+    generator = hashlib.sha256()
+    for name in GENERATOR_FILES:
+        generator.update((script_dir / name).read_bytes())
+
+    parts = {
+        "aspose_slides": aspose_slides_fingerprint(),
+        "python": f"{platform.python_implementation()} {sys.version}",
+        "generator": generator.hexdigest(),
+    }
+    return hashlib.sha256(json.dumps(parts, sort_keys=True).encode()).hexdigest()
+
+
+class IntrospectionCache:
+    """Content-addressed JSON entries under a cache directory with LRU eviction."""
+
+    def __init__(self, directory: Path = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._runtime_key = runtime_key()
+        self._dirty = False
+
+    def _entry_path(self, payload: dict) -> Path:
+        key = hashlib.sha256(
+            (self._runtime_key + json.dumps(payload, sort_keys=True)).encode()
+        ).hexdigest()
+        return self.directory / key[:2] / f"{key}.json"
+
+    def get(self, payload: dict):
+        """Cached response for payload, or None."""
+        path = self._entry_path(payload)
+        try:
+            response = json.loads(path.read_text())
+        except (OSError, ValueError):
+            response = None
+        # Error responses stored by older runs are retried rather than trusted
+        if not isinstance(response, dict) or not response.get("ok"):
+            self.misses += 1
+            return None
+        # Mark as recently used for eviction
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self.hits += 1
+        return response
+
+    def put(self, payload: dict, response: dict):
+        path = self._entry_path(payload)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        write_text_atomic(path, json.dumps(response))
+        self._dirty = True
+
+    def prune(self):
+        """Evict least recently used entries until the cache fits in max_bytes."""
+        if not self._dirty:
+            return
+        entries = []
+        total = 0
+        for path in self.directory.glob("*/*.json"):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+            total += st.st_size
+
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+        self._dirty = False
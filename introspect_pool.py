@@ -0,0 +1,446 @@
+#!/usr/bin/env python3
+"""
+Pool of long-lived introspection workers.
+
+Each worker (introspect_worker.py) imports aspose.pydrawing (or another
+preload module) once and then serves many class requests over a pipe, so the
+.NET runtime is brought up once per worker instead of once per class. A
+worker that crashes or hangs on a request is respawned and the in-flight
+request retried. Workers can be recycled after a number of requests or once
+their resident memory passes a limit, which bounds how much memory a long
+run over a large namespace accumulates. The memory growth each worker
+reports per request is tallied per class, so the classes that leak most
+can be named.
+"""
+import json
+import os
+import queue
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import List, Tuple
+
+from crash_quarantine import find_crashing_members
+from instrumentation import PROFILER
+
+WORKER_SCRIPT = Path(__file__).parent / "introspect_worker.py"
+WORKER_ENV = {**os.environ, "DYLD_FALLBACK_LIBRARY_PATH": "/opt/homebrew/lib"}
+
+
+class WorkerCrashed(Exception):
+    """The worker died or stopped answering while serving a request."""
+
+
+class WorkerTimeout(WorkerCrashed):
+    """The worker stopped answering within the timeout."""
+
+
+class IntrospectionWorker:
+    """One worker subprocess speaking the JSON-lines protocol."""
+
+    def __init__(self, startup_timeout: float = 60, preload: str = "aspose.pydrawing", track_memory: bool = False):
+        self.startup_timeout = startup_timeout
+        self.preload = preload
+        self.track_memory = track_memory
+        self.process = None
+        self.served = 0
+        # Resident set size last reported, and growth reported since usage was last reset
+        self.rss = 0
+        self.usage = {"rss_delta": 0, "traced_delta": 0}
+        self._lines = None
+        # Profiler stack of the request being served, which pays for a (re)start
+        self.profile_stack = []
+
+    def start(self):
+        start = time.perf_counter()
+        env = WORKER_ENV
+        if PROFILER.enabled:
+            env = {**env, "ASPOSE_STUBS_PROFILE": "1"}
+        if self.track_memory:
+            env = {**env, "ASPOSE_STUBS_TRACEMALLOC": "1"}
+        self.process = subprocess.Popen(
+            [sys.executable, str(WORKER_SCRIPT), self.preload],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            bufsize=1,
+            env=env,
+        )
+        self._lines = queue.Queue()
+        self.served = 0
+        self.rss = 0
+        reader = threading.Thread(target=self._read_lines, args=(self.process.stdout, self._lines), daemon=True)
+        reader.start()
+
+        ready = self._next_message(self.startup_timeout)
+        if not ready.get("ready"):
+            self.stop()
+            raise WorkerCrashed(f"worker failed to start: {ready.get('error', 'unknown error')}")
+        startup_stack = self.profile_stack + ["worker.startup"]
+        PROFILER.record(startup_stack, time.perf_counter() - start)
+        PROFILER.record(startup_stack + [f"import {self.preload}"], ready.get("import_seconds", 0.0))
+
+    @staticmethod
+    def _read_lines(stream, lines: queue.Queue):
+        for line in stream:
+            lines.put(line)
+        lines.put(None)
+
+    def _next_message(self, timeout: float) -> dict:
+        try:
+            line = self._lines.get(timeout=timeout)
+        except queue.Empty:
+            raise WorkerTimeout(f"no response within {timeout}s")
+        if line is None:
+            raise WorkerCrashed(f"worker exited with code {self.process.wait()}")
+        return json.loads(line)
+
+    def request(self, payload: dict, timeout: float) -> dict:
+        if self.process is None:
+            self.start()
+        try:
+            self.process.stdin.write(json.dumps(payload) + "\n")
+            self.process.stdin.flush()
+        except (BrokenPipeError, OSError):
+            raise WorkerCrashed("worker pipe closed")
+        response = self._next_message(timeout)
+        self.served += 1
+        memory = response.pop("memory", None)
+        if memory:
+            self.rss = memory["rss"]
+            self.usage["rss_delta"] += memory["rss_delta"]
+            self.usage["traced_delta"] += memory.get("traced_delta", 0)
+        return response
+
+    def stop(self):
+        if self.process is None:
+            return
+        try:
+            self.process.stdin.close()
+        except OSError:
+            pass
+        try:
+            self.process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+            self.process.wait()
+        self.process = None
+
+    def kill(self):
+        if self.process is None:
+            return
+        self.process.kill()
+        self.process.wait()
+        self.process = None
+
+
+def _label(payload: dict) -> str:
+    """Profiler frame name for a request."""
+    if "class" in payload:
+        return f"class:{payload['module']}.{payload['class']}"
+    return f"{payload['op']}:{payload.get('module', '')}"
+
+
+class IntrospectionPool:
+    """
+    A fixed number of workers serving introspection requests.
+
+    Workers are started lazily on their first request and live until close().
+    With a cache, requests it can answer never reach a worker, so a fully
+    warm run does not start one. With recycle_after, a worker is restarted
+    after serving that many requests, and with max_rss once its resident
+    set reaches that many bytes. With track_memory, workers also trace
+    Python allocations, so memory_report() can tell Python-side leaks from
+    native ones. With a crash denylist, class requests skip
+    known-bad members, and a class request that still crashes its worker is
+    bisected down to the offending members, which are then denylisted and
+    skipped on a final retry.
+    """
+
+    def __init__(
+        self,
+        workers: int = 1,
+        timeout: float = 10,
+        max_attempts: int = 2,
+        cache=None,
+        denylist=None,
+        preload: str = "aspose.pydrawing",
+        recycle_after: int = None,
+        max_rss: int = None,
+        track_memory: bool = False
+    ):
+        self.timeout = timeout
+        self.max_attempts = max_attempts
+        self.cache = cache
+        self.denylist = denylist
+        self.recycle_after = recycle_after
+        self.max_rss = max_rss
+        self.track_memory = track_memory
+        self._workers = [
+            IntrospectionWorker(preload=preload, track_memory=track_memory) for _ in range(max(1, workers))
+        ]
+        self._memory_lock = threading.Lock()
+        # {"module.Class": [requests, rss growth, traced growth]}
+        self._memory = {}
+        self.peak_rss = 0
+        self.recycles = {"requests": 0, "rss": 0}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        for worker in self._workers:
+            worker.stop()
+        if self._memory:
+            PROFILER.section("memory", self.memory_report())
+        if self.cache is not None:
+            self.cache.prune()
+        if self.denylist is not None:
+            self.denylist.save()
+
+    def _account(self, worker: IntrospectionWorker, payload: dict):
+        """Tally the memory growth of the request just served, then recycle the worker if it is due."""
+        usage = worker.usage
+        worker.usage = {"rss_delta": 0, "traced_delta": 0}
+        with self._memory_lock:
+            self.peak_rss = max(self.peak_rss, worker.rss)
+            if "class" in payload:
+                entry = self._memory.setdefault(f"{payload['module']}.{payload['class']}", [0, 0, 0])
+                entry[0] += 1
+                entry[1] += usage["rss_delta"]
+                entry[2] += usage["traced_delta"]
+
+        if worker.process is None:
+            return
+        if self.recycle_after and worker.served >= self.recycle_after:
+            reason = "requests"
+        elif self.max_rss and worker.rss >= self.max_rss:
+            reason = "rss"
+        else:
+            return
+        PROFILER.event("recycle", reason=reason, served=worker.served, rss=worker.rss)
+        with self._memory_lock:
+            self.recycles[reason] += 1
+        worker.stop()
+
+    def memory_report(self, count: int = 10) -> dict:
+        """
+        Peak worker RSS, recycle counts, and the count classes whose requests
+        grew their worker most: by traced Python allocations with
+        track_memory, by RSS otherwise.
+        """
+        key = 2 if self.track_memory else 1
+        with self._memory_lock:
+            ranked = sorted(self._memory.items(), key=lambda item: -item[1][key])
+            return {
+                "peak_rss": self.peak_rss,
+                "recycles": dict(self.recycles),
+                "classes": len(self._memory),
+                "top_leakers": [
+                    {"class": name, "requests": requests, "rss_delta": rss, "traced_delta": traced}
+                    for name, (requests, rss, traced) in ranked[:count] if (rss, traced)[key - 1] > 0
+                ],
+            }
+
+    def _run(self, worker: IntrospectionWorker, payload: dict):
+        """
+        Run one request, respawning the worker and retrying on a crash.
+
+        Returns the worker's response (which may report an error), or None
+        if every attempt crashed the worker.
+        """
+        for attempt in range(self.max_attempts):
+            try:
+                return worker.request(payload, self.timeout)
+            except WorkerCrashed as e:
+                kind = "timeout" if isinstance(e, WorkerTimeout) else "crash"
+                PROFILER.event(kind, request=_label(payload), attempt=attempt + 1, detail=str(e))
+                worker.kill()
+        return None
+
+    def _with_skip(self, payload: dict) -> dict:
+        """Add the denylisted members of the requested class as "skip"."""
+        if self.denylist is None or "class" not in payload:
+            return payload
+        skip = self.denylist.members(payload["module"], payload["class"])
+        return {**payload, "skip": skip} if skip else payload
+
+    def _quarantine(self, worker: IntrospectionWorker, payload: dict):
+        """
+        Bisect a class request that crashed its worker to the members at fault.
+
+        Returns the request with the culprits added to "skip" and its
+        response, or the original request and None if no single member is
+        to blame.
+        """
+        names = self._run(worker, {"op": "names", "module": payload["module"], "class": payload["class"]})
+        if not names or not names.get("ok"):
+            return payload, None
+        skip = set(payload.get("skip", ()))
+
+        def probe(subset):
+            try:
+                worker.request(
+                    {"op": "probe", "module": payload["module"], "class": payload["class"], "members": subset},
+                    self.timeout,
+                )
+            except WorkerCrashed as e:
+                PROFILER.event("probe_crash", request=_label(payload), members=len(subset), detail=str(e))
+                worker.kill()
+                return False
+            return True
+
+        bad = find_crashing_members(probe, [name for name in names["names"] if name not in skip])
+        if not bad:
+            return payload, None
+        self.denylist.add(payload["module"], payload["class"], bad)
+        payload = {**payload, "skip": sorted(skip.union(bad))}
+        return payload, self._run(worker, payload)
+
+    def _execute(self, worker: IntrospectionWorker, payload: dict):
+        """Run a request, quarantining crashing members if it keeps crashing."""
+        response = self._run(worker, payload)
+        if response is None and self.denylist is not None and "class" in payload:
+            payload, response = self._quarantine(worker, payload)
+        return payload, response
+
+    def map(self, payloads: list) -> list:
+        """
+        Run requests across all workers; results come back in input order.
+
+        A request that failed or crashed its worker yields None.
+        """
+        return list(self.imap(payloads, window=max(1, len(payloads))))
+
+    def imap(self, payloads, window: int = 64):
+        """
+        Like map, but yield each result as soon as it and all before it are done.
+
+        payloads may be any iterable and is consumed lazily. Workers run at
+        most window requests ahead of the consumer, so memory stays bounded
+        however many requests there are.
+        """
+        payloads = iter(payloads)
+        done = {}
+        state = {"next": 0, "yielded": 0, "exhausted": False, "closed": False}
+        condition = threading.Condition()
+
+        # Worker threads attribute their time to the caller's open spans
+        base = PROFILER.current_stack()
+
+        def take():
+            """Next (index, payload) to run, or None when there is no more work."""
+            with condition:
+                while state["next"] - state["yielded"] >= window and not state["closed"]:
+                    condition.wait()
+                if state["closed"] or state["exhausted"]:
+                    return None
+                try:
+                    payload = next(payloads)
+                except StopIteration:
+                    state["exhausted"] = True
+                    condition.notify_all()
+                    return None
+                index = state["next"]
+                state["next"] += 1
+                return index, self._with_skip(payload)
+
+        def finish(index, result):
+            with condition:
+                done[index] = result
+                condition.notify_all()
+
+        def drain(worker):
+            while True:
+                item = take()
+                if item is None:
+                    return
+                index, payload = item
+                cached = self.cache.get(payload) if self.cache is not None else None
+                if cached is not None:
+                    PROFILER.event("cache_hit", request=_label(payload))
+                    finish(index, cached)
+                    continue
+
+                frame = [_label(payload)]
+                worker.profile_stack = base + frame
+                start = time.perf_counter()
+                try:
+                    payload, result = self._execute(worker, payload)
+                except Exception as e:
+                    # Never leave the consumer waiting on this index
+                    PROFILER.event("error", request=_label(payload), detail=f"{type(e).__name__}: {e}")
+                    worker.kill()
+                    worker.usage = {"rss_delta": 0, "traced_delta": 0}
+                    finish(index, None)
+                    continue
+                PROFILER.record(base + frame, time.perf_counter() - start)
+                if result is not None and "profile" in result:
+                    PROFILER.merge(base + frame, result.pop("profile"))
+                # Errors may be transient (memory pressure, a flaky import), so only successes are cached
+                if result is not None and result.get("ok") and self.cache is not None:
+                    self.cache.put(payload, result)
+                self._account(worker, payload)
+                finish(index, result)
+
+        threads = [threading.Thread(target=drain, args=(worker,), daemon=True) for worker in self._workers]
+        for thread in threads:
+            thread.start()
+        try:
+            while True:
+                with condition:
+                    while state["yielded"] not in done and not (
+                        state["exhausted"] and state["yielded"] == state["next"]
+                    ):
+                        condition.wait()
+                    if state["yielded"] not in done:
+                        break
+                    result = done.pop(state["yielded"])
+                    state["yielded"] += 1
+                    condition.notify_all()
+                yield result if result and result.get("ok") else None
+        finally:
+            with condition:
+                state["closed"] = True
+                condition.notify_all()
+            for thread in threads:
+                thread.join()
+
+    def discover(self, root: str) -> Tuple[List[str], List[str]]:
+        """
+        Every module reachable from root, itself included, sorted, and the
+        modules that failed to import or crashed their worker.
+
+        Modules are imported breadth first with one request each, a level at
+        a time across the workers, so a failing module only loses its own
+        subtree.
+        """
+        found = set()
+        failed = []
+        tried = {root}
+        level = [root]
+        while level:
+            responses = self.map([{"op": "submodules", "module": name} for name in level])
+            children = set()
+            for name, response in zip(level, responses):
+                if response is None:
+                    failed.append(name)
+                    continue
+                found.add(name)
+                children.update(response["modules"])
+            level = sorted(children - tried)
+            tried.update(level)
+        return sorted(found), sorted(failed)
+
+    def members(self, module_name: str, class_names: list) -> list:
+        """Member listings ({"methods", "properties", "classvars"}) per class, or None on failure."""
+        responses = self.map([
+            {"op": "members", "module": module_name, "class": name} for name in class_names
+        ])
+        return [response["members"] if response else None for response in responses]
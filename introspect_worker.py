@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Long-lived introspection worker for aspose.pydrawing.
+
+Started by introspect_pool.IntrospectionPool. Imports aspose.pydrawing (or
+the module given as the first argument) once, then answers JSON requests
+read line by line from stdin with one JSON response line each on stdout.
+Anything the .NET wrapper prints is diverted to stderr so it cannot
+corrupt the protocol.
+
+Every response carries the worker's resident set size and how much the
+request grew it, plus the growth in traced Python allocations when
+ASPOSE_STUBS_TRACEMALLOC is set. The pool uses these to recycle bloated
+workers and to name the classes that leak most.
+"""
+import importlib
+import json
+import os
+import pkgutil
+import sys
+import time
+import tracemalloc
+
+import generate_pydrawing_stubs
+from instrumentation import PROFILER
+
+
+def rss_bytes() -> int:
+    """Resident set size of this process; its peak where the current size is not available."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+def public_names(cls: type) -> list:
+    """Public member names of a class, without touching their values."""
+    return [name for name in sorted(dir(cls)) if not name.startswith('_')]
+
+
+def list_members(cls: type, skip=()) -> dict:
+    """
+    Classify the public members of a class as methods, properties or classvars.
+
+    Classification reads the class __dict__ and only falls back to getattr
+    for ambiguous members (see generate_pydrawing_stubs.classify_member).
+    Members in skip are not accessed and are listed under "skipped".
+    """
+    members = {"methods": [], "properties": [], "classvars": [], "skipped": []}
+    with PROFILER.span("dir"):
+        names = public_names(cls)
+    for name in names:
+        if name in skip:
+            members["skipped"].append(name)
+            continue
+        try:
+            kind, _ = generate_pydrawing_stubs.classify_member(cls, name)
+        except:
+            kind = "property"
+        if kind == "method":
+            members["methods"].append(name)
+        elif kind == "classvar":
+            members["classvars"].append(name)
+        else:
+            members["properties"].append(name)
+    return members
+
+
+def op_members(request: dict) -> dict:
+    """Member listing for request["class"] in request["module"]."""
+    module = importlib.import_module(request["module"])
+    cls = getattr(module, request["class"])
+    return {"members": list_members(cls, request.get("skip", ()))}
+
+
+def op_names(request: dict) -> dict:
+    """Public member names of request["class"], without accessing them."""
+    module = importlib.import_module(request["module"])
+    return {"names": public_names(getattr(module, request["class"]))}
+
+
+def op_probe(request: dict) -> dict:
+    """
+    Stub each of request["members"] as a class block would; surviving is the answer.
+
+    Besides the access itself, that classifies the member, reads its
+    signature or type and checks for static and class methods, so a crash
+    in any of those reproduces for the member alone.
+    """
+    module = importlib.import_module(request["module"])
+    cls = getattr(module, request["class"])
+    for name in request["members"]:
+        try:
+            generate_pydrawing_stubs.stub_member(cls, name)
+        except Exception:
+            pass
+    return {}
+
+
+def op_probe_class(request: dict) -> dict:
+    """Access every public member of request["class"] that is not skipped."""
+    module = importlib.import_module(request["module"])
+    cls = getattr(module, request["class"])
+    skip = set(request.get("skip", ()))
+    return op_probe({**request, "members": [name for name in public_names(cls) if name not in skip]})
+
+
+def op_module_header(request: dict) -> dict:
+    """Stub header and class names for request["module"]."""
+    module = importlib.import_module(request["module"])
+    submodules, constants, functions, classes = generate_pydrawing_stubs.collect_module_members(module)
+    return {
+        "header": generate_pydrawing_stubs.generate_module_header(request["module"], submodules, constants, functions),
+        "classes": [name for name, _ in classes],
+    }
+
+
+def op_classes(request: dict) -> dict:
+    """Names of the classes in request["module"]."""
+    module = importlib.import_module(request["module"])
+    _, _, _, classes = generate_pydrawing_stubs.collect_module_members(module)
+    return {"classes": sorted(name for name, _ in classes)}
+
+
+def op_class_block(request: dict) -> dict:
+    """Stub lines for request["class"] in request["module"]."""
+    module = importlib.import_module(request["module"])
+    cls = getattr(module, request["class"])
+    return {"lines": generate_pydrawing_stubs.generate_class_block(request["class"], cls, request.get("skip", ()))}
+
+
+def submodules(module) -> list:
+    """
+    Names of the direct submodules of module.
+
+    Covers both regular subpackages and submodules that a compiled
+    extension only exposes as attributes. Modules that are merely imported
+    into the namespace (e.g. os) are not submodules.
+    """
+    names = set()
+    for info in pkgutil.iter_modules(getattr(module, "__path__", None) or []):
+        if not info.name.startswith("_"):
+            names.add(f"{module.__name__}.{info.name}")
+    for name in generate_pydrawing_stubs.safe_dir(module):
+        obj = generate_pydrawing_stubs.safe_getattr(module, name)
+        if isinstance(obj, type(module)) and getattr(obj, "__name__", None) == f"{module.__name__}.{name}":
+            names.add(obj.__name__)
+    return sorted(names)
+
+
+def op_submodules(request: dict) -> dict:
+    """Direct submodules of request["module"], which is imported to find them."""
+    return {"modules": submodules(importlib.import_module(request["module"]))}
+
+
+OPS = {
+    "members": op_members,
+    "names": op_names,
+    "probe": op_probe,
+    "probe_class": op_probe_class,
+    "module_header": op_module_header,
+    "class_block": op_class_block,
+    "classes": op_classes,
+    "submodules": op_submodules,
+}
+
+
+def serve(requests, responses):
+    """Answer requests until stdin is closed."""
+    for line in requests:
+        line = line.strip()
+        if not line:
+            continue
+        request = json.loads(line)
+        PROFILER.reset()
+        rss_before = rss_bytes()
+        traced_before = tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else None
+        try:
+            response = {"ok": True, **OPS[request["op"]](request)}
+        except Exception as e:
+            response = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+        rss = rss_bytes()
+        response["memory"] = {"rss": rss, "rss_delta": rss - rss_before}
+        if traced_before is not None:
+            response["memory"]["traced_delta"] = tracemalloc.get_traced_memory()[0] - traced_before
+        if PROFILER.enabled:
+            response["profile"] = PROFILER.export()
+        responses.write(json.dumps(response) + "\n")
+        responses.flush()
+
+
+def main():
+    # Keep the real stdout for protocol messages; route fd 1 to stderr.
+    responses = os.fdopen(os.dup(1), "w")
+    os.dup2(2, 1)
+    sys.stdout = sys.stderr
+
+    if os.environ.get("ASPOSE_STUBS_PROFILE"):
+        PROFILER.enable()
+
+    preload = sys.argv[1] if len(sys.argv) > 1 else "aspose.pydrawing"
+    start = time.perf_counter()
+    try:
+        importlib.import_module(preload)  # bring up the .NET runtime once
+    except Exception as e:
+        responses.write(json.dumps({"ready": False, "error": str(e)}) + "\n")
+        responses.flush()
+        sys.exit(1)
+
+    if os.environ.get("ASPOSE_STUBS_TRACEMALLOC"):
+        tracemalloc.start()
+
+    responses.write(json.dumps({"ready": True, "import_seconds": time.perf_counter() - start}) + "\n")
+    responses.flush()
+    serve(sys.stdin, responses)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Canonical stub text and the fingerprint header of generated stubs.
+
+Every generated .pyi starts with a line like
+
+    # stub-fingerprint: 9c1f0e4b7a2d5e83 aspose-slides=24.6.0 generator=4be1a90c27f3 denylist=0d6e11f2a8c4
+
+The leading hash covers everything that determines the stub text: the
+aspose-slides version and wheel RECORD, the emitter sources, the crash
+denylist and, only when docs links were joined into the docstrings, the
+docs cross-reference (docs=...) and the source that joins it. Two stubs
+with the same fingerprint were generated from the same inputs, so
+downstream caches (type checkers, CI artifacts, the stub wheel) can key on
+it instead of on file contents or mtimes.
+
+Emission is canonical so that the same inputs always give the same bytes:
+trailing whitespace and object addresses are stripped, runs of blank lines
+are collapsed, and a file ends with exactly one newline.
+"""
+import hashlib
+import json
+import re
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from introspect_cache import aspose_slides_fingerprint
+from stub_io import StreamingWriter
+
+FINGERPRINT_PREFIX = "# stub-fingerprint: "
+
+# Everything whose change can change the emitted text
+EMITTER_FILES = [
+    "generate_pydrawing_stubs.py",
+    "introspect_worker.py",
+    "generate_pydrawing_stubs_v2.py",
+    "enhance_stubs.py",
+    "rectangle_stubs.py",
+    "stub_model.py",
+    "stub_fingerprint.py",
+]
+# Emitter sources of stubs with docs links joined in
+DOCS_EMITTER_FILES = ["docs_xref.py"]
+
+_ADDRESS_RE = re.compile(r" at 0x[0-9a-fA-F]+")
+
+
+def generator_version(docs: bool = False) -> str:
+    """Short hash of the emitter sources, including those joining docs links if docs."""
+    script_dir = Path(__file__).parent
+    digest = hashlib.sha256()
+    for name in EMITTER_FILES + (DOCS_EMITTER_FILES if docs else []):
+        digest.update((script_dir / name).read_bytes())
+    return digest.hexdigest()[:12]
+
+
+def _short_hash(data, length: int = 12) -> str:
+    return hashlib.sha256(json.dumps(data, sort_keys=True).encode()).hexdigest()[:length]
+
+
+def stub_fingerprint(denylist: dict = None, aspose: dict = None, docs: str = None) -> str:
+    """
+    The fingerprint header line for stubs generated from the given inputs.
+
+    denylist is {"module.Class": [member, ...]}, by default the committed
+    crash denylist; aspose is {"version", "wheel_hash"}, by default read from
+    the installed aspose-slides metadata; docs is the digest of the docs
+    cross-reference joined into the docstrings, if any (see docs_xref.py).
+    """
+    if denylist is None:
+        from crash_quarantine import CrashDenylist
+
+        denylist = dict(CrashDenylist().items())
+    if aspose is None:
+        aspose = aspose_slides_fingerprint()
+    inputs = {
+        "aspose_slides": aspose.get("version"),
+        "wheel_hash": aspose.get("wheel_hash"),
+        "generator": generator_version(bool(docs)),
+        "denylist": _short_hash({key: sorted(names) for key, names in denylist.items()}),
+    }
+    if docs:
+        inputs["docs"] = docs
+    return (
+        f"{FINGERPRINT_PREFIX}{_short_hash(inputs, 16)} "
+        f"aspose-slides={inputs['aspose_slides'] or 'unknown'} "
+        f"generator={inputs['generator']} denylist={inputs['denylist']}"
+        + (f" docs={docs}" if docs else "")
+    )
+
+
+def restamp(path: Path, fingerprint: str) -> bool:
+    """
+    Head an already written stub with fingerprint, replacing its old header.
+
+    Only the first line is read unless it differs; then the file is
+    rewritten atomically, streamed so its size does not matter. Returns
+    whether it was rewritten.
+    """
+    try:
+        with open(path) as f:
+            first = f.readline().rstrip("\n")
+    except OSError:
+        return False
+    if first == fingerprint:
+        return False
+    with StreamingWriter(path) as out:
+        with open(path) as source:
+            header = source.readline()
+            out.write(f"{fingerprint}\n")
+            if not header.startswith(FINGERPRINT_PREFIX):
+                out.write(header)
+            for chunk in iter(lambda: source.read(1 << 20), ""):
+                out.write(chunk)
+    return out.changed
+
+
+def canonical_lines(lines: Iterable[str]) -> Iterator[str]:
+    """
+    Normalize stub lines as they stream past.
+
+    Trailing whitespace and " at 0x..." object addresses are removed, blank
+    lines at the start are dropped, runs of blank lines become one, and a
+    single "" is yielded last so the joined text ends with one newline.
+    """
+    started = False
+    blank = False
+    for line in lines:
+        line = _ADDRESS_RE.sub("", line.rstrip())
+        if not line:
+            blank = started
+            continue
+        if blank:
+            yield ""
+            blank = False
+        started = True
+        yield line
+    if started:
+        yield ""
+
+
+def canonical_text(lines: Iterable[str]) -> str:
+    return "\n".join(canonical_lines(lines))
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+File writing helpers for generated artifacts.
+
+Stubs are only rewritten when their content changes, so unchanged files keep
+their mtimes and type-checker caches stay valid. Changed files are written to
+a temporary file in the same directory and renamed over the target, so a
+crash mid-write never leaves a truncated stub behind.
+"""
+import hashlib
+import os
+import shutil
+import threading
+from pathlib import Path
+
+
+def content_hash(data: bytes) -> str:
+    """sha256 hex digest of data."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def write_bytes_atomic(path: Path, data: bytes):
+    """Replace path with data via a temporary file and rename."""
+    path = Path(path)
+    tmp_path = path.parent / f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        raise
+
+
+def write_text_atomic(path: Path, text: str):
+    write_bytes_atomic(path, text.encode())
+
+
+def write_if_changed(path: Path, text: str) -> bool:
+    """
+    Atomically write text to path unless it already holds exactly that content.
+
+    Returns True if the file was written.
+    """
+    data = text.encode()
+    try:
+        if content_hash(Path(path).read_bytes()) == content_hash(data):
+            return False
+    except FileNotFoundError:
+        pass
+    write_bytes_atomic(path, data)
+    return True
+
+
+class StreamingWriter:
+    """
+    Write a text file piece by piece, atomically and only if it changed.
+
+    Text goes straight to a temporary file next to path while being hashed,
+    so memory use does not depend on the file size. On close the temporary
+    file replaces path, unless path already holds the same content; then it
+    is discarded and path keeps its mtime. changed tells which happened.
+    Leaving the with block with an exception discards everything.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.changed = False
+        self._tmp_path = self.path.parent / f".{self.path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        _remove_stale_tmp(self.path)
+        self._file = open(self._tmp_path, "wb")
+        self._hash = hashlib.sha256()
+
+    def write(self, text: str):
+        data = text.encode()
+        self._hash.update(data)
+        self._file.write(data)
+
+    def close(self):
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+        if self.path.exists() and _file_hash(self.path) == self._hash.hexdigest():
+            self._tmp_path.unlink()
+        else:
+            os.replace(self._tmp_path, self.path)
+            self.changed = True
+
+    def discard(self):
+        self._file.close()
+        try:
+            self._tmp_path.unlink()
+        except OSError:
+            pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *exc):
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
+
+
+def _remove_stale_tmp(path: Path):
+    """Remove temporary files for path left behind by processes that were killed mid-write."""
+    for tmp_path in path.parent.glob(f".{path.name}.*.tmp"):
+        try:
+            pid = int(tmp_path.name[len(path.name) + 2:].split(".")[0])
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+        except (ValueError, OSError):
+            pass
+
+
+def _file_hash(path: Path) -> str:
+    """sha256 hex digest of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+# Linux FICLONE ioctl: share the source's extents copy-on-write (btrfs, XFS)
+FICLONE = 0x40049409
+
+LINK_MODES = ["auto", "reflink", "hardlink", "copy"]
+
+
+def _reflink(src: Path, dst: Path):
+    import fcntl
+    with open(src, "rb") as s, open(dst, "wb") as d:
+        fcntl.ioctl(d.fileno(), FICLONE, s.fileno())
+    shutil.copystat(src, dst)
+
+
+def link_or_copy(src: Path, dst: Path, mode: str = "auto") -> str:
+    """
+    Atomically replace dst with the content of src, sharing storage if possible.
+
+    mode "auto" (like "reflink") tries a reflink and copies if the
+    filesystem cannot clone; either way dst is independent of src. Only an
+    explicit "hardlink" makes both names one file, so editing either in
+    place (an editor saving over it, hand edits to generated_stubs) changes
+    both; it too falls back to a copy. Returns the method used.
+    """
+    dst = Path(dst)
+    methods = {"auto": ["reflink"], "reflink": ["reflink"], "hardlink": ["hardlink"], "copy": []}[mode]
+    tmp_path = dst.parent / f".{dst.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        for method in methods:
+            try:
+                if method == "reflink":
+                    _reflink(src, tmp_path)
+                else:
+                    os.link(src, tmp_path)
+            except (OSError, ImportError):
+                try:
+                    tmp_path.unlink()
+                except OSError:
+                    pass
+                continue
+            os.replace(tmp_path, dst)
+            return method
+        shutil.copy2(src, tmp_path)
+        os.replace(tmp_path, dst)
+        return "copy"
+    except BaseException:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        raise
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Append-only journal of stub generation progress, for resuming crashed runs.
+
+Every finished class block and module is appended to a JSON-lines journal
+next to the output and fsynced, so a run killed by the .NET wrapper (or
+anything else) loses at most the class in flight. A rerun with the same
+journal reuses the finished class blocks without introspecting them again,
+skips modules that were already written, and only works on the rest.
+
+The in-process generator also journals when it starts a class, and
+journals it as aborted if an exception (Ctrl-C, SIGTERM) unwinds out of
+it. A class that was started but neither finished nor aborted may have
+taken the previous run down with it (a native crash, or an OOM kill); on
+resume the generator retries it once, isolated in a worker that
+quarantines the crashing members (see crash_quarantine.py).
+
+The journal is tied to the runtime fingerprint (see introspect_cache.py)
+and to the run target; if either changed it is discarded. It is deleted
+once a run completes.
+"""
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import List, Optional
+
+from introspect_cache import runtime_key
+
+JOURNAL_NAME = ".generate_journal.jsonl"
+
+
+class GenerationJournal:
+    """
+    Checkpoints for one generation run.
+
+    Only the file offsets of class blocks are kept in memory; block lines
+    are read back from the journal when they are reused.
+    """
+
+    def __init__(self, path: Path, target: str, fresh: bool = False):
+        self.path = Path(path)
+        self.run_key = hashlib.sha256(f"{runtime_key()}\n{target}".encode()).hexdigest()
+        self.reused = 0
+        self._blocks = {}
+        self._started = set()
+        self._modules = set()
+        self._file = None
+
+        if not fresh and self.path.exists():
+            self._load()
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, "wb")
+            self._append({"type": "run", "key": self.run_key})
+
+    def _load(self):
+        with open(self.path, "rb") as f:
+            offset = 0
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    break  # torn write at the end of a crashed run
+                if offset == 0 and (entry.get("type") != "run" or entry.get("key") != self.run_key):
+                    return
+                kind = entry.get("type")
+                key = (entry.get("module"), entry.get("class"))
+                if kind == "start":
+                    self._started.add(key)
+                elif kind == "aborted":
+                    self._started.discard(key)
+                elif kind == "class":
+                    self._started.discard(key)
+                    self._blocks[key] = offset
+                elif kind == "module":
+                    self._modules.add(entry["module"])
+                offset += len(line)
+        if offset == 0:
+            return
+
+        # Drop a torn tail so new entries start on a line of their own
+        self._file = open(self.path, "r+b")
+        self._file.truncate(offset)
+        self._file.seek(offset)
+
+    def _append(self, entry: dict):
+        self._file.write((json.dumps(entry) + "\n").encode())
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    @property
+    def resumed(self) -> bool:
+        return bool(self._blocks or self._modules)
+
+    def summary(self) -> str:
+        return f"{len(self._modules)} modules and {len(self._blocks)} classes already done"
+
+    def module_done(self, module_name: str) -> bool:
+        return module_name in self._modules
+
+    def has_class(self, module_name: str, class_name: str) -> bool:
+        """Whether class_block() has an answer without introspecting the class."""
+        return (module_name, class_name) in self._blocks
+
+    def class_block(self, module_name: str, class_name: str) -> Optional[List[str]]:
+        """Journaled lines for a class, or None."""
+        key = (module_name, class_name)
+        if key not in self._blocks:
+            return None
+        with open(self.path, "rb") as f:
+            f.seek(self._blocks[key])
+            lines = json.loads(f.readline())["lines"]
+        self.reused += 1
+        return lines
+
+    def crashed(self, module_name: str, class_name: str) -> bool:
+        """Whether a previous run started the class and died before finishing or aborting it."""
+        return (module_name, class_name) in self._started
+
+    def record_start(self, module_name: str, class_name: str):
+        self._append({"type": "start", "module": module_name, "class": class_name})
+
+    def record_abort(self, module_name: str, class_name: str):
+        """An exception unwound out of the class; the next run introspects it normally."""
+        self._append({"type": "aborted", "module": module_name, "class": class_name})
+
+    def record_class(self, module_name: str, class_name: str, lines: List[str]):
+        self._started.discard((module_name, class_name))
+        self._blocks[(module_name, class_name)] = self._file.tell()
+        self._append({"type": "class", "module": module_name, "class": class_name, "lines": lines})
+
+    def record_module(self, module_name: str):
+        self._modules.add(module_name)
+        self._append({"type": "module", "module": module_name})
+
+    def complete(self):
+        """The run finished: the journal is no longer needed."""
+        self._file.close()
+        self.path.unlink()
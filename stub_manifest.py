@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Content-hash manifest of the generated stubs and install receipts.
+
+The generators write stub_manifest.json next to the stubs, listing the
+sha256 and line count of every .pyi file. install_stubs.py writes a receipt
+into the target aspose/pydrawing recording the hash, size and mtime of each
+file it installed. On reinstall a file whose size and mtime still match the
+receipt is known to hold the receipt's hash, so comparing it with the
+manifest needs no file reads at all:
+
+    up to date   installed by us, same hash as the manifest
+    changed      installed by us, the manifest has a newer hash
+    foreign      not in the receipt, or modified since we installed it
+    missing      not present in the target
+
+The manifest only depends on stub content, so it is stable under git.
+After editing stubs by hand, refresh it with:
+
+    python stub_manifest.py
+"""
+import json
+from pathlib import Path
+
+from stub_io import content_hash, write_if_changed, write_text_atomic
+
+MANIFEST_NAME = "stub_manifest.json"
+RECEIPT_NAME = ".stub_receipt.json"
+
+
+def build_manifest(stub_dir: Path) -> dict:
+    """{relative .pyi path: {"sha256", "lines"}} for every stub under stub_dir."""
+    files = {}
+    for path in sorted(stub_dir.rglob("*.pyi")):
+        data = path.read_bytes()
+        files[path.relative_to(stub_dir).as_posix()] = {
+            "sha256": content_hash(data),
+            "lines": len(data.splitlines()),
+        }
+    return files
+
+
+def write_manifest(stub_dir: Path) -> dict:
+    """Hash the stubs under stub_dir and write the manifest if it changed."""
+    files = build_manifest(stub_dir)
+    write_if_changed(stub_dir / MANIFEST_NAME, json.dumps({"files": files}, indent=2, sort_keys=True) + "\n")
+    return files
+
+
+def load_manifest(stub_dir: Path) -> dict:
+    """The manifest of stub_dir, built on the fly if it was never written."""
+    path = stub_dir / MANIFEST_NAME
+    if not path.exists():
+        print(f"  NOTE: {MANIFEST_NAME} not found, hashing the stubs")
+        return build_manifest(stub_dir)
+    return json.loads(path.read_text())["files"]
+
+
+def load_receipt(target_dir: Path) -> dict:
+    """{relative path: {"sha256", "size", "mtime_ns"}} of files installed into target_dir."""
+    path = target_dir / RECEIPT_NAME
+    if not path.exists():
+        return {}
+    try:
+        return json.loads(path.read_text())["files"]
+    except (ValueError, KeyError):
+        return {}
+
+
+def write_receipt(target_dir: Path, files: dict):
+    write_text_atomic(target_dir / RECEIPT_NAME, json.dumps({"files": files}, indent=2, sort_keys=True) + "\n")
+
+
+def receipt_entry(target_file: Path, sha256: str) -> dict:
+    """Receipt entry for a file just installed with the given content hash."""
+    stat = target_file.stat()
+    return {"sha256": sha256, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def classify(target_file: Path, wanted: dict, installed: dict = None) -> str:
+    """
+    Classify target_file against its manifest entry using only stat.
+
+    installed is the file's receipt entry, if any. Returns "up to date",
+    "changed", "foreign" or "missing".
+    """
+    try:
+        stat = target_file.stat()
+    except FileNotFoundError:
+        return "missing"
+    if installed and installed["size"] == stat.st_size and installed["mtime_ns"] == stat.st_mtime_ns:
+        return "up to date" if installed["sha256"] == wanted["sha256"] else "changed"
+    return "foreign"
+
+
+def main():
+    stub_dir = Path(__file__).parent / "generated_stubs" / "aspose" / "pydrawing"
+    files = write_manifest(stub_dir)
+    print(f"Manifest: {stub_dir / MANIFEST_NAME} ({len(files)} files)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+In-memory model of the generated .pyi stubs.
+
+The stub stages (generate_pydrawing_stubs_v2, enhance_stubs, rectangle_stubs)
+build and refine StubModule/StubClass/StubMember objects instead of patching
+text, and emit_module() serializes a module in one pass.
+
+Layout rules of the emitter:
+- a class body is its docstring followed by sections, each optionally headed
+  by a comment; with no sections the body is "...";
+- members without a docstring are emitted compactly on one line, members with
+  one are expanded and followed by a blank line;
+- a section comment or trailing note block is separated from a preceding
+  non-blank line by a blank line;
+- the module text is canonical (see stub_fingerprint.py) and, when given a
+  fingerprint, starts with it.
+"""
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from stub_fingerprint import canonical_text
+from stub_io import write_if_changed
+from stub_manifest import write_manifest
+from stub_symbols import write_symbol_table
+
+INDENT = "    "
+
+DEFAULT_IMPORTS = ['from typing import Any, ClassVar, Optional, List, Tuple, Union, overload']
+
+
+@dataclass
+class StubMember:
+    """
+    One class member.
+
+    kind is "method", "staticmethod", "classmethod", "property", "classvar"
+    or "attribute". For methods, signature is everything after the name,
+    e.g. "(self, x: int) -> bool"; for the others, type_hint is the value type.
+    """
+    name: str
+    kind: str
+    signature: str = "(self, *args) -> Any"
+    type_hint: str = "Any"
+    doc: str = ""
+    setter_type: Optional[str] = None
+    overloads: List[str] = field(default_factory=list)
+
+
+@dataclass
+class StubSection:
+    """A run of members, optionally headed by a comment such as "# Properties"."""
+    comment: Optional[str] = None
+    members: List[StubMember] = field(default_factory=list)
+
+
+@dataclass
+class StubClass:
+    name: str
+    doc: str = ""
+    bases: List[str] = field(default_factory=list)
+    sections: List[StubSection] = field(default_factory=list)
+    notes: List[str] = field(default_factory=list)
+
+    def member_names(self) -> List[str]:
+        return [member.name for section in self.sections for member in section.members]
+
+
+@dataclass
+class StubModule:
+    name: str
+    description: str = "Auto-generated from runtime introspection."
+    imports: List[str] = field(default_factory=lambda: list(DEFAULT_IMPORTS))
+    submodules: List[str] = field(default_factory=list)
+    classes: Dict[str, StubClass] = field(default_factory=dict)
+
+    def add_class(self, cls: StubClass):
+        self.classes[cls.name] = cls
+
+    def replace_class(self, cls: StubClass):
+        """Replace an existing class; unlike text patching, a missing target is an error."""
+        if cls.name not in self.classes:
+            raise KeyError(f"{self.name} has no class {cls.name} to replace")
+        self.classes[cls.name] = cls
+
+
+def _docstring_lines(doc: str, indent: str, quote: str) -> List[str]:
+    doc_lines = doc.split("\n")
+    if len(doc_lines) == 1:
+        return [f"{indent}{quote}{doc}{quote}"]
+    lines = [f'{indent}"""']
+    # A trailing newline forces the block form for a single line
+    lines.extend(f"{indent}{line}" if line else "" for line in doc.rstrip("\n").split("\n"))
+    lines.append(f'{indent}"""')
+    return lines
+
+
+def _def_lines(prefix: str, name: str, signature: str, doc: str, indent: str) -> List[str]:
+    if not doc:
+        return [f"{indent}{prefix}def {name}{signature}: ..."]
+    lines = [f"{indent}{prefix}def {name}{signature}:"]
+    lines.extend(_docstring_lines(doc, indent + INDENT, '"""'))
+    lines.append(f"{indent}{INDENT}...")
+    return lines
+
+
+def emit_member(member: StubMember, indent: str = INDENT) -> List[str]:
+    """Lines for one member, without surrounding blank lines."""
+    if member.kind == "classvar":
+        return [f"{indent}{member.name}: ClassVar[{member.type_hint}]"]
+    if member.kind == "attribute":
+        return [f"{indent}{member.name}: {member.type_hint}"]
+
+    lines = []
+    if member.kind == "property":
+        lines.append(f"{indent}@property")
+        lines.extend(_def_lines("", member.name, f"(self) -> {member.type_hint}", member.doc, indent))
+        if member.setter_type is not None:
+            if member.doc:
+                lines.append("")
+            lines.append(f"{indent}@{member.name}.setter")
+            lines.append(f"{indent}def {member.name}(self, value: {member.setter_type}) -> None: ...")
+        return lines
+
+    decorator = {"staticmethod": "@staticmethod", "classmethod": "@classmethod"}.get(member.kind)
+    for signature in member.overloads:
+        if decorator:
+            lines.append(f"{indent}{decorator}")
+        lines.append(f"{indent}@overload")
+        lines.append(f"{indent}def {member.name}{signature}: ...")
+    if decorator:
+        lines.append(f"{indent}{decorator}")
+    lines.extend(_def_lines("", member.name, member.signature, member.doc, indent))
+    return lines
+
+
+def emit_class(cls: StubClass) -> List[str]:
+    """Lines for one class, without a trailing blank line."""
+    base_str = f"({', '.join(cls.bases)})" if cls.bases else ""
+    lines = [f"class {cls.name}{base_str}:"]
+    if cls.doc:
+        lines.extend(_docstring_lines(cls.doc, INDENT, "'''"))
+
+    def separate():
+        if lines[-1].strip():
+            lines.append("")
+
+    for section in cls.sections:
+        if section.comment:
+            separate()
+            lines.append(f"{INDENT}{section.comment}")
+        for member in section.members:
+            if member.doc and lines[-1].strip() and not lines[-1].strip().startswith("#"):
+                lines.append("")
+            lines.extend(emit_member(member))
+            if member.doc:
+                lines.append("")
+
+    if cls.notes:
+        separate()
+        lines.extend(f"{INDENT}{note}" for note in cls.notes)
+
+    if not any(section.members for section in cls.sections):
+        lines.append(f"{INDENT}...")
+
+    return lines
+
+
+def emit_module(module: StubModule, fingerprint: str = "") -> str:
+    """Serialize a whole module stub, headed by fingerprint if given."""
+    lines = [
+        fingerprint,
+        '"""',
+        f'Type stubs for {module.name}',
+        module.description,
+        '"""',
+        *module.imports,
+        '',
+    ]
+
+    if module.submodules:
+        for sub in sorted(module.submodules):
+            lines.append(f"from . import {sub}")
+        lines.append("")
+
+    for name in sorted(module.classes):
+        lines.extend(emit_class(module.classes[name]))
+        if lines[-1]:
+            lines.append("")
+
+    return canonical_text(lines)
+
+
+def stub_path(output_dir: Path, module_name: str) -> Path:
+    """Path of the __init__.pyi for a module, relative to the aspose.pydrawing output_dir."""
+    return output_dir / Path(*module_name.split(".")[2:]) / "__init__.pyi"
+
+
+def namespace_stub_path(output_root: Path, module_name: str) -> Path:
+    """Path of the __init__.pyi for any module, relative to the generated_stubs root."""
+    return output_root / Path(*module_name.split(".")) / "__init__.pyi"
+
+
+def write_modules(modules: Dict[str, StubModule], output_dir: Path, fingerprint: str = "") -> List[Path]:
+    """
+    Emit every module stub, headed by fingerprint, and write those whose
+    content changed, then refresh the stub manifest. Returns the written paths.
+    """
+    written = []
+    for module_name, module in modules.items():
+        path = stub_path(output_dir, module_name)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        stub = emit_module(module, fingerprint)
+        if write_if_changed(path, stub):
+            written.append(path)
+            print(f"Written: {path.relative_to(output_dir)} ({len(stub.splitlines())} lines)")
+        else:
+            print(f"Unchanged: {path.relative_to(output_dir)}")
+    write_manifest(output_dir)
+    write_symbol_table(output_dir)
+    return written
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Regenerate the pydrawing stubs in a single process.
+
+Runs every stub stage against the in-memory model and writes each output
+file exactly once at the end:
+
+    names      name-only modules (generate_pydrawing_stubs_v2)
+    enhance    introspected member info (enhance_stubs)
+    rectangle  hand-written Rectangle/RectangleF (rectangle_stubs)
+
+With --docs, links to the docs pages about each class and member are then
+joined into the docstrings (docs_xref.py). The cross-reference is built by
+docs_refresh.py from the locally extracted docs, so joining it is never
+implicit: the committed stubs must not depend on what happens to be
+extracted.
+
+With --snapshot, a run that introspects also saves an API snapshot of
+the installed aspose-slides version (see api_snapshots.py). That
+introspects the whole namespace a second time, reusing the cache where it
+can, so it is not done by default.
+
+Usage:
+    python stub_pipeline.py
+    python stub_pipeline.py --all --jobs 8
+    python stub_pipeline.py --until enhance
+    python stub_pipeline.py --docs
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import enhance_stubs
+import rectangle_stubs
+from api_snapshots import record_snapshot
+from docs_xref import DocsXref, apply_docs_xref
+from generate_pydrawing_stubs_v2 import build_pydrawing_modules
+from instrumentation import PROFILER
+from introspect_cache import DEFAULT_CACHE_DIR, IntrospectionCache
+from stub_fingerprint import stub_fingerprint
+from stub_model import write_modules
+
+STAGES = ["names", "enhance", "rectangle"]
+
+OUTPUT_DIR = Path(__file__).parent / "generated_stubs" / "aspose" / "pydrawing"
+
+
+def run_pipeline(
+    output_dir: Path = OUTPUT_DIR,
+    until: str = "rectangle",
+    all_classes: bool = False,
+    jobs: int = 1,
+    cache=None,
+    docs: DocsXref = None
+) -> dict:
+    """
+    Run the stages up to and including until, join the docs cross-reference
+    docs if given, then write the stubs, headed by the fingerprint of their
+    inputs (see stub_fingerprint.py).
+
+    Returns {stage: seconds}, including "docs" if joined and the final "write".
+    """
+    timings = {}
+    stages = STAGES[:STAGES.index(until) + 1]
+
+    def timed(stage, func, *args):
+        start = time.perf_counter()
+        with PROFILER.span(f"stage:{stage}"):
+            result = func(*args)
+        timings[stage] = time.perf_counter() - start
+        return result
+
+    def enhance(modules):
+        targets = enhance_stubs.enhancement_targets(all_classes)
+        for (module_name, class_names), listings in zip(
+            targets, enhance_stubs.introspect_targets(targets, jobs, cache)
+        ):
+            enhance_stubs.enhance_module(modules[module_name], class_names, listings)
+
+    def join_docs(modules, xref):
+        for module in modules.values():
+            apply_docs_xref(module, xref)
+
+    modules = timed("names", build_pydrawing_modules)
+    if "enhance" in stages:
+        timed("enhance", enhance, modules)
+    if "rectangle" in stages:
+        timed("rectangle", rectangle_stubs.apply_rectangle_stubs, modules["aspose.pydrawing"])
+    if docs is not None:
+        timed("docs", join_docs, modules, docs)
+    fingerprint = stub_fingerprint(docs=docs.digest if docs is not None else None)
+    timed("write", write_modules, modules, output_dir, fingerprint)
+
+    return timings
+
+
+def print_timings(timings: dict):
+    print()
+    print("Stage timings:")
+    for stage, seconds in timings.items():
+        print(f"  {stage:<10} {seconds:8.3f}s")
+    print(f"  {'total':<10} {sum(timings.values()):8.3f}s")
+
+
+def main(until: str = "rectangle"):
+    parser = argparse.ArgumentParser(description="Regenerate the pydrawing stubs in one process.")
+    parser.add_argument(
+        "--until",
+        choices=STAGES,
+        default=until,
+        help=f"Last stage to run (default: {until})"
+    )
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        help="Introspect every known pydrawing class, not just the key classes"
+    )
+    parser.add_argument(
+        "--docs",
+        action="store_true",
+        help="Join links to the docs pages into the docstrings (needs python docs_refresh.py first)"
+    )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=1,
+        help="Number of introspection worker processes (default: 1)"
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=str(DEFAULT_CACHE_DIR),
+        help=f"Introspection cache directory (default: {DEFAULT_CACHE_DIR})"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always introspect, ignoring and not updating the cache"
+    )
+    parser.add_argument(
+        "--snapshot",
+        action="store_true",
+        help="Also save the API snapshot of the installed aspose-slides (see api_snapshots.py)"
+    )
+    parser.add_argument(
+        "--profile",
+        metavar="REPORT_JSON",
+        help="Write a JSON timing report (and a .collapsed flamegraph file next to it)"
+    )
+    args = parser.parse_args()
+
+    if args.profile:
+        PROFILER.enable()
+    docs = None
+    if args.docs:
+        docs = DocsXref()
+        if not docs.exists():
+            print(f"ERROR: {docs.path} not found\nRun: python docs_refresh.py", file=sys.stderr)
+            sys.exit(2)
+    cache = None if args.no_cache else IntrospectionCache(Path(args.cache_dir))
+    timings = run_pipeline(OUTPUT_DIR, args.until, args.all, args.jobs, cache, docs)
+    if cache is not None and args.until != "names":
+        print(f"Cache: {cache.hits} hits, {cache.misses} misses")
+    print_timings(timings)
+    print(f"\nStubs written to: {OUTPUT_DIR}")
+    if args.snapshot and args.until != "names":
+        record_snapshot(cache=cache, jobs=args.jobs)
+
+    if args.profile:
+        PROFILER.write_report(Path(args.profile))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""
+Compact binary symbol table of the generated stubs.
+
+The generators write stub_symbols.bin next to the stubs. It lists every
+module, class and member with its kind, signature and the file and line
+that declare it, so tools can resolve names like Rectangle.from_ltrb or
+drawing2d.Matrix without parsing .pyi files.
+
+The file is opened with mmap and searched in place. It holds a header,
+fixed-size records sorted by the UTF-8 bytes of the qualified name, and a
+blob of deduplicated strings:
+
+    header   magic, record count, offset of the string blob
+    record   name, signature and file as (offset, length) into the blob,
+             line, kind
+    strings  UTF-8
+
+An exact lookup is a binary search over the records. A prefix lookup is a
+binary search for the first match followed by a scan. Neither reads more
+than the records it visits.
+
+Usage:
+    python stub_symbols.py build
+    python stub_symbols.py lookup Rectangle.from_ltrb
+    python stub_symbols.py lookup --prefix drawing2d.Matrix
+"""
+import argparse
+import ast
+import json
+import mmap
+import struct
+import sys
+from pathlib import Path
+from typing import Iterator, List, NamedTuple, Optional
+
+from stub_io import write_bytes_atomic
+
+SYMBOLS_NAME = "stub_symbols.bin"
+STUB_DIR = Path(__file__).parent / "generated_stubs" / "aspose" / "pydrawing"
+ROOT_MODULE = "aspose.pydrawing"
+
+MAGIC = b"ASPSYM01"
+HEADER = struct.Struct("<8sII")  # magic, record count, string blob offset
+RECORD = struct.Struct("<IIIIHHHBx")  # name/sig/file offsets, line, name/sig/file lengths, kind
+
+KINDS = (
+    "module", "class", "function", "constant",
+    "method", "staticmethod", "classmethod", "property", "classvar", "attribute",
+)
+
+
+class Symbol(NamedTuple):
+    name: str
+    kind: str
+    signature: str
+    file: str
+    line: int
+
+
+def _function_kind(node) -> str:
+    for decorator in node.decorator_list:
+        if isinstance(decorator, ast.Name) and decorator.id in ("property", "staticmethod", "classmethod"):
+            return decorator.id
+        if isinstance(decorator, ast.Attribute) and decorator.attr in ("setter", "deleter"):
+            return "property"
+    return "method"
+
+
+def _signature(node) -> str:
+    returns = f" -> {ast.unparse(node.returns)}" if node.returns else ""
+    return f"({ast.unparse(node.args)}){returns}"
+
+
+def _body_symbols(body, prefix: str, file: str, in_class: bool) -> Iterator[Symbol]:
+    for node in body:
+        if isinstance(node, ast.ClassDef):
+            bases = ", ".join(ast.unparse(base) for base in node.bases)
+            qualified = f"{prefix}.{node.name}"
+            yield Symbol(qualified, "class", f"({bases})" if bases else "", file, node.lineno)
+            yield from _body_symbols(node.body, qualified, file, True)
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            kind = _function_kind(node) if in_class else "function"
+            yield Symbol(f"{prefix}.{node.name}", kind, _signature(node), file, node.lineno)
+        elif isinstance(node, ast.AnnAssign) and isinstance(node.target, ast.Name):
+            annotation = ast.unparse(node.annotation)
+            if not in_class:
+                kind = "constant"
+            elif annotation.startswith("ClassVar"):
+                kind = "classvar"
+            else:
+                kind = "attribute"
+            yield Symbol(f"{prefix}.{node.target.id}", kind, annotation, file, node.lineno)
+
+
+def collect_symbols(stub_dir: Path = STUB_DIR, root: str = ROOT_MODULE) -> List[Symbol]:
+    """Every symbol declared by the .pyi files under stub_dir, sorted by name, first declaration wins."""
+    symbols = {}
+    for path in sorted(stub_dir.rglob("*.pyi")):
+        rel = path.relative_to(stub_dir)
+        parts = rel.parent.parts if rel.name == "__init__.pyi" else rel.with_suffix("").parts
+        module_name = ".".join((root, *parts))
+        file = rel.as_posix()
+        tree = ast.parse(path.read_text(), filename=str(path))
+        symbols.setdefault(module_name, Symbol(module_name, "module", "", file, 1))
+        for symbol in _body_symbols(tree.body, module_name, file, False):
+            # Overloads and property setters repeat a name; keep the first declaration
+            symbols.setdefault(symbol.name, symbol)
+    return sorted(symbols.values(), key=lambda symbol: symbol.name.encode())
+
+
+def encode_symbols(symbols: List[Symbol]) -> bytes:
+    """Serialize symbols, which must be sorted by the UTF-8 bytes of their names."""
+    blob = bytearray()
+    offsets = {}
+
+    def intern(text: str):
+        data = text.encode()
+        if data not in offsets:
+            offsets[data] = len(blob)
+            blob.extend(data)
+        return offsets[data], len(data)
+
+    records = bytearray()
+    for symbol in symbols:
+        name_off, name_len = intern(symbol.name)
+        sig_off, sig_len = intern(symbol.signature)
+        file_off, file_len = intern(symbol.file)
+        records += RECORD.pack(
+            name_off, sig_off, file_off, symbol.line, name_len, sig_len, file_len, KINDS.index(symbol.kind)
+        )
+    header = HEADER.pack(MAGIC, len(symbols), HEADER.size + len(records))
+    return header + bytes(records) + bytes(blob)
+
+
+def write_symbol_table(stub_dir: Path = STUB_DIR, root: str = ROOT_MODULE) -> bool:
+    """Rebuild stub_symbols.bin under stub_dir; returns False if its content was unchanged."""
+    data = encode_symbols(collect_symbols(stub_dir, root))
+    path = stub_dir / SYMBOLS_NAME
+    try:
+        if path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+    write_bytes_atomic(path, data)
+    return True
+
+
+class SymbolTable:
+    """Read-only view of a symbol table file, searched in place through mmap."""
+
+    def __init__(self, path: Path = STUB_DIR / SYMBOLS_NAME, root: str = ROOT_MODULE):
+        self.root = root
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self._count, self._strings = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            self._map.close()
+            raise ValueError(f"{path} is not a symbol table")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self._map.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _name(self, index: int) -> bytes:
+        name_off, _, _, _, name_len, _, _, _ = RECORD.unpack_from(self._map, HEADER.size + index * RECORD.size)
+        start = self._strings + name_off
+        return self._map[start:start + name_len]
+
+    def _symbol(self, index: int) -> Symbol:
+        name_off, sig_off, file_off, line, name_len, sig_len, file_len, kind = RECORD.unpack_from(
+            self._map, HEADER.size + index * RECORD.size
+        )
+
+        def text(offset, length):
+            start = self._strings + offset
+            return self._map[start:start + length].decode()
+
+        return Symbol(text(name_off, name_len), KINDS[kind], text(sig_off, sig_len), text(file_off, file_len), line)
+
+    def _lower_bound(self, key: bytes) -> int:
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._name(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def get(self, name: str) -> Optional[Symbol]:
+        """The symbol with exactly this qualified name, or None."""
+        key = name.encode()
+        index = self._lower_bound(key)
+        if index < self._count and self._name(index) == key:
+            return self._symbol(index)
+        return None
+
+    def prefix(self, prefix: str, limit: int = None) -> Iterator[Symbol]:
+        """Symbols whose qualified name starts with prefix, in name order."""
+        key = prefix.encode()
+        index = self._lower_bound(key)
+        found = 0
+        while index < self._count and (limit is None or found < limit):
+            if not self._name(index).startswith(key):
+                return
+            yield self._symbol(index)
+            index += 1
+            found += 1
+
+    def _qualified(self, name: str) -> str:
+        return name if name == self.root or name.startswith(f"{self.root}.") else f"{self.root}.{name}"
+
+    def resolve(self, name: str) -> Optional[Symbol]:
+        """Like get(), also accepting names relative to the root module (e.g. drawing2d.Matrix)."""
+        return self.get(name) or self.get(self._qualified(name))
+
+    def complete(self, prefix: str, limit: int = None) -> Iterator[Symbol]:
+        """Like prefix(), also accepting prefixes relative to the root module."""
+        return self.prefix(self._qualified(prefix), limit)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build or query the symbol table of the generated stubs.")
+    parser.add_argument(
+        "--stub-dir",
+        default=str(STUB_DIR),
+        help="Directory of the stubs and their symbol table (default: generated_stubs/aspose/pydrawing)"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("build", help=f"Rebuild {SYMBOLS_NAME} from the stubs")
+
+    lookup = commands.add_parser("lookup", help="Look up symbols by qualified or root-relative name")
+    lookup.add_argument("names", nargs="+", help="Names such as Rectangle.from_ltrb")
+    lookup.add_argument(
+        "--prefix",
+        action="store_true",
+        help="List every symbol starting with each name"
+    )
+    lookup.add_argument(
+        "--limit",
+        type=int,
+        default=50,
+        help="With --prefix, at most this many symbols per name (default: 50)"
+    )
+    lookup.add_argument(
+        "--json",
+        action="store_true",
+        help="Print JSON objects, one per line"
+    )
+    args = parser.parse_args()
+
+    stub_dir = Path(args.stub_dir)
+    if args.command == "build":
+        changed = write_symbol_table(stub_dir)
+        print(f"{'Written' if changed else 'Unchanged'}: {stub_dir / SYMBOLS_NAME}")
+        return
+
+    try:
+        table = SymbolTable(stub_dir / SYMBOLS_NAME)
+    except (OSError, ValueError) as e:
+        print(f"ERROR: {e}\nRun: python stub_symbols.py build", file=sys.stderr)
+        sys.exit(2)
+
+    missing = 0
+    with table:
+        for name in args.names:
+            found = list(table.complete(name, args.limit)) if args.prefix else [table.resolve(name)]
+            found = [symbol for symbol in found if symbol is not None]
+            if not found:
+                print(f"{name}: not found", file=sys.stderr)
+                missing += 1
+            for symbol in found:
+                if args.json:
+                    print(json.dumps(symbol._asdict()))
+                else:
+                    separator = ": " if symbol.kind in ("constant", "classvar", "attribute") else ""
+                    declaration = f"{symbol.name}{separator}{symbol.signature}"
+                    print(f"{declaration}  [{symbol.kind}]  {symbol.file}:{symbol.line}")
+    sys.exit(1 if missing else 0)
+
+
+if __name__ == "__main__":
+    main()